@@ -76,5 +76,9 @@ async def run_migrations_online() -> None:
 
 if context.is_offline_mode():
     run_migrations_offline()
+elif config.attributes.get("connection") is not None:
+    # Connection handed in by `python -m app.migrate`, which holds the
+    # migration advisory lock on it
+    do_run_migrations(config.attributes["connection"])
 else:
-    asyncio.run(run_migrations_online())
\ No newline at end of file
+    asyncio.run(run_migrations_online())
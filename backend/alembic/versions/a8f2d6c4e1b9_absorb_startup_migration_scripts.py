@@ -0,0 +1,89 @@
+"""absorb startup migration scripts
+
+Replaces migrate.py, remove_unique_constraint.py and
+run_carrier_rate_migration.py, which used to run on every container start.
+Every statement is idempotent, because databases built by those scripts
+are stamped at the initial schema and then upgraded through every
+revision, this one included.
+
+Revision ID: a8f2d6c4e1b9
+Revises: c3a9f1e6d2b8
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8f2d6c4e1b9'
+down_revision = 'c3a9f1e6d2b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # migrate.py
+    op.execute("ALTER TABLE loads ADD COLUMN IF NOT EXISTS pod_url VARCHAR")
+    op.execute("ALTER TABLE loads ADD COLUMN IF NOT EXISTS ratecon_url VARCHAR")
+
+    # remove_unique_constraint.py: load numbers may repeat or be missing
+    op.execute("ALTER TABLE loads DROP CONSTRAINT IF EXISTS loads_load_number_key")
+    op.execute("DROP INDEX IF EXISTS ix_loads_load_number")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_loads_load_number ON loads (load_number)")
+    op.execute("ALTER TABLE loads ALTER COLUMN load_number DROP NOT NULL")
+
+    # run_carrier_rate_migration.py
+    op.execute("""
+        ALTER TABLE loads
+        ADD COLUMN IF NOT EXISTS carrier_rate NUMERIC(10, 2),
+        ADD COLUMN IF NOT EXISTS pickup_notes TEXT,
+        ADD COLUMN IF NOT EXISTS delivery_notes TEXT
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS expenses (
+            id SERIAL PRIMARY KEY,
+            date DATE NOT NULL,
+            category VARCHAR NOT NULL,
+            description TEXT,
+            amount NUMERIC(10, 2) NOT NULL,
+            vendor VARCHAR,
+            payment_method VARCHAR,
+            receipt_number VARCHAR,
+            company_id INTEGER NOT NULL REFERENCES companies(id),
+            driver_id INTEGER REFERENCES drivers(id),
+            truck_id INTEGER REFERENCES trucks(id),
+            load_id INTEGER REFERENCES loads(id),
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+            updated_at TIMESTAMP WITH TIME ZONE
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_expenses_id ON expenses (id)")
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS fuel (
+            id SERIAL PRIMARY KEY,
+            date DATE NOT NULL,
+            location VARCHAR,
+            gallons NUMERIC(10, 2) NOT NULL,
+            price_per_gallon NUMERIC(10, 3),
+            total_amount NUMERIC(10, 2) NOT NULL,
+            odometer INTEGER,
+            notes TEXT,
+            company_id INTEGER NOT NULL REFERENCES companies(id),
+            driver_id INTEGER REFERENCES drivers(id),
+            truck_id INTEGER REFERENCES trucks(id),
+            load_id INTEGER REFERENCES loads(id),
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS idx_fuel_company_id ON fuel (company_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_fuel_driver_id ON fuel (driver_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_fuel_truck_id ON fuel (truck_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_fuel_date ON fuel (date)")
+
+
+def downgrade() -> None:
+    # The scripts this replaces were never reversible, and the tables may
+    # predate this revision on databases they built; leave the schema as is
+    pass
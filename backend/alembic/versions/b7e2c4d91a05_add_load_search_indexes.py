@@ -0,0 +1,40 @@
+"""add load search indexes
+
+Revision ID: b7e2c4d91a05
+Revises: 3f4b24be8ae3
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2c4d91a05'
+down_revision = '3f4b24be8ae3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build concurrently so the loads table stays writable during deploys
+    with op.get_context().autocommit_block():
+        op.create_index('ix_loads_company_id_status', 'loads', ['company_id', 'status'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_loads_company_id_pickup_date', 'loads', ['company_id', 'pickup_date'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_loads_company_id_driver_id', 'loads', ['company_id', 'driver_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(
+            'ix_loads_company_id_load_number_prefix',
+            'loads',
+            ['company_id', 'load_number'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_ops={'load_number': 'varchar_pattern_ops'},
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_loads_company_id_load_number_prefix', table_name='loads', postgresql_concurrently=True)
+        op.drop_index('ix_loads_company_id_driver_id', table_name='loads', postgresql_concurrently=True)
+        op.drop_index('ix_loads_company_id_pickup_date', table_name='loads', postgresql_concurrently=True)
+        op.drop_index('ix_loads_company_id_status', table_name='loads', postgresql_concurrently=True)
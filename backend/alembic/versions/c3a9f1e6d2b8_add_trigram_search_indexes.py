@@ -0,0 +1,127 @@
+"""add trigram search indexes
+
+Also creates the shippers, receivers and ratecons tables and the
+customers.mc column when they are missing: the initial schema predates
+them, and on older databases they were made by startup scripts instead.
+
+Revision ID: c3a9f1e6d2b8
+Revises: b7e2c4d91a05
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a9f1e6d2b8'
+down_revision = 'b7e2c4d91a05'
+branch_labels = None
+depends_on = None
+
+
+# Keep in sync with SEARCH_TARGETS in app/api/v1/endpoints/search.py:
+# the indexed expression must match the queried one exactly.
+SEARCH_DOCUMENTS = {
+    'loads': ['load_number', 'reference_number', 'pickup_location', 'delivery_location', 'description'],
+    'customers': ['name', 'mc', 'contact_person', 'email', 'phone', 'city', 'state'],
+    'shippers': ['name', 'city', 'state', 'contact_person', 'product_type'],
+    'receivers': ['name', 'city', 'state', 'contact_person', 'product_type'],
+    'ratecons': ['ratecon_number', 'load_number', 'broker_name', 'pickup_location', 'delivery_location', 'commodity'],
+    'lanes': ['broker', 'pickup_location', 'delivery_location'],
+}
+
+
+def _document(columns):
+    return " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+
+
+def _create_search_tables() -> None:
+    # Shippers, receivers and customer MC numbers
+    op.execute("ALTER TABLE customers ADD COLUMN IF NOT EXISTS mc VARCHAR")
+    for table in ('shippers', 'receivers'):
+        op.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id SERIAL PRIMARY KEY,
+                name VARCHAR NOT NULL,
+                address TEXT,
+                city VARCHAR,
+                state VARCHAR,
+                zip_code VARCHAR,
+                phone VARCHAR,
+                contact_person VARCHAR,
+                email VARCHAR,
+                product_type VARCHAR,
+                average_wait_time VARCHAR,
+                appointment_type VARCHAR,
+                notes TEXT,
+                company_id INTEGER NOT NULL REFERENCES companies(id),
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                updated_at TIMESTAMP WITH TIME ZONE
+            )
+        """)
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_id ON {table} (id)")
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS ratecons (
+            id SERIAL PRIMARY KEY,
+            ratecon_number VARCHAR NOT NULL,
+            load_number VARCHAR,
+            broker_name VARCHAR NOT NULL,
+            carrier_name VARCHAR,
+            date_issued DATE,
+            pickup_date DATE,
+            delivery_date DATE,
+            pickup_location TEXT,
+            delivery_location TEXT,
+            total_rate DOUBLE PRECISION,
+            fuel_surcharge DOUBLE PRECISION,
+            detention_rate DOUBLE PRECISION,
+            layover_rate DOUBLE PRECISION,
+            commodity VARCHAR,
+            weight DOUBLE PRECISION,
+            pieces INTEGER,
+            equipment_type VARCHAR,
+            broker_contact VARCHAR,
+            broker_phone VARCHAR,
+            broker_email VARCHAR,
+            payment_terms VARCHAR,
+            special_instructions TEXT,
+            notes TEXT,
+            status VARCHAR DEFAULT 'pending',
+            document_url VARCHAR,
+            company_id INTEGER NOT NULL REFERENCES companies(id),
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+            updated_at TIMESTAMP WITH TIME ZONE
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_ratecons_id ON ratecons (id)")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_ratecons_ratecon_number ON ratecons (ratecon_number)")
+
+
+
+def upgrade() -> None:
+    _create_search_tables()
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for table, columns in SEARCH_DOCUMENTS.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_trgm "
+                f"ON {table} USING gin (({_document(columns)}) gin_trgm_ops)"
+            )
+        # Tenant filter applied alongside every search
+        for table in ('shippers', 'receivers', 'ratecons', 'lanes', 'customers'):
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_company_id "
+                f"ON {table} (company_id)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ('shippers', 'receivers', 'ratecons', 'lanes', 'customers'):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_company_id")
+        for table in SEARCH_DOCUMENTS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_trgm")
+    # The tables may predate this revision, so they are left in place
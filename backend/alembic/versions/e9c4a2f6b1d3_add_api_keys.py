@@ -0,0 +1,47 @@
+"""add api keys
+
+Revision ID: e9c4a2f6b1d3
+Revises: d5e1b8a3f7c2
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9c4a2f6b1d3'
+down_revision = 'd5e1b8a3f7c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'api_keys',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('prefix', sa.String(), nullable=False),
+        sa.Column('secret_hash', sa.String(), nullable=False),
+        sa.Column('scopes', sa.JSON(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_used_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_api_keys_id'), 'api_keys', ['id'], unique=False)
+    op.create_index(op.f('ix_api_keys_prefix'), 'api_keys', ['prefix'], unique=True)
+    op.create_index(op.f('ix_api_keys_company_id'), 'api_keys', ['company_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_api_keys_company_id'), table_name='api_keys')
+    op.drop_index(op.f('ix_api_keys_prefix'), table_name='api_keys')
+    op.drop_index(op.f('ix_api_keys_id'), table_name='api_keys')
+    op.drop_table('api_keys')
@@ -1,10 +1,11 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, companies, customers, trucks, drivers, loads, stops, invoices, payroll, lanes, expenses, uploads, shippers, receivers, notifications, ratecons, fuel, migrate
+from app.api.v1.endpoints import auth, users, companies, customers, trucks, drivers, loads, stops, invoices, payroll, lanes, expenses, uploads, shippers, receivers, notifications, ratecons, fuel, migrate, dashboard, reports, search, api_keys, exports
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(api_keys.router, prefix="/api-keys", tags=["api-keys"])
 api_router.include_router(companies.router, prefix="/companies", tags=["companies"])
 api_router.include_router(customers.router, prefix="/customers", tags=["customers"])
 api_router.include_router(trucks.router, prefix="/trucks", tags=["trucks"])
@@ -21,4 +22,8 @@ api_router.include_router(shippers.router, prefix="/shippers", tags=["shippers"]
 api_router.include_router(receivers.router, prefix="/receivers", tags=["receivers"])
 api_router.include_router(notifications.router, prefix="/notifications", tags=["notifications"])
 api_router.include_router(ratecons.router, prefix="/ratecons", tags=["ratecons"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
 api_router.include_router(migrate.router, prefix="/migrate", tags=["migrations"])
\ No newline at end of file
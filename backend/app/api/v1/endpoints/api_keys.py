@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.database import get_db
+from app.core.api_keys import api_key_service
+from app.core.security import get_current_active_user
+from app.models.api_key import ApiKey
+from app.models.user import User, UserRole
+from app.schemas.api_key import ApiKeyCreate, ApiKeyCreated, ApiKeyResponse
+
+router = APIRouter()
+
+
+def require_key_admin(request: Request, current_user: User) -> None:
+    """Only company admins, signed in as themselves, may manage API keys"""
+    if getattr(request.state, "api_key_id", None) is not None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="API keys cannot manage API keys"
+        )
+    role = current_user.role if isinstance(current_user.role, str) else current_user.role.value
+    if role not in (UserRole.COMPANY_ADMIN.value, UserRole.SUPER_ADMIN.value):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can manage API keys"
+        )
+
+
+@router.get("/", response_model=List[ApiKeyResponse])
+@router.get("", response_model=List[ApiKeyResponse])
+async def get_api_keys(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """List the company's API keys (secrets are never returned)"""
+    require_key_admin(request, current_user)
+    query = (
+        select(ApiKey)
+        .where(ApiKey.company_id == current_user.company_id)
+        .order_by(ApiKey.id)
+    )
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+@router.post("/", response_model=ApiKeyCreated, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=ApiKeyCreated, status_code=status.HTTP_201_CREATED)
+async def create_api_key(
+    key_data: ApiKeyCreate,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Create an API key for an integration
+
+    The key acts as the admin who created it, limited to `scopes`. The
+    full key is only returned here.
+    """
+    require_key_admin(request, current_user)
+    key, prefix, secret_hash = api_key_service.generate()
+    expires_at = None
+    if key_data.expires_in_days:
+        expires_at = datetime.now(timezone.utc) + timedelta(days=key_data.expires_in_days)
+
+    api_key = ApiKey(
+        name=key_data.name,
+        prefix=prefix,
+        secret_hash=secret_hash,
+        scopes=key_data.scopes,
+        expires_at=expires_at,
+        company_id=current_user.company_id,
+        user_id=current_user.id
+    )
+    db.add(api_key)
+    await db.commit()
+    await db.refresh(api_key)
+
+    return ApiKeyCreated(
+        **ApiKeyResponse.model_validate(api_key).model_dump(),
+        key=key
+    )
+
+
+@router.delete("/{api_key_id}")
+async def revoke_api_key(
+    api_key_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Revoke an API key; other workers stop accepting it within API_KEY_CACHE_TTL_SECONDS"""
+    require_key_admin(request, current_user)
+    query = select(ApiKey).where(
+        ApiKey.id == api_key_id,
+        ApiKey.company_id == current_user.company_id
+    )
+    result = await db.execute(query)
+    api_key = result.scalar_one_or_none()
+    if not api_key:
+        raise HTTPException(status_code=404, detail="API key not found")
+
+    if api_key.revoked_at is None:
+        api_key.revoked_at = datetime.now(timezone.utc)
+        await db.commit()
+    api_key_service.invalidate(api_key.id)
+    return {"message": "API key revoked"}
@@ -16,9 +16,12 @@ from app.schemas.auth import (
     EmailVerificationResponse,
     LoginRequest,
     LoginResponse,
+    RefreshRequest,
+    TokenResponse,
     UserResponse
 )
-from app.services.email import email_service
+from app.services.notification_jobs import enqueue_email
+from app.services.refresh_tokens import refresh_token_service
 import secrets
 
 router = APIRouter()
@@ -88,7 +91,7 @@ async def register_company(
     user = User(
         username=registration.username,
         email=registration.email,
-        hashed_password=get_password_hash(registration.password),
+        hashed_password=await get_password_hash(registration.password),
         first_name=registration.first_name,
         last_name=registration.last_name,
         role=UserRole.COMPANY_ADMIN.value,
@@ -108,8 +111,10 @@ async def register_company(
     db.add(verification_token)
     await db.commit()
 
-    # Send verification email
-    await email_service.send_verification_email(
+    # Send verification email in the background
+    await enqueue_email(
+        "verification",
+        company_id=company.id,
         to_email=user.email,
         username=user.username,
         verification_token=verification_token.token
@@ -171,8 +176,10 @@ async def verify_email(
 
     await db.commit()
 
-    # Send welcome email
-    await email_service.send_welcome_email(
+    # Send welcome email in the background
+    await enqueue_email(
+        "welcome",
+        company_id=user.company_id,
         to_email=user.email,
         username=user.username,
         company_name=user.company.name
@@ -208,7 +215,42 @@ async def login(
     access_token = create_access_token(
         data={"sub": user.email}, expires_delta=access_token_expires
     )
-    return {"access_token": access_token, "token_type": "bearer"}
+    refresh_token = await refresh_token_service.issue(db, user)
+    return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+    refresh_request: RefreshRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Exchange a refresh token for a new access token and refresh token
+
+    Each refresh token works once. Presenting one again revokes every
+    token issued since that login.
+    """
+    user, refresh_token = await refresh_token_service.rotate(db, refresh_request.refresh_token)
+
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={"sub": user.email}, expires_delta=access_token_expires
+    )
+    return TokenResponse(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer"
+    )
+
+
+@router.post("/logout")
+async def logout(
+    refresh_request: RefreshRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Revoke the refresh token and every token issued from the same login"""
+    await refresh_token_service.revoke(db, refresh_request.refresh_token)
+    return {"message": "Logged out"}
 
 
 @router.post("/login-json", response_model=LoginResponse)
@@ -254,6 +296,7 @@ async def login_json(
 
     return LoginResponse(
         access_token=access_token,
+        refresh_token=await refresh_token_service.issue(db, user),
         token_type="bearer",
         user=user_response
     )
@@ -290,17 +333,13 @@ async def resend_verification_email(
     db.add(verification_token)
     await db.commit()
 
-    # Send verification email
-    await email_service.send_verification_email(
+    # Send verification email in the background
+    await enqueue_email(
+        "verification",
+        company_id=user.company_id,
         to_email=user.email,
         username=user.username,
         verification_token=verification_token.token
     )
 
     return {"message": "If the email exists, a verification link has been sent"}
-
-
-@router.post("/refresh")
-async def refresh_token():
-    # TODO: Implement refresh token logic
-    return {"message": "Refresh token endpoint - to be implemented"}
\ No newline at end of file
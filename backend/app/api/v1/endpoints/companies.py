@@ -5,6 +5,7 @@ from app.database import get_db
 from app.core.security import get_current_active_user
 from app.models.user import User, UserRole
 from app.models.company import Company
+from app.services.cache import tenant_cache
 from pydantic import BaseModel
 from typing import Optional
 
@@ -47,17 +48,20 @@ async def get_my_company(
     db: AsyncSession = Depends(get_db)
 ):
     """Get current user's company info"""
-    query = select(Company).where(Company.id == current_user.company_id)
-    result = await db.execute(query)
-    company = result.scalar_one_or_none()
+    async def load_company():
+        query = select(Company).where(Company.id == current_user.company_id)
+        result = await db.execute(query)
+        company = result.scalar_one_or_none()
 
-    if not company:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Company not found"
-        )
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Company not found"
+            )
 
-    return company
+        return CompanyResponse.model_validate(company).model_dump(mode="json")
+
+    return await tenant_cache.get_or_load("company", current_user.company_id, None, load_company)
 
 
 @router.put("/me", response_model=CompanyResponse)
@@ -117,6 +121,7 @@ async def update_my_company(
 
     await db.commit()
     await db.refresh(company)
+    await tenant_cache.invalidate("company", current_user.company_id)
 
     return company
 
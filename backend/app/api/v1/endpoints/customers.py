@@ -1,11 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.customer import Customer
 from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE
+from app.services.cache import cached_page, tenant_cache
 from app.models.user import User
 
 router = APIRouter()
@@ -14,15 +16,18 @@ router = APIRouter()
 @router.get("/", response_model=List[CustomerResponse])
 @router.get("", response_model=List[CustomerResponse])
 async def get_customers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Customer).where(Customer.company_id == current_user.company_id).offset(skip).limit(limit)
-    result = await db.execute(query)
-    customers = result.scalars().all()
-    return customers
+    return await cached_page(
+        "customers", current_user.company_id, db,
+        select(Customer).where(Customer.company_id == current_user.company_id),
+        CustomerResponse, [Customer.id], response, cursor, skip, limit
+    )
 
 
 @router.post("/", response_model=CustomerResponse)
@@ -35,6 +40,7 @@ async def create_customer(
     db_customer = Customer(**customer.dict(), company_id=current_user.company_id)
     db.add(db_customer)
     await db.commit()
+    await tenant_cache.invalidate("customers", current_user.company_id)
     await db.refresh(db_customer)
     return db_customer
 
@@ -76,6 +82,7 @@ async def update_customer(
         setattr(customer, field, value)
 
     await db.commit()
+    await tenant_cache.invalidate("customers", current_user.company_id)
     await db.refresh(customer)
     return customer
 
@@ -97,4 +104,5 @@ async def delete_customer(
 
     await db.delete(customer)
     await db.commit()
+    await tenant_cache.invalidate("customers", current_user.company_id)
     return {"message": "Customer deleted successfully"}
\ No newline at end of file
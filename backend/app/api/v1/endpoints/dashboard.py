@@ -0,0 +1,98 @@
+"""
+Dashboard API endpoints
+"""
+from datetime import date, datetime, timedelta
+from typing import Optional
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, cast, DateTime
+from app.database import get_db
+from app.models.load import Load
+from app.models.driver import Driver
+from app.models.truck import Truck
+from app.models.customer import Customer
+from app.schemas.dashboard import DashboardSummary, RevenueBucket
+from app.core.security import get_current_active_user
+from app.models.user import User
+
+router = APIRouter()
+
+
+def _revenue_bucket(load_date, start: datetime, end: datetime):
+    """SUM/COUNT aggregates for loads whose date falls in [start, end)"""
+    in_bucket = (load_date >= start) & (load_date < end)
+    return (
+        func.coalesce(func.sum(Load.rate).filter(in_bucket), 0),
+        func.count(Load.id).filter(in_bucket),
+    )
+
+
+@router.get("/summary", response_model=DashboardSummary)
+async def get_dashboard_summary(
+    today: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get revenue totals and entity counts for the dashboard
+
+    Revenue is bucketed by pickup_date (falling back to created_at) for
+    today, the current month and the current year. Pass `today` to use
+    the client's local date instead of the server's.
+    """
+    company_id = current_user.company_id
+    today = today or date.today()
+
+    day_start = datetime.combine(today, datetime.min.time())
+    day_end = day_start + timedelta(days=1)
+    month_start = day_start.replace(day=1)
+    month_end = (month_start + timedelta(days=32)).replace(day=1)
+    year_start = day_start.replace(month=1, day=1)
+    year_end = year_start.replace(year=year_start.year + 1)
+
+    # Same date the dashboard has always used: pickup date, else creation time
+    load_date = func.coalesce(Load.pickup_date, cast(Load.created_at, DateTime))
+
+    def count_for(model):
+        return (
+            select(func.count(model.id))
+            .where(model.company_id == company_id)
+            .scalar_subquery()
+        )
+
+    totals_query = (
+        select(
+            *_revenue_bucket(load_date, day_start, day_end),
+            *_revenue_bucket(load_date, month_start, month_end),
+            *_revenue_bucket(load_date, year_start, year_end),
+            count_for(Driver),
+            count_for(Truck),
+            count_for(Customer),
+        )
+        .select_from(Load)
+        .where(Load.company_id == company_id)
+    )
+    totals = (await db.execute(totals_query)).one()
+
+    status_query = (
+        select(Load.status, func.count(Load.id))
+        .where(Load.company_id == company_id)
+        .group_by(Load.status)
+    )
+    status_result = await db.execute(status_query)
+    loads_by_status = {
+        (status.value if status is not None else "unknown"): count
+        for status, count in status_result.all()
+    }
+
+    return DashboardSummary(
+        as_of=today,
+        today=RevenueBucket(revenue=totals[0], loads=totals[1]),
+        month=RevenueBucket(revenue=totals[2], loads=totals[3]),
+        year=RevenueBucket(revenue=totals[4], loads=totals[5]),
+        total_loads=sum(loads_by_status.values()),
+        loads_by_status=loads_by_status,
+        total_drivers=totals[6],
+        total_trucks=totals[7],
+        total_customers=totals[8],
+    )
@@ -1,11 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.driver import Driver
 from app.schemas.driver import DriverCreate, DriverUpdate, DriverResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE
+from app.services.cache import cached_page, tenant_cache
 from app.models.user import User
 
 router = APIRouter()
@@ -14,15 +16,18 @@ router = APIRouter()
 @router.get("/", response_model=List[DriverResponse])
 @router.get("", response_model=List[DriverResponse])
 async def get_drivers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Driver).where(Driver.company_id == current_user.company_id).offset(skip).limit(limit)
-    result = await db.execute(query)
-    drivers = result.scalars().all()
-    return drivers
+    return await cached_page(
+        "drivers", current_user.company_id, db,
+        select(Driver).where(Driver.company_id == current_user.company_id),
+        DriverResponse, [Driver.id], response, cursor, skip, limit
+    )
 
 
 @router.post("/", response_model=DriverResponse)
@@ -35,6 +40,7 @@ async def create_driver(
     db_driver = Driver(**driver.dict(), company_id=current_user.company_id)
     db.add(db_driver)
     await db.commit()
+    await tenant_cache.invalidate("drivers", current_user.company_id)
     await db.refresh(db_driver)
     return db_driver
 
@@ -76,6 +82,7 @@ async def update_driver(
         setattr(driver, field, value)
 
     await db.commit()
+    await tenant_cache.invalidate("drivers", current_user.company_id)
     await db.refresh(driver)
     return driver
 
@@ -110,4 +117,5 @@ async def delete_driver(
 
     await db.delete(driver)
     await db.commit()
+    await tenant_cache.invalidate("drivers", current_user.company_id)
     return {"message": "Driver deleted successfully"}
\ No newline at end of file
@@ -1,5 +1,5 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -7,6 +7,7 @@ from app.database import get_db
 from app.models.expense import Expense
 from app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
 from app.models.user import User
 
 router = APIRouter()
@@ -14,8 +15,10 @@ router = APIRouter()
 
 @router.get("/", response_model=List[ExpenseResponse])
 async def get_expenses(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -23,11 +26,10 @@ async def get_expenses(
         select(Expense)
         .options(selectinload(Expense.driver), selectinload(Expense.truck))
         .where(Expense.company_id == current_user.company_id)
-        .offset(skip)
-        .limit(limit)
     )
+    query = paginate(query, [Expense.id], cursor, skip, limit)
     result = await db.execute(query)
-    expenses = result.scalars().all()
+    expenses = finalize_page(result.scalars().all(), [Expense.id], limit, response)
     return expenses
 
 
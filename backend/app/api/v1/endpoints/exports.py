@@ -0,0 +1,45 @@
+"""
+Accounting export endpoints
+"""
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.core.security import get_current_active_user
+from app.models.user import User
+from app.schemas.export import ExportFormat, ExportResource
+from app.services.exports import MEDIA_TYPES, export_stream
+
+router = APIRouter()
+
+
+@router.get("/{resource}")
+async def export_resource(
+    resource: ExportResource,
+    format: ExportFormat = Query(ExportFormat.csv),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Download every record of one kind as CSV or XLSX
+
+    Rows are filtered to [start_date, end_date], both inclusive, on the
+    record's own date (pickup date for loads, issue date for invoices,
+    week start for payroll) and streamed as they are read.
+    """
+    if start_date and end_date and end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+
+    period = "-".join(d.isoformat() for d in (start_date, end_date) if d) or "all"
+    filename = f"{resource.value}-{period}.{format.value}"
+    return StreamingResponse(
+        export_stream(resource, format, current_user.company_id, start_date, end_date),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+            # Keep reverse proxies from buffering the whole export
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -1,5 +1,5 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -7,6 +7,7 @@ from app.database import get_db
 from app.models.fuel import Fuel
 from app.schemas.fuel import FuelCreate, FuelUpdate, FuelResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
 from app.models.user import User
 
 router = APIRouter()
@@ -14,8 +15,10 @@ router = APIRouter()
 
 @router.get("/", response_model=List[FuelResponse])
 async def get_fuel_entries(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -23,12 +26,12 @@ async def get_fuel_entries(
         select(Fuel)
         .options(selectinload(Fuel.driver), selectinload(Fuel.truck))
         .where(Fuel.company_id == current_user.company_id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(Fuel.date.desc())
     )
+    # Newest fill-ups first; id breaks ties between entries on the same day
+    sort_keys = [Fuel.date, Fuel.id]
+    query = paginate(query, sort_keys, cursor, skip, limit, descending=True)
     result = await db.execute(query)
-    fuel_entries = result.scalars().all()
+    fuel_entries = finalize_page(result.scalars().all(), sort_keys, limit, response)
     return fuel_entries
 
 
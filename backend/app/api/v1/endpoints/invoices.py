@@ -1,5 +1,5 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
@@ -8,6 +8,7 @@ from app.models.invoice import Invoice
 from app.models.load import Load
 from app.schemas.invoice import InvoiceCreate, InvoiceUpdate, InvoiceResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
 from app.models.user import User
 
 router = APIRouter()
@@ -15,8 +16,10 @@ router = APIRouter()
 
 @router.get("/", response_model=List[InvoiceResponse])
 async def get_invoices(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -25,11 +28,10 @@ async def get_invoices(
         select(Invoice)
         .join(Load)
         .where(Load.company_id == current_user.company_id)
-        .offset(skip)
-        .limit(limit)
     )
+    query = paginate(query, [Invoice.id], cursor, skip, limit)
     result = await db.execute(query)
-    invoices = result.scalars().all()
+    invoices = finalize_page(result.scalars().all(), [Invoice.id], limit, response)
     return invoices
 
 
@@ -1,11 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.lane import Lane
 from app.schemas.lane import LaneCreate, LaneUpdate, LaneResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE
+from app.services.cache import cached_page, tenant_cache
 from app.models.user import User
 
 router = APIRouter()
@@ -13,15 +15,18 @@ router = APIRouter()
 
 @router.get("/", response_model=List[LaneResponse])
 async def get_lanes(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Lane).where(Lane.company_id == current_user.company_id).offset(skip).limit(limit)
-    result = await db.execute(query)
-    lanes = result.scalars().all()
-    return lanes
+    return await cached_page(
+        "lanes", current_user.company_id, db,
+        select(Lane).where(Lane.company_id == current_user.company_id),
+        LaneResponse, [Lane.id], response, cursor, skip, limit
+    )
 
 
 @router.post("/", response_model=LaneResponse)
@@ -33,6 +38,7 @@ async def create_lane(
     db_lane = Lane(**lane.dict(), company_id=current_user.company_id)
     db.add(db_lane)
     await db.commit()
+    await tenant_cache.invalidate("lanes", current_user.company_id)
     await db.refresh(db_lane)
     return db_lane
 
@@ -74,6 +80,7 @@ async def update_lane(
         setattr(lane, field, value)
 
     await db.commit()
+    await tenant_cache.invalidate("lanes", current_user.company_id)
     await db.refresh(lane)
     return lane
 
@@ -95,4 +102,5 @@ async def delete_lane(
 
     await db.delete(lane)
     await db.commit()
+    await tenant_cache.invalidate("lanes", current_user.company_id)
     return {"message": "Lane deleted successfully"}
@@ -1,39 +1,114 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from app.database import get_db
-from app.models.load import Load
-from app.schemas.load import LoadCreate, LoadUpdate, LoadResponse
+from app.models.load import Load, LoadStatus
+from app.models.driver import Driver
+from app.models.truck import Truck
+from app.schemas.load import (
+    LoadCreate, LoadUpdate, LoadResponse, LoadSortField, LoadImportResponse
+)
+from app.schemas.driver import DriverResponse
+from app.schemas.truck import TruckResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
+from app.core.responses import index_rows, list_response, schema_columns
 from app.models.user import User
+from app.services.load_import import import_loads
 
 router = APIRouter()
 
 
+def _naive(value: datetime) -> datetime:
+    # Load dates are TIMESTAMP WITHOUT TIME ZONE
+    return value.replace(tzinfo=None) if value.tzinfo else value
+
+
+async def _with_driver_and_truck(db: AsyncSession, rows: List[Any]) -> List[dict]:
+    """Load row mappings as dicts with `driver` and `truck` nested, one query per table"""
+    loads = [dict(row) for row in rows]
+    driver_ids = {load["driver_id"] for load in loads if load["driver_id"] is not None}
+    truck_ids = {load["truck_id"] for load in loads if load["truck_id"] is not None}
+
+    drivers, trucks = {}, {}
+    if driver_ids:
+        result = await db.execute(
+            select(*schema_columns(Driver, DriverResponse)).where(Driver.id.in_(driver_ids))
+        )
+        drivers = index_rows(result.mappings())
+    if truck_ids:
+        result = await db.execute(
+            select(*schema_columns(Truck, TruckResponse)).where(Truck.id.in_(truck_ids))
+        )
+        trucks = index_rows(result.mappings())
+
+    for load in loads:
+        load["driver"] = drivers.get(load["driver_id"])
+        load["truck"] = trucks.get(load["truck_id"])
+    return loads
+
+
 @router.get("/", response_model=List[LoadResponse])
 @router.get("", response_model=List[LoadResponse])
 async def get_loads(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status_filter: Optional[List[LoadStatus]] = Query(None, alias="status"),
+    driver_id: Optional[int] = None,
+    truck_id: Optional[int] = None,
+    customer_id: Optional[int] = None,
+    pickup_from: Optional[datetime] = None,
+    pickup_to: Optional[datetime] = None,
+    delivery_from: Optional[datetime] = None,
+    delivery_to: Optional[datetime] = None,
+    load_number: Optional[str] = None,
+    sort_by: LoadSortField = LoadSortField.id,
+    descending: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = (
-        select(Load)
-        .options(
-            selectinload(Load.driver),
-            selectinload(Load.truck),
-            selectinload(Load.customer)
-        )
-        .where(Load.company_id == current_user.company_id)
-        .offset(skip)
-        .limit(limit)
-    )
+    """
+    List loads, filtered and sorted in the database
+
+    `status` may be repeated to match several statuses. `load_number`
+    matches as a prefix. Date bounds are inclusive of `*_from` and
+    exclusive of `*_to`.
+    """
+    filters = [Load.company_id == current_user.company_id]
+    if status_filter:
+        filters.append(Load.status.in_(status_filter))
+    if driver_id is not None:
+        filters.append(Load.driver_id == driver_id)
+    if truck_id is not None:
+        filters.append(Load.truck_id == truck_id)
+    if customer_id is not None:
+        filters.append(Load.customer_id == customer_id)
+    if pickup_from:
+        filters.append(Load.pickup_date >= _naive(pickup_from))
+    if pickup_to:
+        filters.append(Load.pickup_date < _naive(pickup_to))
+    if delivery_from:
+        filters.append(Load.delivery_date >= _naive(delivery_from))
+    if delivery_to:
+        filters.append(Load.delivery_date < _naive(delivery_to))
+    if load_number:
+        filters.append(Load.load_number.startswith(load_number, autoescape=True))
+
+    # Plain columns rather than ORM instances: pages can be large, and the
+    # rows are already shaped like LoadResponse
+    query = select(*schema_columns(Load, LoadResponse)).where(*filters)
+    sort_keys = [getattr(Load, sort_by.value)]
+    if sort_by != LoadSortField.id:
+        sort_keys.append(Load.id)
+    query = paginate(query, sort_keys, cursor, skip, limit, descending=descending)
     result = await db.execute(query)
-    loads = result.scalars().all()
-    return loads
+    rows = finalize_page(result.mappings().all(), sort_keys, limit, response)
+    return list_response(await _with_driver_and_truck(db, rows), response)
 
 
 @router.post("/", response_model=LoadResponse)
@@ -57,6 +132,24 @@ async def create_load(
     return db_load
 
 
+@router.post("/import", response_model=LoadImportResponse)
+async def import_loads_file(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False, description="Validate every row without saving any"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Import loads from a CSV or XLSX file with one load per row
+
+    Columns are matched by header against the LoadCreate fields. Instead of
+    customer_id, driver_id or truck_id a row may name the customer, the
+    driver ("First Last") or the truck number. Valid rows are imported and
+    the rest are listed in `errors` by spreadsheet row.
+    """
+    return await import_loads(db, current_user.company_id, file, dry_run=dry_run)
+
+
 @router.get("/{load_id}", response_model=LoadResponse)
 async def get_load(
     load_id: int,
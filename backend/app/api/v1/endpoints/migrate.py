@@ -10,21 +10,10 @@ from app.core.security import get_current_active_user
 from app.models.user import User
 from app.models.load import Load
 from app.config import settings
-import boto3
-from botocore.exceptions import ClientError
+from app.services.aws import client_error, get_s3_client
 
 router = APIRouter()
 
-# Initialize S3 client if using S3
-s3_client = None
-if settings.USE_S3:
-    s3_client = boto3.client(
-        's3',
-        region_name=settings.AWS_REGION,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-    ) if settings.AWS_ACCESS_KEY_ID else boto3.client('s3', region_name=settings.AWS_REGION)
-
 
 @router.post("/pdf-urls")
 async def migrate_pdf_urls(
@@ -109,8 +98,9 @@ async def delete_all_pdfs(
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="Only admins can delete all PDFs")
 
-    if not settings.USE_S3 or not s3_client:
+    if not settings.USE_S3:
         raise HTTPException(status_code=400, detail="S3 is not configured")
+    s3_client = get_s3_client()
 
     # Get all loads with PDF URLs
     query = select(Load).where(
@@ -150,7 +140,7 @@ async def delete_all_pdfs(
         try:
             s3_client.delete_object(Bucket=settings.S3_BUCKET, Key=key)
             deleted_count += 1
-        except ClientError as e:
+        except client_error() as e:
             failed_files.append({"key": key, "error": str(e)})
 
     # Clear PDF URLs from database
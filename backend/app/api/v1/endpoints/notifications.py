@@ -12,6 +12,9 @@ from app.models.load import Load
 from app.core.security import get_current_active_user
 from app.models.user import User
 from app.services.twilio_service import get_twilio_service, TwilioService
+from app.services.job_queue import job_queue
+from app.services.notification_jobs import enqueue_bulk_sms
+from app.schemas.job import JobQueued, JobResponse
 
 router = APIRouter()
 
@@ -74,10 +77,9 @@ async def send_sms(
     return result
 
 
-@router.post("/sms/bulk")
+@router.post("/sms/bulk", response_model=JobQueued, status_code=status.HTTP_202_ACCEPTED)
 async def send_bulk_sms(
     request: BulkSMSRequest,
-    twilio_service: TwilioService = Depends(get_twilio_service),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -90,13 +92,17 @@ async def send_bulk_sms(
     ]
 
     Message template can include {name} placeholder
+
+    Messages are sent by a background job; poll /jobs/{job_id} for progress
+    and per-recipient results.
     """
-    result = await twilio_service.send_bulk_sms(
+    job = await enqueue_bulk_sms(
         recipients=request.recipients,
-        message_template=request.message
+        message=request.message,
+        company_id=current_user.company_id
     )
 
-    return result
+    return JobQueued(job_id=job["id"], status=job["status"], total=job["total"])
 
 
 @router.post("/loads/assignment")
@@ -276,17 +282,18 @@ async def notify_driver(
     }
 
 
-@router.post("/drivers/notify-all")
+@router.post("/drivers/notify-all", response_model=JobQueued, status_code=status.HTTP_202_ACCEPTED)
 async def notify_all_drivers(
     message: str,
     db: AsyncSession = Depends(get_db),
-    twilio_service: TwilioService = Depends(get_twilio_service),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Send SMS notification to all drivers in the company
 
     Message template can include {name} placeholder
+
+    Messages are sent by a background job; poll /jobs/{job_id} for progress.
     """
     # Fetch all drivers with phone numbers
     query = select(Driver).where(
@@ -308,13 +315,31 @@ async def notify_all_drivers(
         for driver in drivers
     ]
 
-    # Send bulk SMS
-    bulk_result = await twilio_service.send_bulk_sms(
+    job = await enqueue_bulk_sms(
         recipients=recipients,
-        message_template=message
+        message=message,
+        company_id=current_user.company_id
     )
 
-    return bulk_result
+    return JobQueued(job_id=job["id"], status=job["status"], total=job["total"])
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_notification_job(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Progress and outcome of a queued notification job
+
+    Finished jobs stay available for JOB_RESULT_TTL_SECONDS.
+    """
+    job = await job_queue.get(job_id)
+
+    if not job or job["company_id"] != current_user.company_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return JobResponse(**job)
 
 
 @router.get("/status")
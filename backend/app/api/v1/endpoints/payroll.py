@@ -1,11 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.payroll import Payroll
 from app.schemas.payroll import PayrollCreate, PayrollUpdate, PayrollResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
 from app.models.user import User
 
 router = APIRouter()
@@ -13,14 +14,19 @@ router = APIRouter()
 
 @router.get("/", response_model=List[PayrollResponse])
 async def get_payroll_entries(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Payroll).where(Payroll.company_id == current_user.company_id).offset(skip).limit(limit)
+    query = paginate(
+        select(Payroll).where(Payroll.company_id == current_user.company_id),
+        [Payroll.id], cursor, skip, limit
+    )
     result = await db.execute(query)
-    payroll_entries = result.scalars().all()
+    payroll_entries = finalize_page(result.scalars().all(), [Payroll.id], limit, response)
     return payroll_entries
 
 
@@ -1,14 +1,15 @@
 """
 Ratecon API endpoints
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.ratecon import Ratecon
 from app.schemas.ratecon import RateconCreate, RateconUpdate, RateconResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
 from app.models.user import User
 
 router = APIRouter()
@@ -17,15 +18,20 @@ router = APIRouter()
 @router.get("/", response_model=List[RateconResponse])
 @router.get("", response_model=List[RateconResponse])
 async def get_ratecons(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all ratecons for the current company"""
-    query = select(Ratecon).where(Ratecon.company_id == current_user.company_id).offset(skip).limit(limit)
+    query = paginate(
+        select(Ratecon).where(Ratecon.company_id == current_user.company_id),
+        [Ratecon.id], cursor, skip, limit
+    )
     result = await db.execute(query)
-    ratecons = result.scalars().all()
+    ratecons = finalize_page(result.scalars().all(), [Ratecon.id], limit, response)
     return ratecons
 
 
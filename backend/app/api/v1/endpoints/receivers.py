@@ -1,11 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.receiver import Receiver
 from app.schemas.receiver import ReceiverCreate, ReceiverUpdate, ReceiverResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
 from app.models.user import User
 
 router = APIRouter()
@@ -14,14 +15,19 @@ router = APIRouter()
 @router.get("/", response_model=List[ReceiverResponse])
 @router.get("", response_model=List[ReceiverResponse])
 async def get_receivers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Receiver).where(Receiver.company_id == current_user.company_id).offset(skip).limit(limit)
+    query = paginate(
+        select(Receiver).where(Receiver.company_id == current_user.company_id),
+        [Receiver.id], cursor, skip, limit
+    )
     result = await db.execute(query)
-    receivers = result.scalars().all()
+    receivers = finalize_page(result.scalars().all(), [Receiver.id], limit, response)
     return receivers
 
 
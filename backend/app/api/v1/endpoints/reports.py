@@ -0,0 +1,162 @@
+"""
+Reporting API endpoints
+"""
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, cast, Date
+from app.database import get_db
+from app.models.load import Load
+from app.models.driver import Driver
+from app.models.expense import Expense
+from app.models.fuel import Fuel
+from app.schemas.report import DriverWeeklyReport, DriverWeeklyRow, DriverWeek, WeeklyTotals
+from app.core.security import get_current_active_user
+from app.models.user import User
+
+router = APIRouter()
+
+
+def _week_of(column):
+    """Monday of the ISO week containing `column`, as a DATE"""
+    return cast(func.date_trunc("week", column), Date)
+
+
+def _in_range(column, start_date: Optional[date], end_date: Optional[date]):
+    conditions = []
+    if start_date:
+        conditions.append(column >= start_date)
+    if end_date:
+        conditions.append(column < end_date + timedelta(days=1))
+    return conditions
+
+
+@router.get("/driver-weekly", response_model=DriverWeeklyReport)
+async def get_driver_weekly_report(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    skip: int = 0,
+    limit: int = Query(25, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Revenue, expenses, fuel and profit per driver per week
+
+    Loads are bucketed by the week of their pickup date; expenses and fuel
+    by the week of their own date. Results are paginated by driver, so one
+    page holds every week for `limit` drivers.
+    """
+    company_id = current_user.company_id
+    load_filters = [
+        Load.company_id == company_id,
+        Load.driver_id.isnot(None),
+        Load.pickup_date.isnot(None),
+        *_in_range(Load.pickup_date, start_date, end_date),
+    ]
+
+    # Drivers that hauled at least one load in range, one page at a time
+    drivers_with_loads = (
+        select(Load.driver_id).where(*load_filters).distinct().subquery()
+    )
+    total_drivers = await db.scalar(
+        select(func.count()).select_from(drivers_with_loads)
+    )
+    driver_query = (
+        select(Driver.id, Driver.first_name, Driver.last_name)
+        .where(Driver.id.in_(select(drivers_with_loads.c.driver_id)))
+        .order_by(Driver.last_name, Driver.first_name, Driver.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    drivers = (await db.execute(driver_query)).all()
+    driver_ids = [driver.id for driver in drivers]
+
+    weeks = defaultdict(WeeklyTotals)
+
+    if driver_ids:
+        load_week = _week_of(Load.pickup_date)
+        load_query = (
+            select(
+                Load.driver_id,
+                load_week,
+                func.count(Load.id),
+                func.coalesce(func.sum(Load.miles), 0),
+                func.coalesce(func.sum(Load.rate), 0),
+            )
+            .where(*load_filters, Load.driver_id.in_(driver_ids))
+            .group_by(Load.driver_id, load_week)
+        )
+        for driver_id, week_start, loads, miles, revenue in (await db.execute(load_query)).all():
+            totals = weeks[(driver_id, week_start)]
+            totals.loads = loads
+            totals.miles = miles
+            totals.revenue = revenue
+
+        expense_week = _week_of(Expense.date)
+        expense_query = (
+            select(Expense.driver_id, expense_week, func.sum(Expense.amount))
+            .where(
+                Expense.company_id == company_id,
+                Expense.driver_id.in_(driver_ids),
+                *_in_range(Expense.date, start_date, end_date),
+            )
+            .group_by(Expense.driver_id, expense_week)
+        )
+        for driver_id, week_start, amount in (await db.execute(expense_query)).all():
+            weeks[(driver_id, week_start)].expenses = amount or Decimal("0")
+
+        fuel_week = _week_of(Fuel.date)
+        fuel_query = (
+            select(Fuel.driver_id, fuel_week, func.sum(Fuel.total_amount))
+            .where(
+                Fuel.company_id == company_id,
+                Fuel.driver_id.in_(driver_ids),
+                *_in_range(Fuel.date, start_date, end_date),
+            )
+            .group_by(Fuel.driver_id, fuel_week)
+        )
+        for driver_id, week_start, amount in (await db.execute(fuel_query)).all():
+            weeks[(driver_id, week_start)].fuel = amount or Decimal("0")
+
+    weeks_by_driver = defaultdict(list)
+    for (driver_id, week_start), totals in weeks.items():
+        totals.profit = totals.revenue - totals.expenses - totals.fuel
+        weeks_by_driver[driver_id].append(
+            DriverWeek(
+                week_start=week_start,
+                week_end=week_start + timedelta(days=6),
+                **totals.model_dump(),
+            )
+        )
+
+    rows = []
+    for driver in drivers:
+        driver_weeks = sorted(
+            weeks_by_driver[driver.id], key=lambda w: w.week_start, reverse=True
+        )
+        rows.append(
+            DriverWeeklyRow(
+                driver_id=driver.id,
+                driver_name=f"{driver.first_name} {driver.last_name}",
+                weeks=driver_weeks,
+                totals=WeeklyTotals(
+                    loads=sum(w.loads for w in driver_weeks),
+                    miles=sum(w.miles for w in driver_weeks),
+                    revenue=sum((w.revenue for w in driver_weeks), Decimal("0")),
+                    expenses=sum((w.expenses for w in driver_weeks), Decimal("0")),
+                    fuel=sum((w.fuel for w in driver_weeks), Decimal("0")),
+                    profit=sum((w.profit for w in driver_weeks), Decimal("0")),
+                ),
+            )
+        )
+
+    return DriverWeeklyReport(
+        total_drivers=total_drivers or 0,
+        skip=skip,
+        limit=limit,
+        drivers=rows,
+    )
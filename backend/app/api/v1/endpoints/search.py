@@ -0,0 +1,148 @@
+"""
+Search API endpoints
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal, literal_column, union_all, String
+from app.database import get_db
+from app.models.load import Load
+from app.models.customer import Customer
+from app.models.shipper import Shipper
+from app.models.receiver import Receiver
+from app.models.ratecon import Ratecon
+from app.models.lane import Lane
+from app.schemas.search import SearchHit, SearchResponse, SearchType
+from app.core.security import get_current_active_user
+from app.models.user import User
+
+router = APIRouter()
+
+
+def search_document(*columns):
+    """
+    Concatenate searchable columns into one text value
+
+    Must render exactly like the gin_trgm_ops expression indexes created in
+    the add_trigram_search_indexes migration, otherwise Postgres will not
+    use them. Constants are inlined so they are not sent as bind params.
+    """
+    empty = literal_column("''")
+    separator = literal_column("' '")
+    document = func.coalesce(columns[0], empty)
+    for column in columns[1:]:
+        document = document.op("||")(separator).op("||")(func.coalesce(column, empty))
+    return document
+
+
+def _joined(*columns, separator: str = ", "):
+    return func.concat_ws(literal(separator), *columns)
+
+
+# type -> (model, searchable columns, title, subtitle)
+SEARCH_TARGETS = {
+    SearchType.load: (
+        Load,
+        (Load.load_number, Load.reference_number, Load.pickup_location,
+         Load.delivery_location, Load.description),
+        Load.load_number,
+        _joined(Load.pickup_location, Load.delivery_location, separator=" → "),
+    ),
+    SearchType.customer: (
+        Customer,
+        (Customer.name, Customer.mc, Customer.contact_person, Customer.email,
+         Customer.phone, Customer.city, Customer.state),
+        Customer.name,
+        _joined(Customer.city, Customer.state),
+    ),
+    SearchType.shipper: (
+        Shipper,
+        (Shipper.name, Shipper.city, Shipper.state, Shipper.contact_person,
+         Shipper.product_type),
+        Shipper.name,
+        _joined(Shipper.city, Shipper.state),
+    ),
+    SearchType.receiver: (
+        Receiver,
+        (Receiver.name, Receiver.city, Receiver.state, Receiver.contact_person,
+         Receiver.product_type),
+        Receiver.name,
+        _joined(Receiver.city, Receiver.state),
+    ),
+    SearchType.ratecon: (
+        Ratecon,
+        (Ratecon.ratecon_number, Ratecon.load_number, Ratecon.broker_name,
+         Ratecon.pickup_location, Ratecon.delivery_location, Ratecon.commodity),
+        Ratecon.ratecon_number,
+        Ratecon.broker_name,
+    ),
+    SearchType.lane: (
+        Lane,
+        (Lane.broker, Lane.pickup_location, Lane.delivery_location),
+        Lane.broker,
+        _joined(Lane.pickup_location, Lane.delivery_location, separator=" → "),
+    ),
+}
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@router.get("/", response_model=SearchResponse)
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=2, max_length=100),
+    types: Optional[List[SearchType]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Search loads, customers, shippers, receivers, ratecons and lanes
+
+    Each type is matched with a trigram-indexed ILIKE on its search
+    document and ranked by trigram similarity. All types are queried in a
+    single UNION ALL round trip.
+    """
+    term = q.strip()
+    pattern = f"%{_escape_like(term)}%"
+    company_id = current_user.company_id
+
+    branches = []
+    for search_type in types or list(SearchType):
+        model, columns, title, subtitle = SEARCH_TARGETS[search_type]
+        document = search_document(*columns)
+        rank = func.similarity(document, term)
+        branch = (
+            select(
+                literal(search_type.value, String).label("type"),
+                model.id.label("id"),
+                title.label("title"),
+                subtitle.label("subtitle"),
+                rank.label("rank"),
+            )
+            .where(model.company_id == company_id, document.ilike(pattern))
+            .order_by(rank.desc())
+            .limit(limit)
+            .subquery()
+        )
+        branches.append(select(branch))
+
+    hits = union_all(*branches).subquery()
+    query = select(hits).order_by(hits.c.rank.desc(), hits.c.type, hits.c.id).limit(limit)
+    result = await db.execute(query)
+
+    return SearchResponse(
+        query=term,
+        hits=[
+            SearchHit(
+                type=row.type,
+                id=row.id,
+                title=row.title,
+                subtitle=row.subtitle or None,
+                rank=row.rank,
+            )
+            for row in result.all()
+        ],
+    )
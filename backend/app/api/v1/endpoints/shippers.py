@@ -1,11 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.shipper import Shipper
 from app.schemas.shipper import ShipperCreate, ShipperUpdate, ShipperResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE, paginate, finalize_page
 from app.models.user import User
 
 router = APIRouter()
@@ -14,14 +15,19 @@ router = APIRouter()
 @router.get("/", response_model=List[ShipperResponse])
 @router.get("", response_model=List[ShipperResponse])
 async def get_shippers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Shipper).where(Shipper.company_id == current_user.company_id).offset(skip).limit(limit)
+    query = paginate(
+        select(Shipper).where(Shipper.company_id == current_user.company_id),
+        [Shipper.id], cursor, skip, limit
+    )
     result = await db.execute(query)
-    shippers = result.scalars().all()
+    shippers = finalize_page(result.scalars().all(), [Shipper.id], limit, response)
     return shippers
 
 
@@ -1,11 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
 from app.models.truck import Truck
 from app.schemas.truck import TruckCreate, TruckUpdate, TruckResponse
 from app.core.security import get_current_active_user
+from app.core.pagination import MAX_PAGE_SIZE
+from app.services.cache import cached_page, tenant_cache
 from app.models.user import User
 
 router = APIRouter()
@@ -14,15 +16,18 @@ router = APIRouter()
 @router.get("/", response_model=List[TruckResponse])
 @router.get("", response_model=List[TruckResponse])
 async def get_trucks(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = select(Truck).where(Truck.company_id == current_user.company_id).offset(skip).limit(limit)
-    result = await db.execute(query)
-    trucks = result.scalars().all()
-    return trucks
+    return await cached_page(
+        "trucks", current_user.company_id, db,
+        select(Truck).where(Truck.company_id == current_user.company_id),
+        TruckResponse, [Truck.id], response, cursor, skip, limit
+    )
 
 
 @router.post("/", response_model=TruckResponse)
@@ -35,6 +40,7 @@ async def create_truck(
     db_truck = Truck(**truck.dict(), company_id=current_user.company_id)
     db.add(db_truck)
     await db.commit()
+    await tenant_cache.invalidate("trucks", current_user.company_id)
     await db.refresh(db_truck)
     return db_truck
 
@@ -76,6 +82,7 @@ async def update_truck(
         setattr(truck, field, value)
 
     await db.commit()
+    await tenant_cache.invalidate("trucks", current_user.company_id)
     await db.refresh(truck)
     return truck
 
@@ -97,4 +104,5 @@ async def delete_truck(
 
     await db.delete(truck)
     await db.commit()
+    await tenant_cache.invalidate("trucks", current_user.company_id)
     return {"message": "Truck deleted successfully"}
\ No newline at end of file
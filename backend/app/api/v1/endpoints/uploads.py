@@ -1,15 +1,27 @@
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from app.database import get_db
 from app.core.security import get_current_active_user
 from app.models.user import User
+from app.models.load import Load
+from app.schemas.upload import (
+    UploadIntentRequest,
+    UploadIntentResponse,
+    UploadCompleteRequest,
+    UploadCompleteResponse,
+    PresignedUrlBatchRequest
+)
+from app.services.s3 import s3_service, presigned_url_cache
+from app.services.aws import get_s3_client
 from app.config import settings
+import hashlib
+from datetime import datetime, timezone
 import os
 import uuid
 from pathlib import Path
-import boto3
-from botocore.exceptions import ClientError
 
 router = APIRouter()
 
@@ -17,15 +29,116 @@ router = APIRouter()
 UPLOAD_DIR = Path("/app/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-# Initialize S3 client if using S3
-s3_client = None
-if settings.USE_S3:
-    s3_client = boto3.client(
-        's3',
-        region_name=settings.AWS_REGION,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-    ) if settings.AWS_ACCESS_KEY_ID else boto3.client('s3', region_name=settings.AWS_REGION)
+S3_URL_PREFIX = "/api/v1/uploads/s3/"
+
+# S3 multipart parts must be at least 5MB (except the last one)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File exceeds the {settings.UPLOAD_MAX_BYTES // (1024 * 1024)}MB upload limit"
+    )
+
+
+async def _stream_to_s3(file: UploadFile, key: str) -> Tuple[int, str]:
+    """
+    Copy the upload to S3 chunk by chunk, returning (size, sha256)
+
+    Files that fit in one chunk use a single put_object; larger ones use a
+    multipart upload so at most two chunks are held in memory. boto3
+    calls run in the thread pool to keep the event loop free.
+    """
+    s3_client = get_s3_client()
+    digest = hashlib.sha256()
+    size = 0
+
+    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    next_chunk = await file.read(UPLOAD_CHUNK_SIZE) if chunk else b""
+
+    if not next_chunk:
+        if len(chunk) > settings.UPLOAD_MAX_BYTES:
+            raise _too_large()
+        digest.update(chunk)
+        await run_in_threadpool(
+            s3_client.put_object,
+            Bucket=settings.S3_BUCKET,
+            Key=key,
+            Body=chunk,
+            ContentType='application/pdf'
+        )
+        return len(chunk), digest.hexdigest()
+
+    upload = await run_in_threadpool(
+        s3_client.create_multipart_upload,
+        Bucket=settings.S3_BUCKET,
+        Key=key,
+        ContentType='application/pdf'
+    )
+    upload_id = upload['UploadId']
+    parts = []
+
+    async def upload_part(data: bytes) -> None:
+        nonlocal size
+        size += len(data)
+        if size > settings.UPLOAD_MAX_BYTES:
+            raise _too_large()
+        digest.update(data)
+        part_number = len(parts) + 1
+        part = await run_in_threadpool(
+            s3_client.upload_part,
+            Bucket=settings.S3_BUCKET,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data
+        )
+        parts.append({'ETag': part['ETag'], 'PartNumber': part_number})
+
+    try:
+        await upload_part(chunk)
+        await upload_part(next_chunk)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await upload_part(chunk)
+
+        await run_in_threadpool(
+            s3_client.complete_multipart_upload,
+            Bucket=settings.S3_BUCKET,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': parts}
+        )
+    except BaseException:
+        await run_in_threadpool(
+            s3_client.abort_multipart_upload,
+            Bucket=settings.S3_BUCKET,
+            Key=key,
+            UploadId=upload_id
+        )
+        raise
+
+    return size, digest.hexdigest()
+
+
+async def _stream_to_disk(file: UploadFile, file_path: Path) -> Tuple[int, str]:
+    """Copy the upload to local storage chunk by chunk, returning (size, sha256)"""
+    digest = hashlib.sha256()
+    size = 0
+    out = await run_in_threadpool(open, file_path, 'wb')
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.UPLOAD_MAX_BYTES:
+                raise _too_large()
+            digest.update(chunk)
+            await run_in_threadpool(out.write, chunk)
+    except BaseException:
+        await run_in_threadpool(out.close)
+        file_path.unlink(missing_ok=True)
+        raise
+    await run_in_threadpool(out.close)
+    return size, digest.hexdigest()
 
 
 @router.post("/")
@@ -33,7 +146,11 @@ async def upload_file(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Upload a file to S3 or local storage and return the URL"""
+    """Upload a file to S3 or local storage and return the URL
+
+    The body is streamed in fixed-size chunks, so memory use per upload is
+    bounded by UPLOAD_CHUNK_SIZE regardless of file size.
+    """
 
     # Validate file type (only PDFs)
     if not file.filename.lower().endswith('.pdf'):
@@ -44,33 +161,178 @@ async def upload_file(
     unique_filename = f"{uuid.uuid4()}.{file_extension}"
 
     try:
-        contents = await file.read()
-
-        if settings.USE_S3 and s3_client:
+        if settings.USE_S3:
             # Upload to S3
-            s3_client.put_object(
-                Bucket=settings.S3_BUCKET,
-                Key=unique_filename,
-                Body=contents,
-                ContentType='application/pdf'
-            )
+            size, checksum = await _stream_to_s3(file, unique_filename)
             # Store the S3 key instead of the direct URL
             # The key will be used to generate signed URLs when retrieving
-            file_url = f"/api/v1/uploads/s3/{unique_filename}"
+            file_url = f"{S3_URL_PREFIX}{unique_filename}"
         else:
             # Local storage fallback
-            file_path = UPLOAD_DIR / unique_filename
-            with open(file_path, 'wb') as f:
-                f.write(contents)
+            size, checksum = await _stream_to_disk(file, UPLOAD_DIR / unique_filename)
             file_url = f"/api/v1/uploads/files/{unique_filename}"
 
         return {
             "filename": file.filename,
             "url": file_url,
-            "size": len(contents)
+            "size": size,
+            "sha256": checksum
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
+    finally:
+        await file.close()
+
+
+PRESIGNED_UPLOAD_EXPIRES_IN = 900  # 15 minutes
+
+
+def _company_prefix(current_user: User) -> str:
+    return f"{current_user.company_id}/"
+
+
+@router.post("/intent", response_model=UploadIntentResponse)
+async def create_upload_intent(
+    request: UploadIntentRequest,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Issue a presigned POST so the browser can upload straight to S3
+
+    The object key is scoped to the caller's company. Call /uploads/complete
+    once the POST succeeds so the object is verified and recorded.
+    """
+    if not settings.USE_S3:
+        raise HTTPException(status_code=400, detail="S3 is not configured")
+
+    if not request.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+
+    if request.size and request.size > settings.UPLOAD_MAX_BYTES:
+        raise _too_large()
+
+    key = f"{_company_prefix(current_user)}{uuid.uuid4()}.pdf"
+    presigned = s3_service.generate_presigned_upload_url(
+        key=key,
+        content_type=request.content_type,
+        expires_in=PRESIGNED_UPLOAD_EXPIRES_IN,
+        max_bytes=settings.UPLOAD_MAX_BYTES
+    )
+    if not presigned:
+        raise HTTPException(status_code=500, detail="Failed to create upload URL")
+
+    return UploadIntentResponse(
+        key=key,
+        upload_url=presigned['url'],
+        fields=presigned['fields'],
+        expires_in=PRESIGNED_UPLOAD_EXPIRES_IN,
+        max_bytes=settings.UPLOAD_MAX_BYTES
+    )
+
+
+@router.post("/complete", response_model=UploadCompleteResponse)
+async def complete_upload(
+    request: UploadCompleteRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Verify a direct-to-S3 upload and optionally attach it to a load
+
+    The object must exist, be a non-empty PDF within the size limit and
+    live under the caller's company prefix. Objects that fail verification
+    are deleted.
+    """
+    if not settings.USE_S3:
+        raise HTTPException(status_code=400, detail="S3 is not configured")
+
+    if not request.key.startswith(_company_prefix(current_user)):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    if (request.load_id is None) != (request.document_type is None):
+        raise HTTPException(
+            status_code=400,
+            detail="load_id and document_type must be provided together"
+        )
+
+    load = None
+    if request.load_id is not None:
+        result = await db.execute(
+            select(Load).where(
+                Load.id == request.load_id,
+                Load.company_id == current_user.company_id
+            )
+        )
+        load = result.scalar_one_or_none()
+        if not load:
+            raise HTTPException(status_code=404, detail="Load not found")
+
+    metadata = await run_in_threadpool(s3_service.head_object, request.key)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    size = metadata.get('ContentLength', 0)
+    content_type = metadata.get('ContentType', '')
+    if size <= 0 or size > settings.UPLOAD_MAX_BYTES or content_type != 'application/pdf':
+        await run_in_threadpool(s3_service.delete_file, request.key)
+        raise HTTPException(status_code=400, detail="Uploaded file failed verification")
+
+    file_url = f"{S3_URL_PREFIX}{request.key}"
+
+    if load is not None:
+        setattr(load, f"{request.document_type}_url", file_url)
+        await db.commit()
+
+    return UploadCompleteResponse(
+        filename=request.filename,
+        key=request.key,
+        url=file_url,
+        size=size,
+        content_type=content_type,
+        etag=metadata.get('ETag', '').strip('"') or None,
+        load_id=load.id if load is not None else None
+    )
+
+
+def _s3_key(filename: str) -> str:
+    """Normalise a stored document reference to its S3 key"""
+    if filename.startswith('http'):
+        # Format: https://bucket.s3.region.amazonaws.com/key
+        return filename.split('/')[-1]
+    if filename.startswith(S3_URL_PREFIX):
+        return filename[len(S3_URL_PREFIX):]
+    return filename
+
+
+def _expires_at(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+@router.post("/s3/urls")
+async def get_s3_file_urls(
+    request: PresignedUrlBatchRequest,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get presigned URLs for many S3 files in one call
+
+    Accepts bare keys, /api/v1/uploads/s3/... paths or full S3 URLs, e.g.
+    every pod_url and ratecon_url of a load. URLs are cached until shortly
+    before they expire, so repeated calls return the same URLs.
+    """
+    if not settings.USE_S3:
+        raise HTTPException(status_code=400, detail="S3 is not configured")
+
+    keys = {reference: _s3_key(reference) for reference in request.files}
+    signed = await presigned_url_cache.get_urls(keys.values())
+
+    return {
+        "urls": {
+            reference: {"url": signed[key][0], "expires_at": _expires_at(signed[key][1])}
+            for reference, key in keys.items()
+            if key in signed
+        },
+        "missing": [reference for reference, key in keys.items() if key not in signed]
+    }
 
 
 @router.get("/s3/{filename:path}")
@@ -88,36 +350,25 @@ async def get_s3_file(
     Args:
         redirect: If True, redirects to the presigned URL. If False, returns JSON with the URL.
     """
-    if not settings.USE_S3 or not s3_client:
+    if not settings.USE_S3:
         raise HTTPException(status_code=400, detail="S3 is not configured")
 
     try:
-        # Extract filename if a full S3 URL was provided
-        if filename.startswith('http'):
-            # Parse S3 URL to get just the key
-            # Format: https://bucket.s3.region.amazonaws.com/key
-            parts = filename.split('/')
-            filename = parts[-1]  # Get last part (the actual file key)
-
-        # Generate a presigned URL that expires in 1 hour
-        presigned_url = s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': settings.S3_BUCKET,
-                'Key': filename
-            },
-            ExpiresIn=3600  # 1 hour
-        )
+        # Reuses the previous URL until it is close to expiring
+        signed = await presigned_url_cache.get_url(_s3_key(filename))
+        if not signed:
+            raise HTTPException(status_code=404, detail="File not found")
+        presigned_url, expires_at = signed
 
         # Return redirect or JSON based on query parameter
         if redirect:
             from fastapi.responses import RedirectResponse
             return RedirectResponse(url=presigned_url)
         else:
-            return {"url": presigned_url}
+            return {"url": presigned_url, "expires_at": _expires_at(expires_at)}
 
-    except ClientError as e:
-        raise HTTPException(status_code=404, detail="File not found")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate signed URL: {str(e)}")
 
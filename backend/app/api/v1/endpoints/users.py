@@ -5,9 +5,11 @@ from pydantic import BaseModel
 from typing import Optional
 from app.database import get_db
 from app.core.security import get_current_active_user, get_password_hash
+from app.core.principal_cache import principal_cache
+from app.models.company import Company
 from app.models.user import User, UserRole
 from app.schemas.auth import UserCreate, UserCreateResponse, UserResponse
-from app.services.email import email_service
+from app.services.notification_jobs import enqueue_email
 import secrets
 import string
 
@@ -103,7 +105,7 @@ async def create_user(
     new_user = User(
         username=user_data.username,
         email=user_data.email,
-        hashed_password=get_password_hash(temporary_password),
+        hashed_password=await get_password_hash(temporary_password),
         first_name=user_data.first_name,
         last_name=user_data.last_name,
         role=user_role,
@@ -119,16 +121,21 @@ async def create_user(
 
     # Send invitation email with credentials if requested
     if user_data.send_invitation:
-        await email_service.send_user_invitation_email(
+        company_name = await db.scalar(
+            select(Company.name).where(Company.id == current_user.company_id)
+        )
+        await enqueue_email(
+            "user_invitation",
+            company_id=current_user.company_id,
             to_email=new_user.email,
             invited_by=current_user.full_name,
-            company_name=current_user.company.name,
+            company_name=company_name,
             temporary_password=temporary_password,
             username=new_user.username
         )
 
     return UserCreateResponse(
-        message="User created successfully" + (" and invitation email sent" if user_data.send_invitation else ""),
+        message="User created successfully" + (" and invitation email queued" if user_data.send_invitation else ""),
         user_id=new_user.id,
         username=new_user.username,
         email=new_user.email,
@@ -237,6 +244,8 @@ async def update_user(
             detail="User not found"
         )
 
+    previous_email = user.email
+
     # Prevent admins from modifying their own admin status
     if user.id == current_user.id and user_data.role and user_data.role != user.role.value:
         raise HTTPException(
@@ -272,7 +281,7 @@ async def update_user(
     if user_data.last_name:
         user.last_name = user_data.last_name
     if user_data.password:
-        user.hashed_password = get_password_hash(user_data.password)
+        user.hashed_password = await get_password_hash(user_data.password)
     if user_data.is_active is not None:
         user.is_active = user_data.is_active
 
@@ -301,6 +310,9 @@ async def update_user(
     await db.commit()
     await db.refresh(user)
 
+    # Role, status and email changes must not be served from a stale cache
+    await principal_cache.invalidate(previous_email, user.email)
+
     return UserUpdateResponse(
         message="User updated successfully",
         user=build_user_response(user)
@@ -345,6 +357,7 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    await principal_cache.invalidate(user.email)
 
     return {"message": "User deleted successfully"}
 
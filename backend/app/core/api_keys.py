@@ -0,0 +1,182 @@
+"""
+Company API keys for machine integrations
+
+A key looks like `tms_<prefix>_<secret>` and is sent as a bearer token.
+The prefix is stored in clear and indexed for lookup; the secret is stored
+only as an HMAC-SHA256 under SECRET_KEY. Secrets are 256 random bits, so
+one keyed hash is as strong as a slow password hash would be while costing
+microseconds. Keys that verified recently are kept in an in-process LRU,
+so repeat requests skip the database entirely.
+"""
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.models.api_key import ApiKey
+from app.models.user import User
+
+KEY_PREFIX = "tms_"
+
+# What a key may be scoped to: the routers under API_V1_STR (see
+# app/api/v1/api.py) except authentication, user, company and key
+# management, which stay behind a user login
+SCOPE_RESOURCES = (
+    "customers", "trucks", "drivers", "loads", "stops", "invoices", "payroll",
+    "lanes", "expenses", "fuel", "uploads", "shippers", "receivers",
+    "notifications", "ratecons", "dashboard", "reports", "search", "exports",
+)
+SCOPE_ACTIONS = ("read", "write")
+
+# Methods that only need `read`; everything else needs `write`
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def normalize_scopes(scopes: Iterable[str]) -> List[str]:
+    """
+    Validate `resource:action` scopes, returning them sorted and deduplicated
+
+    `resource` may be `*` for every resource a key can reach; `write`
+    implies `read`.
+    """
+    normalized = set()
+    for scope in scopes:
+        resource, _, action = scope.strip().partition(":")
+        if resource != "*" and resource not in SCOPE_RESOURCES:
+            raise ValueError(f"Unknown scope resource '{resource}'")
+        if action not in SCOPE_ACTIONS:
+            raise ValueError(f"Scope '{scope}' must end in :read or :write")
+        normalized.add(f"{resource}:{action}")
+    if not normalized:
+        raise ValueError("At least one scope is required")
+    return sorted(normalized)
+
+
+@dataclass(frozen=True)
+class ApiKeyPrincipal:
+    """What a verified key grants, as cached between requests"""
+    key_id: int
+    company_id: int
+    user_email: str
+    scopes: FrozenSet[str]
+    expires_at: Optional[datetime]
+
+    def allows(self, method: str, path: str) -> bool:
+        """Whether the key's scopes cover `method` on an API `path`"""
+        if not path.startswith(settings.API_V1_STR):
+            return False
+        resource = path[len(settings.API_V1_STR):].strip("/").split("/", 1)[0]
+        if resource not in SCOPE_RESOURCES:
+            return False
+
+        actions = ("read", "write") if method.upper() in READ_METHODS else ("write",)
+        return any(
+            f"{scope_resource}:{action}" in self.scopes
+            for scope_resource in (resource, "*")
+            for action in actions
+        )
+
+
+class ApiKeyService:
+    """Issues API keys and verifies them, with an LRU of recent verifications"""
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, tuple[float, ApiKeyPrincipal]]" = OrderedDict()
+
+    @staticmethod
+    def hash_secret(secret: str) -> str:
+        return hmac.new(
+            settings.SECRET_KEY.encode(), secret.encode(), hashlib.sha256
+        ).hexdigest()
+
+    @classmethod
+    def generate(cls) -> Tuple[str, str, str]:
+        """Return (full key, prefix, secret hash); only the last two are stored"""
+        prefix = secrets.token_hex(6)
+        secret = secrets.token_urlsafe(32)
+        return f"{KEY_PREFIX}{prefix}_{secret}", prefix, cls.hash_secret(secret)
+
+    @staticmethod
+    def is_api_key(token: str) -> bool:
+        return token.startswith(KEY_PREFIX)
+
+    @staticmethod
+    def _parse(token: str) -> Optional[Tuple[str, str]]:
+        prefix, _, secret = token[len(KEY_PREFIX):].partition("_")
+        if not prefix or not secret:
+            return None
+        return prefix, secret
+
+    async def authenticate(self, db: AsyncSession, token: str) -> Optional[ApiKeyPrincipal]:
+        """Return what `token` grants, or None if it is unknown, revoked or expired"""
+        cache_key = hashlib.sha256(token.encode()).digest()
+        now = datetime.now(timezone.utc)
+
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            cached_until, principal = entry
+            if cached_until > time.monotonic() and (
+                principal.expires_at is None or principal.expires_at > now
+            ):
+                self._entries.move_to_end(cache_key)
+                return principal
+            del self._entries[cache_key]
+
+        parsed = self._parse(token)
+        if parsed is None:
+            return None
+        prefix, secret = parsed
+
+        result = await db.execute(
+            select(ApiKey, User.email)
+            .join(User, User.id == ApiKey.user_id)
+            .where(ApiKey.prefix == prefix)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        api_key, email = row
+        if not hmac.compare_digest(api_key.secret_hash, self.hash_secret(secret)):
+            return None
+        if api_key.revoked_at is not None:
+            return None
+        if api_key.expires_at is not None and api_key.expires_at <= now:
+            return None
+
+        # Written at most once per cache TTL per worker
+        api_key.last_used_at = now
+        await db.commit()
+
+        principal = ApiKeyPrincipal(
+            key_id=api_key.id,
+            company_id=api_key.company_id,
+            user_email=email,
+            scopes=frozenset(api_key.scopes or ()),
+            expires_at=api_key.expires_at,
+        )
+        if self.max_entries > 0:
+            self._entries[cache_key] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, key_id: int) -> None:
+        """Forget a revoked key on this worker; others drop it within the TTL"""
+        for cache_key, (_, principal) in list(self._entries.items()):
+            if principal.key_id == key_id:
+                del self._entries[cache_key]
+
+
+api_key_service = ApiKeyService(
+    max_entries=settings.API_KEY_CACHE_MAX_ENTRIES,
+    ttl=settings.API_KEY_CACHE_TTL_SECONDS,
+)
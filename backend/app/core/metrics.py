@@ -0,0 +1,239 @@
+"""
+Prometheus metrics: HTTP requests, SQL statements, pool gauges, outbound calls
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+from fastapi import Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Requests that match no route share one label so scans of random URLs
+# cannot blow up the number of series
+UNMATCHED_ROUTE = "<unmatched>"
+
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK"}
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    multiprocess_mode="livesum",
+)
+DB_STATEMENT_LATENCY = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time by leading keyword",
+    ["operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_STATEMENT_ERRORS = Counter(
+    "db_statement_errors_total",
+    "SQL statements that raised, by leading keyword",
+    ["operation"],
+)
+EXTERNAL_CALL_LATENCY = Histogram(
+    "external_call_duration_seconds",
+    "Latency of calls to S3, Twilio and SMTP",
+    ["service", "operation", "outcome"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+
+@contextmanager
+def observe_external(service: str, operation: str) -> Iterator[None]:
+    """Time an outbound call; works around sync code and across awaits"""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        EXTERNAL_CALL_LATENCY.labels(service, operation, outcome).observe(
+            time.perf_counter() - start
+        )
+
+
+def instrument_boto3_client(client, service: str = "s3"):
+    """Record the latency of every API call made through a boto3 client"""
+    def before_call(context, model, **kwargs):
+        context["metrics_started_at"] = time.perf_counter()
+
+    def after_call(context, model, http_response, **kwargs):
+        started_at = context.pop("metrics_started_at", None)
+        if started_at is None:
+            return
+        status = getattr(http_response, "status_code", 500)
+        outcome = "success" if status < 400 else "error"
+        EXTERNAL_CALL_LATENCY.labels(service, model.name, outcome).observe(
+            time.perf_counter() - started_at
+        )
+
+    events = client.meta.events
+    events.register(f"before-call.{service}", before_call)
+    events.register(f"after-call.{service}", after_call)
+    return client
+
+
+def _sql_operation(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in SQL_OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine) -> None:
+    """Time every statement run through a (sync or async) SQLAlchemy engine"""
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("metrics_started_at")
+        if not started:
+            return
+        started_at = started.pop()
+        DB_STATEMENT_LATENCY.labels(_sql_operation(statement)).observe(
+            time.perf_counter() - started_at
+        )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("metrics_started_at"):
+            conn.info["metrics_started_at"].pop()
+        DB_STATEMENT_ERRORS.labels(
+            _sql_operation(exception_context.statement or "")
+        ).inc()
+
+
+class PoolCollector:
+    """
+    Reads the connection pool gauges at scrape time
+
+    Each worker process has its own pool, so the values are labelled with
+    the pid of the worker that served the scrape.
+    """
+
+    def __init__(self, get_stats: Callable[[], dict]):
+        self.get_stats = get_stats
+
+    def collect(self):
+        stats = self.get_stats()
+        pid = str(os.getpid())
+        for name in ("size", "checked_in", "checked_out", "overflow"):
+            gauge = GaugeMetricFamily(
+                f"db_pool_{name}", f"Database pool {name.replace('_', ' ')} connections",
+                labels=["pid"],
+            )
+            gauge.add_metric([pid], stats[name])
+            yield gauge
+        waited = CounterMetricFamily(
+            "db_pool_wait_seconds", "Total time spent waiting for a pooled connection",
+            labels=["pid"],
+        )
+        waited.add_metric([pid], stats["wait_seconds_total"])
+        yield waited
+        timeouts = CounterMetricFamily(
+            "db_pool_timeouts", "Checkouts that gave up waiting for a connection",
+            labels=["pid"],
+        )
+        timeouts.add_metric([pid], stats["timeouts"])
+        yield timeouts
+
+
+# Collectors that read live process state rather than stored samples
+_live_collectors: List[PoolCollector] = []
+
+
+def register_pool_collector(get_stats: Callable[[], dict]) -> None:
+    collector = PoolCollector(get_stats)
+    _live_collectors.append(collector)
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        REGISTRY.register(collector)
+
+
+def _route_template(scope: Scope) -> str:
+    app = scope.get("app")
+    if app is None:
+        return UNMATCHED_ROUTE
+
+    partial = None
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path  # Path matched but not the method
+    return partial or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """ASGI middleware recording request count and latency per route template"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_PROGRESS.dec()
+            labels = (scope["method"], _route_template(scope), str(status_code))
+            HTTP_REQUESTS.labels(*labels).inc()
+            HTTP_LATENCY.labels(*labels).observe(time.perf_counter() - start)
+
+
+def metrics_response() -> Response:
+    """
+    Current metrics in the Prometheus text format
+
+    Under gunicorn (PROMETHEUS_MULTIPROC_DIR set by app.server) the samples
+    of every worker are aggregated, whichever worker serves the scrape.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        for collector in _live_collectors:
+            registry.register(collector)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
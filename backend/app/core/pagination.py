@@ -0,0 +1,136 @@
+"""
+Keyset (cursor) pagination shared by the list endpoints
+"""
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Mapping, Optional, Sequence
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Date, DateTime, Numeric, and_, false, or_, tuple_
+from sqlalchemy.sql import Select
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Largest `limit` a list endpoint accepts; bigger reads should page through
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row into an opaque cursor"""
+    raw = json.dumps([
+        v.isoformat() if isinstance(v, (date, datetime))
+        # As a string, so money columns keep their exact value
+        else str(v) if isinstance(v, Decimal)
+        else v
+        for v in values
+    ])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_keys: Sequence[Any]) -> List[Any]:
+    """Decode a cursor back into values typed to match `sort_keys`"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(sort_keys):
+            raise ValueError("cursor does not match sort keys")
+
+        values = []
+        for column, value in zip(sort_keys, raw):
+            if value is not None and isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif value is not None and isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+            elif value is not None and isinstance(column.type, Numeric) and column.type.asdecimal:
+                value = Decimal(str(value))
+            values.append(value)
+        return values
+    except (ValueError, TypeError, ArithmeticError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def _is_nullable(key: Any) -> bool:
+    return bool(getattr(key.expression, "nullable", False))
+
+
+def _comes_after(sort_keys: Sequence[Any], values: Sequence[Any], descending: bool):
+    """
+    Rows strictly after `values` in (sort_keys) order, with NULLs sorted last
+
+    Only needed when a sort key is nullable; otherwise a plain row-value
+    comparison is used because Postgres can match it to an index directly.
+    """
+    key, value = sort_keys[0], values[0]
+    beyond = key < value if descending else key > value
+
+    if len(sort_keys) == 1:
+        return beyond if value is not None else false()
+
+    rest = _comes_after(sort_keys[1:], values[1:], descending)
+    if value is None:
+        return and_(key.is_(None), rest)
+    if _is_nullable(key):
+        return or_(beyond, key.is_(None), and_(key == value, rest))
+    return or_(beyond, and_(key == value, rest))
+
+
+def paginate(
+    query: Select,
+    sort_keys: Sequence[Any],
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    descending: bool = False,
+) -> Select:
+    """
+    Order `query` by `sort_keys` and restrict it to one page
+
+    With a cursor the page starts right after the row the cursor was issued
+    for, so deep pages cost the same as the first one. Without a cursor the
+    legacy `skip` offset still applies. One extra row is fetched so
+    `finalize_page` can tell whether another page exists.
+    """
+    nullable = any(_is_nullable(key) for key in sort_keys)
+    order = []
+    for key in sort_keys:
+        clause = key.desc() if descending else key.asc()
+        order.append(clause.nulls_last() if _is_nullable(key) else clause)
+    query = query.order_by(*order)
+
+    if cursor:
+        values = decode_cursor(cursor, sort_keys)
+        if nullable:
+            query = query.where(_comes_after(sort_keys, values, descending))
+        else:
+            keys = tuple_(*sort_keys)
+            query = query.where(keys < tuple_(*values) if descending else keys > tuple_(*values))
+    elif skip:
+        query = query.offset(skip)
+
+    return query.limit(limit + 1)
+
+
+def finalize_page(
+    items: Sequence[Any],
+    sort_keys: Sequence[Any],
+    limit: int,
+    response: Response,
+) -> List[Any]:
+    """Trim the look-ahead row and expose the next cursor as a response header"""
+    items = list(items)
+    if len(items) > limit:
+        items = items[:limit]
+        if not items:
+            # limit=0: nothing to resume after
+            return items
+        last = items[-1]
+        # Pages may hold ORM instances or row mappings
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([
+            last[key.key] if isinstance(last, Mapping) else getattr(last, key.key)
+            for key in sort_keys
+        ])
+    return items
@@ -0,0 +1,112 @@
+"""
+Argon2 password hashing on a bounded thread pool
+
+Each hash or verify burns tens of milliseconds of CPU (and
+ARGON2_MEMORY_COST_KIB of memory). argon2-cffi releases the GIL while it
+works, so running it on a few dedicated threads keeps the event loop
+serving other requests and lets hashes use more than one core.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from fastapi import HTTPException, status
+from app.config import settings
+
+
+class PasswordHashingService:
+    """
+    Hashes and verifies passwords off the event loop
+
+    At most `workers` hashes run at once and `max_pending` more may queue
+    behind them; a request that cannot get a slot within `queue_timeout`
+    gets a 503 instead of piling onto a saturated worker, which keeps a
+    credential-stuffing burst from starving every other endpoint.
+    """
+
+    def __init__(
+        self,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int,
+        workers: int = 2,
+        max_pending: int = 32,
+        queue_timeout: float = 5.0,
+    ):
+        self.hasher = PasswordHasher(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+        self.workers = max(1, workers)
+        self.max_pending = max(0, max_pending)
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="argon2"
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers + self.max_pending)
+        return self._slots
+
+    def hash_sync(self, password: str) -> str:
+        return self.hasher.hash(password)
+
+    def verify_sync(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password, returning (matches, replacement hash)
+
+        The replacement is only set when the password matched and the stored
+        hash was made with different Argon2 parameters than the current
+        ones; hashing it again here saves a second trip through the pool.
+        """
+        try:
+            self.hasher.verify(hashed_password, password)
+        except (VerificationError, InvalidHashError):
+            return False, None
+        if self.hasher.check_needs_rehash(hashed_password):
+            return True, self.hasher.hash(password)
+        return True, None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        slots = self._get_slots()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in attempts in progress, please try again",
+                headers={"Retry-After": "1"}
+            )
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.hash_sync, password)
+
+    async def verify(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return await self._run(self.verify_sync, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHashingService(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    parallelism=settings.ARGON2_PARALLELISM,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
+)
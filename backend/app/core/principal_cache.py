@@ -0,0 +1,209 @@
+"""
+Short-lived cache of authenticated users keyed by token subject
+"""
+import enum
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import DateTime
+from app.config import settings
+from app.models.user import User
+from app.services.redis import redis_errors
+
+logger = logging.getLogger(__name__)
+
+# Never cached: the password hash has no business outside the users table
+_EXCLUDED_COLUMNS = {"hashed_password"}
+
+
+def _snapshot(user: User) -> dict:
+    """Plain, JSON-safe copy of the user's column values"""
+    values = {}
+    for column in User.__table__.columns:
+        if column.key in _EXCLUDED_COLUMNS:
+            continue
+        value = getattr(user, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, enum.Enum):  # assigned but not yet reloaded
+            value = value.value
+        values[column.key] = value
+    return values
+
+
+def _restore(values: dict) -> User:
+    """Rebuild a detached User from a snapshot"""
+    restored = {}
+    for column in User.__table__.columns:
+        if column.key not in values:
+            continue
+        value = values[column.key]
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        restored[column.key] = value
+    return User(**restored)
+
+
+class PrincipalCache:
+    """
+    In-process LRU of resolved users, optionally backed by Redis
+
+    Users come back from `get` as detached instances rebuilt from their
+    column values, without `hashed_password`. Callers may read columns only;
+    touching a relationship such as `user.company` would try to lazy-load
+    outside any session and fail.
+
+    When `publish_invalidations` is set, `invalidate` bumps a per-subject
+    version in Redis and every lookup checks it, so a role change or
+    deactivation made on one worker takes effect on all of them at once.
+    Without it (a single worker) entries only need dropping locally. After
+    a Redis error, Redis is skipped for `retry_after` seconds and entries
+    fall back to expiring after `local_ttl`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        local_ttl: int,
+        redis_ttl: int,
+        use_redis: bool,
+        publish_invalidations: bool,
+        retry_after: float,
+    ):
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.use_redis = use_redis
+        self.publish_invalidations = use_redis or publish_invalidations
+        self.retry_after = retry_after
+        self._disabled_until = 0.0
+        # (expires_at, version, values); version None when it couldn't be checked
+        self._entries: "OrderedDict[str, tuple[float, Optional[int], dict]]" = OrderedDict()
+        # Version seen on the last miss, so `set` can't file a user loaded
+        # before an invalidation under the version that came after it
+        self._miss_versions: "OrderedDict[str, Optional[int]]" = OrderedDict()
+
+    @staticmethod
+    def _redis_key(subject: str) -> str:
+        return f"principal:{subject}"
+
+    @staticmethod
+    def _version_key(subject: str) -> str:
+        # Never expires: a version that reset to 0 could match a stale entry
+        return f"principal:{subject}:version"
+
+    @staticmethod
+    def _redis():
+        from app.services.redis import redis_service
+        return redis_service.redis_client
+
+    def _available(self) -> bool:
+        return self.publish_invalidations and time.monotonic() >= self._disabled_until
+
+    def _record_error(self, error: Exception) -> None:
+        self._disabled_until = time.monotonic() + self.retry_after
+        logger.warning(
+            "Principal cache: Redis unavailable, skipping it for %ss: %s", self.retry_after, error
+        )
+
+    async def _version(self, subject: str) -> Optional[int]:
+        """Current version of `subject`, or None when it can't be checked"""
+        if not self._available():
+            return None
+        try:
+            return int(await self._redis().get(self._version_key(subject)) or 0)
+        except redis_errors() as e:
+            self._record_error(e)
+            return None
+
+    async def get(self, subject: str) -> Optional[User]:
+        """Return the cached user for `subject`, or None on a miss"""
+        if self.max_entries <= 0:
+            return None
+
+        version = await self._version(subject)
+        entry = self._entries.get(subject)
+        if entry is not None:
+            expires_at, cached_version, values = entry
+            if expires_at > time.monotonic() and version in (None, cached_version):
+                self._entries.move_to_end(subject)
+                return _restore(values)
+            del self._entries[subject]
+
+        if self.use_redis and version is not None:
+            try:
+                raw = await self._redis().get(self._redis_key(subject))
+            except redis_errors() as e:
+                self._record_error(e)
+                raw = None
+            cached = json.loads(raw) if raw else None
+            if cached and cached.get("version") == version:
+                self._store_local(subject, version, cached["values"])
+                return _restore(cached["values"])
+
+        self._miss_versions[subject] = version
+        self._miss_versions.move_to_end(subject)
+        while len(self._miss_versions) > self.max_entries:
+            self._miss_versions.popitem(last=False)
+        return None
+
+    async def set(self, subject: str, user: User) -> None:
+        """Cache `user`, as just loaded after a miss on `subject`"""
+        if self.max_entries <= 0:
+            return
+
+        if subject in self._miss_versions:
+            version = self._miss_versions.pop(subject)
+        else:
+            version = await self._version(subject)
+        values = _snapshot(user)
+        self._store_local(subject, version, values)
+        if self.use_redis and version is not None and self._available():
+            try:
+                await self._redis().set(
+                    self._redis_key(subject),
+                    json.dumps({"version": version, "values": values}, default=str),
+                    ex=self.redis_ttl
+                )
+            except redis_errors() as e:
+                self._record_error(e)
+
+    async def invalidate(self, *subjects: Optional[str]) -> None:
+        """Drop cached entries on every worker, e.g. after a role change or deactivation"""
+        subjects = [subject for subject in subjects if subject]
+        for subject in subjects:
+            self._entries.pop(subject, None)
+        if not subjects or not self._available():
+            return
+        try:
+            async with self._redis().pipeline(transaction=False) as pipe:
+                for subject in subjects:
+                    pipe.incr(self._version_key(subject))
+                    if self.use_redis:
+                        pipe.delete(self._redis_key(subject))
+                await pipe.execute()
+        except redis_errors() as e:
+            self._record_error(e)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._miss_versions.clear()
+
+    def _store_local(self, subject: str, version: Optional[int], values: dict) -> None:
+        self._entries[subject] = (time.monotonic() + self.local_ttl, version, values)
+        self._entries.move_to_end(subject)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    use_redis=settings.PRINCIPAL_CACHE_USE_REDIS,
+    publish_invalidations=settings.server_worker_count > 1,
+    retry_after=settings.CACHE_RETRY_AFTER_SECONDS,
+)
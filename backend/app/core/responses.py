@@ -0,0 +1,56 @@
+"""
+orjson responses and a row-mapping fast path for large lists
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Column
+
+
+def _default(value: Any) -> Any:
+    # Pydantic renders Decimal as a string in JSON mode; keep the same output
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    Default response class; orjson encodes several times faster than json
+
+    Also renders the types row mappings carry (datetime, date, Decimal,
+    enums) the way the Pydantic response models would, so endpoints can
+    return rows without validating them first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
+
+
+def schema_columns(model: Any, schema: Type[BaseModel]) -> List[Column]:
+    """Columns of `model` that `schema` exposes, for a select() of just those"""
+    table = model.__table__
+    return [table.c[name] for name in schema.model_fields if name in table.c]
+
+
+def index_rows(rows: Iterable[Any], key: str = "id") -> Dict[Any, Dict[str, Any]]:
+    """Plain dicts from row mappings, keyed by `key`"""
+    return {row[key]: dict(row) for row in rows}
+
+
+def list_response(items: Sequence[Any], response: Optional[Response] = None) -> ORJSONResponse:
+    """
+    Return already-serializable list items without response_model validation
+
+    Headers set on the endpoint's injected `response`, such as the next
+    page cursor, are carried over.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return ORJSONResponse(list(items), headers=headers)
@@ -1,26 +1,28 @@
 from datetime import datetime, timedelta
 from typing import Optional, Union
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.config import settings
 from app.database import get_db
 from app.models.user import User
+from .api_keys import api_key_service
+from .passwords import password_hasher
+from .principal_cache import principal_cache
 from .security_middleware import SecurityContext, DataFilter, create_security_context, create_data_filter
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    matches, _ = await password_hasher.verify(plain_password, hashed_password)
+    return matches
 
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.hash(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -44,17 +46,66 @@ async def authenticate_user(db: AsyncSession, username_or_email: str, password:
     user = result.scalar_one_or_none()
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    matches, new_hash = await password_hasher.verify(password, user.hashed_password)
+    if not matches:
         return False
     if not user.is_active:
         return False
+    if new_hash:
+        # Stored with older Argon2 parameters; upgrade it while we have the password
+        user.hashed_password = new_hash
+        await db.commit()
+    return user
+
+
+async def load_principal(db: AsyncSession, email: str) -> Optional[User]:
+    """The user a token subject names, from the principal cache when possible"""
+    user = await principal_cache.get(email)
+    if user is not None:
+        return user
+
+    query = select(User).where(User.email == email)
+    result = await db.execute(query)
+    user = result.scalar_one_or_none()
+    if user is not None:
+        await principal_cache.set(email, user)
+    return user
+
+
+async def _api_key_user(request: Request, db: AsyncSession, token: str) -> User:
+    """Resolve an integration API key to the user it acts as, enforcing its scopes"""
+    principal = await api_key_service.authenticate(db, token)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or revoked API key",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not principal.allows(request.method, request.url.path):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="API key scopes do not allow this request"
+        )
+
+    user = await load_principal(db, principal.user_email)
+    if user is None or user.company_id != principal.company_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or revoked API key",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    request.state.api_key_id = principal.key_id
     return user
 
 
 async def get_current_user(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     token: str = Depends(oauth2_scheme)
 ) -> User:
+    if api_key_service.is_api_key(token):
+        return await _api_key_user(request, db, token)
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -63,14 +114,13 @@ async def get_current_user(
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         email: str = payload.get("sub")
-        if email is None:
+        # Refresh tokens share the signing key but only work at /auth/refresh
+        if email is None or payload.get("type") == "refresh":
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    query = select(User).where(User.email == email)
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    user = await load_principal(db, email)
     if user is None:
         raise credentials_exception
     return user
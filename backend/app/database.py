@@ -1,11 +1,76 @@
+import time
+from uuid import uuid4
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
 
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkouts that had to wait for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+
+    def _exhausted(self) -> bool:
+        """Whether a checkout now would have to wait for another to return"""
+        if self.checkedin() > 0:
+            return False
+        return self._max_overflow > -1 and self._overflow >= self._max_overflow
+
+    def _do_get(self):
+        if not self._exhausted():
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.wait_count += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_count = self.wait_count
+        pool.wait_seconds_total = self.wait_seconds_total
+        pool.wait_seconds_max = self.wait_seconds_max
+        pool.timeouts = self.timeouts
+        return pool
+
+
+connect_args = {}
+if settings.DB_PGBOUNCER_MODE:
+    # PgBouncer in transaction mode hands each transaction a different
+    # server connection, so prepared statements cannot be cached, and the
+    # ones asyncpg still prepares per query need names unique across every
+    # client; its default per-connection counter repeats them
+    connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+    echo=settings.DB_ECHO,
+    future=True,
+    poolclass=InstrumentedAsyncPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=connect_args,
 )
 
 AsyncSessionLocal = sessionmaker(
@@ -15,9 +80,25 @@ AsyncSessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+def get_pool_stats() -> dict:
+    """Snapshot of the connection pool for this worker process"""
+    pool = engine.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "wait_count": pool.wait_count,
+        "wait_seconds_total": round(pool.wait_seconds_total, 6),
+        "wait_seconds_max": round(pool.wait_seconds_max, 6),
+        "timeouts": pool.timeouts,
+    }
+
+
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
@@ -2,10 +2,18 @@
 Health check endpoint for load balancer and monitoring.
 """
 from fastapi import APIRouter, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Awaitable, Callable, Optional
+from sqlalchemy import text
+import asyncio
 import sys
+import time
+from app.config import settings
+from app.database import engine, get_pool_stats
+from app.services.cache import tenant_cache
 
 router = APIRouter(tags=["health"])
 
@@ -18,6 +26,70 @@ class HealthResponse(BaseModel):
     version: str
 
 
+async def _check_database() -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _check_redis() -> None:
+    from app.services.redis import redis_service
+    await redis_service.redis_client.ping()
+
+
+async def _check_s3() -> None:
+    from app.services.s3 import s3_service
+    await run_in_threadpool(
+        s3_service.s3_client.head_bucket, Bucket=s3_service.bucket_name
+    )
+
+
+async def _run_check(name: str, check: Callable[[], Awaitable[None]], required: bool) -> dict:
+    """Run one dependency check under READINESS_CHECK_TIMEOUT_SECONDS"""
+    start = time.perf_counter()
+    result = {"name": name, "required": required, "status": "ok"}
+    try:
+        await asyncio.wait_for(check(), timeout=settings.READINESS_CHECK_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        result["status"] = "timeout"
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    result["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return result
+
+
+# Last readiness result, reused for READINESS_CACHE_SECONDS
+_readiness: Optional[tuple[float, int, dict]] = None
+_readiness_lock = asyncio.Lock()
+
+
+async def _check_readiness() -> tuple[int, dict]:
+    global _readiness
+
+    async with _readiness_lock:
+        # Probes that arrive while a check runs share its result
+        if _readiness and _readiness[0] > time.monotonic():
+            return _readiness[1], _readiness[2]
+
+        checks = [_run_check("database", _check_database, required=True)]
+        if settings.READINESS_CHECK_REDIS:
+            checks.append(_run_check("redis", _check_redis, settings.READINESS_REQUIRE_REDIS))
+        if settings.READINESS_CHECK_S3 and settings.USE_S3:
+            checks.append(_run_check("s3", _check_s3, required=True))
+        results = await asyncio.gather(*checks)
+
+        ready = all(r["status"] == "ok" for r in results if r["required"])
+        degraded = any(r["status"] != "ok" for r in results)
+        status_code = status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        content = {
+            "status": ("degraded" if degraded else "ready") if ready else "not_ready",
+            "timestamp": datetime.utcnow().isoformat(),
+            "checks": {r.pop("name"): r for r in results},
+        }
+        _readiness = (time.monotonic() + settings.READINESS_CACHE_SECONDS, status_code, content)
+        return status_code, content
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -53,28 +125,23 @@ async def health_check():
     "/health/ready",
     status_code=status.HTTP_200_OK,
     summary="Readiness Check",
-    description="Returns readiness status - checks if service can accept traffic.",
+    description="Returns readiness status - checks database, Redis and optionally S3.",
 )
 async def readiness_check():
     """
     Readiness check endpoint.
 
-    Use this to verify the service is ready to accept traffic.
-    This can include checking database connectivity, cache availability, etc.
+    Runs `SELECT 1` through the app's connection pool, a Redis PING and
+    (if READINESS_CHECK_S3) a HEAD on the bucket, each with its own timeout.
+    Returns 503 when a required dependency fails, e.g. when no pooled
+    connection frees up in time. Results are cached for
+    READINESS_CACHE_SECONDS so frequent probes do not add load.
 
     Returns:
-        dict: Readiness status
+        dict: Readiness status with per-dependency status and latency
     """
-    # TODO: Add database connection check
-    # TODO: Add Redis connection check
-
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content={
-            "status": "ready",
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-    )
+    status_code, content = await _check_readiness()
+    return JSONResponse(status_code=status_code, content=content)
 
 
 @router.get(
@@ -100,3 +167,53 @@ async def liveness_check():
             "timestamp": datetime.utcnow().isoformat(),
         }
     )
+
+
+@router.get(
+    "/health/pool",
+    status_code=status.HTTP_200_OK,
+    summary="Database Pool Status",
+    description="Returns connection pool gauges for this worker process.",
+)
+async def pool_status():
+    """
+    Database connection pool status.
+
+    Reports checked-out and overflow connections plus cumulative time spent
+    waiting for a connection, for sizing RDS connections across tasks.
+
+    Returns:
+        dict: Pool gauges
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "timestamp": datetime.utcnow().isoformat(),
+            "pool": get_pool_stats(),
+        }
+    )
+
+
+@router.get(
+    "/health/cache",
+    status_code=status.HTTP_200_OK,
+    summary="Cache Status",
+    description="Returns read-through cache hit/miss counters for this worker process.",
+)
+async def cache_status():
+    """
+    Read-through cache status.
+
+    Counters are per namespace (company, drivers, ...) and reset when the
+    worker restarts.
+
+    Returns:
+        dict: Cache counters
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "timestamp": datetime.utcnow().isoformat(),
+            "cache": tenant_cache.stats(),
+        }
+    )
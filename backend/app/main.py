@@ -4,6 +4,17 @@ import logging
 from app.config import settings
 from app.api.v1.api import api_router
 from app.health import router as health_router
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import ORJSONResponse
+from app.services.job_queue import job_queue
+from app.core.passwords import password_hasher
+from app.database import engine, get_pool_stats
+from app.core.metrics import (
+    PrometheusMiddleware,
+    instrument_engine,
+    metrics_response,
+    register_pool_collector,
+)
 
 # Set up logging
 logging.basicConfig(
@@ -19,6 +30,7 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     redirect_slashes=False,  # Disable automatic slash redirects
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware - use configured origins
@@ -28,14 +40,41 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(PrometheusMiddleware)
+    instrument_engine(engine)
+    register_pool_collector(get_pool_stats)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus scrape endpoint"""
+        return metrics_response()
+
 # Include health check router (no prefix, at root level)
 app.include_router(health_router)
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.on_event("startup")
+async def start_job_runners():
+    """Run in-memory fallback jobs; Redis-queued jobs go to app.worker"""
+    job_queue.start_local_workers()
+
+
+@app.on_event("shutdown")
+async def stop_job_runners():
+    await job_queue.stop_local_workers()
+
+
+@app.on_event("shutdown")
+async def stop_password_hasher():
+    password_hasher.shutdown()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -0,0 +1,125 @@
+"""
+Database migration job
+
+    python -m app.migrate            # upgrade to the latest revision
+    python -m app.migrate --check    # exit 1 if migrations are pending
+
+Meant to run once per deploy as a one-off task before new app containers
+start, but safe to run from several containers at once: the first to take
+a Postgres advisory lock migrates, the rest wait and then find the
+database already at head. When nothing is pending it only reads the
+alembic_version table and exits.
+
+Holds a session-level lock, so point DATABASE_URL at Postgres directly
+rather than at PgBouncer in transaction mode.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, pool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.config import settings
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Databases built by the old startup scripts have the initial schema but
+# no alembic_version table; they are stamped here and upgraded from it
+BASELINE_REVISION = "3f4b24be8ae3"
+
+# Any constant works as long as every migration job uses the same one
+ADVISORY_LOCK_KEY = 72940311
+
+
+def alembic_config() -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return config
+
+
+def _current_heads(sync_conn) -> set:
+    return set(MigrationContext.configure(sync_conn).get_current_heads())
+
+
+def _upgrade(sync_conn, config: Config) -> None:
+    config.attributes["connection"] = sync_conn
+
+    tables = inspect(sync_conn).get_table_names()
+    if "alembic_version" not in tables and "companies" in tables:
+        print(f"Existing schema without migration history; stamping {BASELINE_REVISION}")
+        command.stamp(config, BASELINE_REVISION)
+
+    # Let Alembic manage its own transactions (CREATE INDEX CONCURRENTLY
+    # needs to step outside them)
+    sync_conn.commit()
+    command.upgrade(config, "head")
+
+
+async def migrate(check_only: bool = False, lock_timeout: float = 600) -> int:
+    config = alembic_config()
+    heads = set(ScriptDirectory.from_config(config).get_heads())
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+
+    try:
+        async with engine.connect() as conn:
+            current = await conn.run_sync(_current_heads)
+            if current == heads:
+                print(f"Database already at head ({', '.join(sorted(heads))})")
+                return 0
+            if check_only:
+                print(
+                    f"Migrations pending: database at {', '.join(sorted(current)) or 'no revision'}, "
+                    f"head is {', '.join(sorted(heads))}"
+                )
+                return 1
+
+            deadline = time.monotonic() + lock_timeout
+            lock = text("SELECT pg_try_advisory_lock(:key)")
+            while not await conn.scalar(lock, {"key": ADVISORY_LOCK_KEY}):
+                if time.monotonic() > deadline:
+                    print("Timed out waiting for another migration job to finish")
+                    return 1
+                print("Another migration job is running; waiting...")
+                await asyncio.sleep(2)
+            # The lock belongs to the session, so it outlives this commit
+            await conn.commit()
+
+            try:
+                if await conn.run_sync(_current_heads) == heads:
+                    print("Database was migrated by another job")
+                    return 0
+                await conn.run_sync(_upgrade, config)
+                await conn.commit()
+            finally:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY}
+                )
+                await conn.commit()
+    finally:
+        await engine.dispose()
+
+    print(f"Database migrated to {', '.join(sorted(heads))}")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run database migrations")
+    parser.add_argument(
+        "--check", action="store_true",
+        help="Only report whether migrations are pending (exit 1 if so)"
+    )
+    parser.add_argument(
+        "--lock-timeout", type=float, default=600,
+        help="Seconds to wait for a concurrent migration job"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(migrate(args.check, args.lock_timeout)))
+
+
+if __name__ == "__main__":
+    main()
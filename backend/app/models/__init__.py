@@ -12,6 +12,8 @@ from .payroll import Payroll
 from .lane import Lane
 from .expense import Expense
 from .fuel import Fuel
+from .refresh_token import RefreshToken
+from .api_key import ApiKey
 
 __all__ = [
     "Base",
@@ -27,5 +29,7 @@ __all__ = [
     "Payroll",
     "Lane",
     "Expense",
-    "Fuel"
+    "Fuel",
+    "RefreshToken",
+    "ApiKey"
 ]
\ No newline at end of file
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON
+from sqlalchemy.orm import relationship
+from .base import Base
+
+
+class ApiKey(Base):
+    """
+    Company API key for machine integrations (ELD, accounting)
+
+    Only the lookup prefix is stored in clear; the secret part is kept as
+    an HMAC-SHA256. Requests made with the key act as `user` and are
+    limited to `scopes`.
+    """
+    __tablename__ = "api_keys"
+
+    name = Column(String, nullable=False)
+    prefix = Column(String, unique=True, index=True, nullable=False)
+    secret_hash = Column(String, nullable=False)
+    scopes = Column(JSON, nullable=False, default=list)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    last_used_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Multi-tenant
+    company_id = Column(Integer, ForeignKey("companies.id"), index=True, nullable=False)
+    company = relationship("Company")
+
+    # The user the key acts as (its creator)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user = relationship("User")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Numeric, DateTime, ForeignKey, Integer, Enum
+from sqlalchemy import Column, String, Text, Numeric, DateTime, ForeignKey, Integer, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 from .base import Base
@@ -12,6 +12,18 @@ class LoadStatus(str, enum.Enum):
 
 class Load(Base):
     __tablename__ = "loads"
+    __table_args__ = (
+        # Dispatch board filters are always scoped to one company
+        Index("ix_loads_company_id_status", "company_id", "status"),
+        Index("ix_loads_company_id_pickup_date", "company_id", "pickup_date"),
+        Index("ix_loads_company_id_driver_id", "company_id", "driver_id"),
+        Index(
+            "ix_loads_company_id_load_number_prefix",
+            "company_id",
+            "load_number",
+            postgresql_ops={"load_number": "varchar_pattern_ops"},
+        ),
+    )
 
     load_number = Column(String, nullable=True, index=True)
     reference_number = Column(String)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime
+from sqlalchemy.orm import relationship
+from .base import Base
+
+
+class RefreshToken(Base):
+    """
+    Server-side record of an issued refresh token
+
+    Tokens issued from one login form a family; each refresh marks the
+    presented token used and issues the next one in the family. Presenting
+    a used token again means it leaked, so the whole family is revoked.
+    """
+    __tablename__ = "refresh_tokens"
+
+    jti = Column(String, unique=True, index=True, nullable=False)
+    family_id = Column(String, index=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    used_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+
+    user = relationship("User")
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
+from typing import List, Optional
+from app.core.api_keys import normalize_scopes
+
+
+class ApiKeyCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    scopes: List[str]  # e.g. ["loads:read", "fuel:write"] or ["*:read"]
+    expires_in_days: Optional[int] = Field(None, ge=1, le=3650)
+
+    @field_validator('scopes')
+    @classmethod
+    def validate_scopes(cls, v):
+        return normalize_scopes(v)
+
+
+class ApiKeyResponse(BaseModel):
+    id: int
+    name: str
+    prefix: str
+    scopes: List[str]
+    created_at: datetime
+    expires_at: Optional[datetime] = None
+    last_used_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+    user_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class ApiKeyCreated(ApiKeyResponse):
+    # Shown once; only a hash of the secret is stored
+    key: str
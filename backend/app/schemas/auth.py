@@ -125,5 +125,18 @@ class UserResponse(BaseModel):
 class LoginResponse(BaseModel):
     """Response after successful login"""
     access_token: str
+    refresh_token: str
     token_type: str
     user: UserResponse
+
+
+class RefreshRequest(BaseModel):
+    """Schema for refresh and logout requests"""
+    refresh_token: str
+
+
+class TokenResponse(BaseModel):
+    """New token pair issued by a refresh"""
+    access_token: str
+    refresh_token: str
+    token_type: str
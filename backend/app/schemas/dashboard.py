@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from datetime import date
+from decimal import Decimal
+from typing import Dict
+
+
+class RevenueBucket(BaseModel):
+    revenue: Decimal = Decimal("0")
+    loads: int = 0
+
+
+class DashboardSummary(BaseModel):
+    as_of: date
+    today: RevenueBucket
+    month: RevenueBucket
+    year: RevenueBucket
+    total_loads: int
+    loads_by_status: Dict[str, int]
+    total_drivers: int
+    total_trucks: int
+    total_customers: int
@@ -0,0 +1,14 @@
+import enum
+
+
+class ExportResource(str, enum.Enum):
+    loads = "loads"
+    invoices = "invoices"
+    fuel = "fuel"
+    expenses = "expenses"
+    payroll = "payroll"
+
+
+class ExportFormat(str, enum.Enum):
+    csv = "csv"
+    xlsx = "xlsx"
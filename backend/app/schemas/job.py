@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Optional
+from app.services.job_queue import JobStatus
+
+
+class JobQueued(BaseModel):
+    job_id: str
+    status: JobStatus
+    total: Optional[int] = None
+
+
+class JobResponse(BaseModel):
+    id: str
+    type: str
+    status: JobStatus
+    total: Optional[int] = None
+    completed: int
+    succeeded: int
+    failed: int
+    attempts: int
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -1,12 +1,22 @@
 from pydantic import BaseModel, field_validator
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
+import enum
 from app.models.load import LoadStatus
 from app.schemas.driver import DriverResponse
 from app.schemas.truck import TruckResponse
 
 
+class LoadSortField(str, enum.Enum):
+    id = "id"
+    load_number = "load_number"
+    pickup_date = "pickup_date"
+    delivery_date = "delivery_date"
+    rate = "rate"
+    created_at = "created_at"
+
+
 class LoadBase(BaseModel):
     load_number: str
     reference_number: Optional[str] = None
@@ -109,4 +119,19 @@ class LoadResponse(BaseModel):
     company_id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class LoadImportError(BaseModel):
+    row: int  # Spreadsheet row number; the header is row 1
+    field: Optional[str] = None
+    message: str
+
+
+class LoadImportResponse(BaseModel):
+    dry_run: bool
+    total_rows: int
+    imported: int
+    failed: int
+    ignored_columns: List[str] = []
+    errors: List[LoadImportError] = []
+    errors_truncated: bool = False
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from datetime import date
+from decimal import Decimal
+from typing import List
+
+
+class WeeklyTotals(BaseModel):
+    loads: int = 0
+    miles: int = 0
+    revenue: Decimal = Decimal("0")
+    expenses: Decimal = Decimal("0")
+    fuel: Decimal = Decimal("0")
+    profit: Decimal = Decimal("0")
+
+
+class DriverWeek(WeeklyTotals):
+    week_start: date
+    week_end: date
+
+
+class DriverWeeklyRow(BaseModel):
+    driver_id: int
+    driver_name: str
+    weeks: List[DriverWeek]
+    totals: WeeklyTotals
+
+
+class DriverWeeklyReport(BaseModel):
+    total_drivers: int
+    skip: int
+    limit: int
+    drivers: List[DriverWeeklyRow]
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import List, Optional
+import enum
+
+
+class SearchType(str, enum.Enum):
+    load = "load"
+    customer = "customer"
+    shipper = "shipper"
+    receiver = "receiver"
+    ratecon = "ratecon"
+    lane = "lane"
+
+
+class SearchHit(BaseModel):
+    type: SearchType
+    id: int
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    hits: List[SearchHit]
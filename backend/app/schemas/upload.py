@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+
+
+class UploadIntentRequest(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: Literal["application/pdf"] = "application/pdf"
+    size: Optional[int] = Field(None, gt=0)
+
+
+class UploadIntentResponse(BaseModel):
+    key: str
+    upload_url: str
+    fields: Dict[str, str]
+    expires_in: int
+    max_bytes: int
+
+
+class UploadCompleteRequest(BaseModel):
+    key: str
+    filename: Optional[str] = None
+    load_id: Optional[int] = None
+    document_type: Optional[Literal["pod", "ratecon"]] = None
+
+
+class UploadCompleteResponse(BaseModel):
+    filename: Optional[str] = None
+    key: str
+    url: str
+    size: int
+    content_type: str
+    etag: Optional[str] = None
+    load_id: Optional[int] = None
+
+
+class PresignedUrlBatchRequest(BaseModel):
+    files: List[str] = Field(..., min_length=1, max_length=200)
@@ -0,0 +1,112 @@
+"""
+Application server launcher
+
+    python -m app.server
+
+Runs a single uvicorn process in development. In production, or whenever
+SERVER_WORKERS is above one, gunicorn supervises that many uvicorn
+workers: it restarts crashed or hung workers, recycles them after
+SERVER_MAX_REQUESTS and drains them gracefully on deploys. Migrations
+run separately (python -m app.migrate), never in the workers. More than
+one worker requires the Redis job queue (JOB_QUEUE_USE_REDIS); without it
+the server falls back to a single worker.
+"""
+import os
+import shutil
+import tempfile
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+from app.config import settings
+
+APP = "app.main:app"
+
+
+def worker_count() -> int:
+    return settings.server_worker_count
+
+
+def uvicorn_options() -> dict:
+    return {
+        "loop": settings.SERVER_LOOP,
+        "http": settings.SERVER_HTTP,
+        "timeout_keep_alive": settings.SERVER_KEEPALIVE_SECONDS,
+        # Client IPs come from X-Forwarded-For behind the ALB
+        "proxy_headers": True,
+        "forwarded_allow_ips": "*",
+    }
+
+
+class TunedUvicornWorker(UvicornWorker):
+    """Uvicorn worker with the event loop, parser and keep-alive from Settings"""
+
+    CONFIG_KWARGS = uvicorn_options()
+
+
+class ProductionServer(BaseApplication):
+    """Gunicorn configured from Settings instead of a config file"""
+
+    def load_config(self):
+        options = {
+            "bind": f"{settings.SERVER_HOST}:{settings.PORT}",
+            "workers": worker_count(),
+            "worker_class": "app.server.TunedUvicornWorker",
+            "timeout": settings.SERVER_TIMEOUT_SECONDS,
+            "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+            "keepalive": settings.SERVER_KEEPALIVE_SECONDS,
+            "max_requests": settings.SERVER_MAX_REQUESTS,
+            "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+            "accesslog": "-" if settings.DEBUG else None,
+            "errorlog": "-",
+            "child_exit": _child_exit,
+        }
+        for key, value in options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        # Only reached in workers (no preload), so each builds its own
+        # engine and connection pool after the fork
+        from app.main import app
+        return app
+
+
+def _child_exit(server, worker) -> None:
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def _prepare_metrics_dir() -> None:
+    """Let the workers' Prometheus metrics be aggregated at /metrics"""
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+    else:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="prometheus-")
+
+
+def main() -> None:
+    workers = worker_count()
+    if workers < settings.requested_server_workers:
+        print(
+            f"⚠ Warning: {settings.requested_server_workers} server workers need "
+            "JOB_QUEUE_USE_REDIS=true and a job worker (python -m app.worker); "
+            "running a single worker"
+        )
+    if workers == 1 and not settings.is_production:
+        import uvicorn
+        uvicorn.run(
+            APP,
+            host=settings.SERVER_HOST,
+            port=settings.PORT,
+            reload=settings.SERVER_RELOAD,
+            **uvicorn_options(),
+        )
+        return
+
+    _prepare_metrics_dir()
+    print(f"Starting gunicorn with {workers} uvicorn workers on port {settings.PORT}")
+    ProductionServer().run()
+
+
+if __name__ == "__main__":
+    main()
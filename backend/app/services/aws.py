@@ -0,0 +1,58 @@
+"""
+Shared boto3 session and S3 client, created on first use
+
+Importing boto3 and loading a client's service model takes a noticeable
+share of startup time, so neither happens while the app is imported. The
+session is built once per process and every caller shares the same S3
+client, which is thread-safe once created.
+"""
+import threading
+from app.config import settings
+
+_session = None
+_s3_client = None
+_lock = threading.Lock()
+
+
+def get_boto3_session():
+    """Get or create the process-wide boto3 session"""
+    global _session
+
+    if _session is None:
+        with _lock:
+            if _session is None:
+                import boto3
+                # Empty credentials fall back to the default chain (task role)
+                _session = boto3.session.Session(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+                    region_name=settings.AWS_REGION,
+                )
+    return _session
+
+
+def get_s3_client():
+    """Get or create the shared, instrumented S3 client"""
+    global _s3_client
+
+    if _s3_client is None:
+        session = get_boto3_session()
+        with _lock:
+            if _s3_client is None:
+                from app.core.metrics import instrument_boto3_client
+                _s3_client = instrument_boto3_client(session.client(
+                    's3',
+                    endpoint_url=settings.S3_ENDPOINT_URL,
+                ))
+    return _s3_client
+
+
+def client_error():
+    """
+    botocore's ClientError, for `except client_error():`
+
+    Resolved only when an error is being matched, so modules that handle
+    S3 errors don't import botocore along with the app.
+    """
+    from botocore.exceptions import ClientError
+    return ClientError
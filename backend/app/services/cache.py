@@ -0,0 +1,206 @@
+"""
+Read-through cache for hot tenant reads, backed by Redis
+
+Keys are namespaced per company and carry a version number:
+
+    cache:{namespace}:{company_id}:v{version}:{params}
+
+Writes call `invalidate`, which bumps the version so every cached page for
+that company and namespace is skipped at once and simply ages out. A short
+lock per key lets one request rebuild an entry while the others wait for
+it. Any Redis failure falls back to the loader, and Redis is skipped for a
+few seconds after an error so an outage does not add latency to every
+request.
+"""
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Type
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from app.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER, finalize_page, paginate
+from app.core.responses import list_response
+from app.services.redis import redis_errors
+
+# Released only by the request that took it, and only if it still holds it
+_RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class TenantCache:
+    """Company-scoped read-through cache with version-bump invalidation"""
+
+    def __init__(
+        self,
+        enabled: bool,
+        ttl: int,
+        lock_ttl: float,
+        lock_wait: float,
+        retry_after: float,
+    ):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+        self.retry_after = retry_after
+        self._disabled_until = 0.0
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "lock_waits": 0, "errors": 0}
+        )
+
+    @staticmethod
+    def _redis():
+        from app.services.redis import redis_service
+        return redis_service.redis_client
+
+    @staticmethod
+    def _version_key(namespace: str, company_id: int) -> str:
+        return f"cache:{namespace}:{company_id}:version"
+
+    @staticmethod
+    def _params_digest(params: Optional[Dict[str, Any]]) -> str:
+        raw = json.dumps(params or {}, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+    def _available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._disabled_until
+
+    def _record_error(self, namespace: str, error: Exception) -> None:
+        self._stats[namespace]["errors"] += 1
+        self._disabled_until = time.monotonic() + self.retry_after
+        print(f"Cache error ({namespace}), reading from the database: {error}")
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        company_id: int,
+        params: Optional[Dict[str, Any]],
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Return the cached value for (namespace, company_id, params)
+
+        On a miss `loader` is awaited and its result, which must be JSON
+        serializable, is stored. Exceptions from the loader propagate
+        unchanged and are not cached.
+        """
+        if not self._available():
+            return await loader()
+
+        stats = self._stats[namespace]
+        try:
+            client = self._redis()
+            version = await client.get(self._version_key(namespace, company_id)) or 0
+            key = f"cache:{namespace}:{company_id}:v{version}:{self._params_digest(params)}"
+            cached = await client.get(key)
+            if cached is not None:
+                stats["hits"] += 1
+                return json.loads(cached)
+
+            stats["misses"] += 1
+            lock_key = f"{key}:lock"
+            token = uuid.uuid4().hex
+            locked = await client.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000))
+            if not locked:
+                # Someone else is rebuilding this entry; wait for it briefly
+                stats["lock_waits"] += 1
+                deadline = time.monotonic() + self.lock_wait
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(0.05)
+                    cached = await client.get(key)
+                    if cached is not None:
+                        return json.loads(cached)
+        except redis_errors() as e:
+            self._record_error(namespace, e)
+            return await loader()
+
+        try:
+            value = await loader()
+            try:
+                await client.set(key, json.dumps(value, default=str), ex=ttl or self.ttl)
+            except redis_errors() as e:
+                self._record_error(namespace, e)
+            return value
+        finally:
+            if locked:
+                try:
+                    await client.eval(_RELEASE_LOCK, 1, lock_key, token)
+                except redis_errors():
+                    pass  # The lock expires on its own
+
+    async def invalidate(self, namespace: str, company_id: int) -> None:
+        """Drop every cached entry of `namespace` for one company"""
+        if not self.enabled:
+            return
+        try:
+            key = self._version_key(namespace, company_id)
+            await self._redis().incr(key)
+            # Versions only need to outlive the entries they guard
+            await self._redis().expire(key, self.ttl * 10)
+        except redis_errors() as e:
+            self._record_error(namespace, e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-namespace hit/miss counters for this process"""
+        return {
+            "enabled": self.enabled,
+            "redis_available": self._available(),
+            "namespaces": {name: dict(counts) for name, counts in self._stats.items()},
+        }
+
+
+tenant_cache = TenantCache(
+    enabled=settings.CACHE_ENABLED,
+    ttl=settings.CACHE_TTL_SECONDS,
+    lock_ttl=settings.CACHE_LOCK_TTL_SECONDS,
+    lock_wait=settings.CACHE_LOCK_WAIT_SECONDS,
+    retry_after=settings.CACHE_RETRY_AFTER_SECONDS,
+)
+
+
+async def cached_page(
+    namespace: str,
+    company_id: int,
+    db: AsyncSession,
+    query: Select,
+    schema: Type[BaseModel],
+    sort_keys: Sequence[Any],
+    response: Response,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> Response:
+    """
+    One page of a tenant list endpoint, served through `tenant_cache`
+
+    Same contract as `paginate` + `finalize_page`: the rows come back as
+    `schema` dicts, rendered directly, with the next cursor (if any) in the
+    headers.
+    """
+    async def load() -> Dict[str, Any]:
+        page = Response()
+        result = await db.execute(paginate(query, sort_keys, cursor, skip, limit))
+        rows = finalize_page(result.scalars().all(), sort_keys, limit, page)
+        return {
+            "items": [schema.model_validate(row).model_dump(mode="json") for row in rows],
+            "next_cursor": page.headers.get(NEXT_CURSOR_HEADER),
+        }
+
+    page = await tenant_cache.get_or_load(
+        namespace, company_id, {"cursor": cursor, "skip": skip, "limit": limit}, load
+    )
+    if page["next_cursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+    # The items were validated against `schema` before they were cached
+    return list_response(page["items"], response)
@@ -1,8 +1,8 @@
-from typing import Optional
-import smtplib
+from typing import Any, Dict, List, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.config import settings
+from app.services.smtp_pool import SmtpConnectionPool
 
 
 class EmailService:
@@ -15,6 +15,59 @@ class EmailService:
         self.smtp_password = getattr(settings, 'SMTP_PASSWORD', None)
         self.from_email = getattr(settings, 'FROM_EMAIL', self.smtp_user)
         self.from_name = getattr(settings, 'FROM_NAME', 'Claude Trucking TMS')
+        self._pool: Optional[SmtpConnectionPool] = None
+
+    @property
+    def pool(self) -> SmtpConnectionPool:
+        """SMTP connection pool, created when the first email is sent"""
+        if self._pool is None:
+            self._pool = SmtpConnectionPool(
+                host=self.smtp_host,
+                port=self.smtp_port,
+                username=self.smtp_user,
+                password=self.smtp_password,
+                starttls=settings.SMTP_STARTTLS,
+                size=settings.SMTP_POOL_SIZE,
+                idle_timeout=settings.SMTP_IDLE_TIMEOUT_SECONDS,
+                timeout=settings.SMTP_TIMEOUT_SECONDS
+            )
+        return self._pool
+
+    @property
+    def is_configured(self) -> bool:
+        """False when emails should only be logged (no SMTP credentials)"""
+        return not settings.SMTP_AUTH or bool(self.smtp_user and self.smtp_password)
+
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None
+    ) -> MIMEMultipart:
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = f"{self.from_name} <{self.from_email}>"
+        msg['To'] = to_email
+
+        # Add text and HTML parts
+        if text_content:
+            msg.attach(MIMEText(text_content, 'plain'))
+        msg.attach(MIMEText(html_content, 'html'))
+        return msg
+
+    def _log_email(self, to_email: str, subject: str, html_content: str) -> None:
+        print(f"\n{'='*60}")
+        print(f"EMAIL SERVICE (Development Mode - SMTP not configured)")
+        print(f"{'='*60}")
+        print(f"To: {to_email}")
+        print(f"From: {self.from_name} <{self.from_email}>")
+        print(f"Subject: {subject}")
+        print(f"\n{'-'*60}")
+        print("HTML Content:")
+        print(f"{'-'*60}")
+        print(html_content)
+        print(f"{'='*60}\n")
 
     async def send_email(
         self,
@@ -24,54 +77,40 @@ class EmailService:
         text_content: Optional[str] = None
     ) -> bool:
         """Send an email"""
+        return (await self.send_batch([dict(
+            to_email=to_email,
+            subject=subject,
+            html_content=html_content,
+            text_content=text_content
+        )]))[0]
+
+    async def send_batch(self, emails: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Send several emails over the pooled SMTP connections
+
+        Each email is a dict of `send_email` arguments, e.g. from one of the
+        render_* methods. Returns one success flag per email, in order.
+        """
+        # If SMTP is not configured, log the emails instead
+        if not self.is_configured:
+            for email in emails:
+                self._log_email(email['to_email'], email['subject'], email['html_content'])
+            return [True] * len(emails)
+
         try:
-            # If SMTP is not configured, log the email instead
-            if not self.smtp_user or not self.smtp_password:
-                print(f"\n{'='*60}")
-                print(f"EMAIL SERVICE (Development Mode - SMTP not configured)")
-                print(f"{'='*60}")
-                print(f"To: {to_email}")
-                print(f"From: {self.from_name} <{self.from_email}>")
-                print(f"Subject: {subject}")
-                print(f"\n{'-'*60}")
-                print("HTML Content:")
-                print(f"{'-'*60}")
-                print(html_content)
-                print(f"{'='*60}\n")
-                return True
-
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = to_email
-
-            # Add text and HTML parts
-            if text_content:
-                part1 = MIMEText(text_content, 'plain')
-                msg.attach(part1)
-
-            part2 = MIMEText(html_content, 'html')
-            msg.attach(part2)
-
-            # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
-
-            return True
+            messages = [self._build_message(**email) for email in emails]
+            return await self.pool.send_many(messages)
         except Exception as e:
             print(f"Error sending email: {str(e)}")
-            return False
+            return [False] * len(emails)
 
-    async def send_verification_email(
+    def render_verification_email(
         self,
         to_email: str,
         username: str,
         verification_token: str
-    ) -> bool:
-        """Send email verification email"""
+    ) -> Dict[str, Any]:
+        """Build the email verification email"""
         verification_url = f"{settings.FRONTEND_URL}/verify-email?token={verification_token}"
 
         html_content = f"""
@@ -133,20 +172,20 @@ class EmailService:
         If you didn't create an account with Claude Trucking TMS, please ignore this email.
         """
 
-        return await self.send_email(
+        return dict(
             to_email=to_email,
             subject="Verify Your Email - Claude Trucking TMS",
             html_content=html_content,
             text_content=text_content
         )
 
-    async def send_welcome_email(
+    def render_welcome_email(
         self,
         to_email: str,
         username: str,
         company_name: str
-    ) -> bool:
-        """Send welcome email after verification"""
+    ) -> Dict[str, Any]:
+        """Build the welcome email sent after verification"""
         login_url = f"{settings.FRONTEND_URL}/login"
 
         html_content = f"""
@@ -198,21 +237,21 @@ class EmailService:
         </html>
         """
 
-        return await self.send_email(
+        return dict(
             to_email=to_email,
             subject="Welcome to Claude Trucking TMS!",
             html_content=html_content
         )
 
-    async def send_user_invitation_email(
+    def render_user_invitation_email(
         self,
         to_email: str,
         invited_by: str,
         company_name: str,
         temporary_password: str,
         username: str
-    ) -> bool:
-        """Send invitation email to new user added by admin"""
+    ) -> Dict[str, Any]:
+        """Build the invitation email for a user added by an admin"""
         login_url = f"{settings.FRONTEND_URL}/login"
 
         html_content = f"""
@@ -268,12 +307,49 @@ class EmailService:
         </html>
         """
 
-        return await self.send_email(
+        return dict(
             to_email=to_email,
             subject=f"Invitation to Join {company_name} - Claude Trucking TMS",
             html_content=html_content
         )
 
+    async def send_verification_email(
+        self,
+        to_email: str,
+        username: str,
+        verification_token: str
+    ) -> bool:
+        """Send email verification email"""
+        return await self.send_email(
+            **self.render_verification_email(to_email, username, verification_token)
+        )
+
+    async def send_welcome_email(
+        self,
+        to_email: str,
+        username: str,
+        company_name: str
+    ) -> bool:
+        """Send welcome email after verification"""
+        return await self.send_email(
+            **self.render_welcome_email(to_email, username, company_name)
+        )
+
+    async def send_user_invitation_email(
+        self,
+        to_email: str,
+        invited_by: str,
+        company_name: str,
+        temporary_password: str,
+        username: str
+    ) -> bool:
+        """Send invitation email to new user added by admin"""
+        return await self.send_email(
+            **self.render_user_invitation_email(
+                to_email, invited_by, company_name, temporary_password, username
+            )
+        )
+
 
 # Singleton instance
 email_service = EmailService()
@@ -0,0 +1,420 @@
+"""
+Streaming CSV and XLSX exports for accounting
+
+Rows come off a server-side cursor EXPORT_BATCH_SIZE at a time and are
+written straight into the response body, so an export holds one batch in
+memory however many rows it has, and its first bytes leave before the
+query has produced its first row.
+
+XLSX is written as a zip stream by hand: openpyxl and xlsxwriter only
+assemble a workbook once every row is in, which defeats streaming. The
+sheet uses inline strings, so nothing has to be collected up front.
+"""
+import csv
+import enum
+import io
+import math
+import re
+import zipfile
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+from sqlalchemy import func, select
+from sqlalchemy.sql import Select
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.customer import Customer
+from app.models.driver import Driver
+from app.models.expense import Expense
+from app.models.fuel import Fuel
+from app.models.invoice import Invoice
+from app.models.load import Load
+from app.models.payroll import Payroll
+from app.models.truck import Truck
+from app.schemas.export import ExportFormat, ExportResource
+
+Batches = AsyncIterator[Sequence[Sequence[Any]]]
+
+MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv; charset=utf-8",
+    ExportFormat.xlsx: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _in_range(column, start_date: Optional[date], end_date: Optional[date]) -> List[Any]:
+    """Both ends inclusive, for DATE and TIMESTAMP columns alike"""
+    conditions = []
+    if start_date:
+        conditions.append(column >= start_date)
+    if end_date:
+        conditions.append(column < end_date + timedelta(days=1))
+    return conditions
+
+
+def _driver_name():
+    return Driver.first_name + " " + Driver.last_name
+
+
+def _loads(company_id: int, start_date: Optional[date], end_date: Optional[date]):
+    columns = [
+        ("Load #", Load.load_number),
+        ("Reference #", Load.reference_number),
+        ("Status", Load.status),
+        ("Customer", Customer.name),
+        ("Driver", _driver_name()),
+        ("Truck", Truck.truck_number),
+        ("Pickup location", Load.pickup_location),
+        ("Delivery location", Load.delivery_location),
+        ("Pickup date", Load.pickup_date),
+        ("Delivery date", Load.delivery_date),
+        ("Miles", Load.miles),
+        ("Rate", Load.rate),
+        ("Fuel surcharge", Load.fuel_surcharge),
+        ("Accessorial charges", Load.accessorial_charges),
+        ("Total amount", Load.total_amount),
+        ("Carrier rate", Load.carrier_rate),
+    ]
+    query = (
+        select(*(column for _, column in columns))
+        .select_from(Load)
+        .outerjoin(Customer, Customer.id == Load.customer_id)
+        .outerjoin(Driver, Driver.id == Load.driver_id)
+        .outerjoin(Truck, Truck.id == Load.truck_id)
+        .where(Load.company_id == company_id, *_in_range(Load.pickup_date, start_date, end_date))
+        .order_by(Load.pickup_date, Load.id)
+    )
+    return columns, query
+
+
+def _invoices(company_id: int, start_date: Optional[date], end_date: Optional[date]):
+    columns = [
+        ("Invoice #", Invoice.invoice_number),
+        ("Load #", Load.load_number),
+        ("Customer", Customer.name),
+        ("Status", Invoice.status),
+        ("Issue date", Invoice.issue_date),
+        ("Due date", Invoice.due_date),
+        ("Subtotal", Invoice.subtotal),
+        ("Tax", Invoice.tax_amount),
+        ("Total", Invoice.total_amount),
+        ("Paid", Invoice.amount_paid),
+        ("Due", Invoice.total_amount - func.coalesce(Invoice.amount_paid, 0)),
+        ("Payment date", Invoice.payment_date),
+        ("Payment method", Invoice.payment_method),
+        ("Payment reference", Invoice.payment_reference),
+    ]
+    # Invoices belong to a company through their load
+    query = (
+        select(*(column for _, column in columns))
+        .select_from(Invoice)
+        .join(Load, Load.id == Invoice.load_id)
+        .outerjoin(Customer, Customer.id == Load.customer_id)
+        .where(Load.company_id == company_id, *_in_range(Invoice.issue_date, start_date, end_date))
+        .order_by(Invoice.issue_date, Invoice.id)
+    )
+    return columns, query
+
+
+def _fuel(company_id: int, start_date: Optional[date], end_date: Optional[date]):
+    columns = [
+        ("Date", Fuel.date),
+        ("Driver", _driver_name()),
+        ("Truck", Truck.truck_number),
+        ("Load #", Load.load_number),
+        ("Location", Fuel.location),
+        ("Gallons", Fuel.gallons),
+        ("Price per gallon", Fuel.price_per_gallon),
+        ("Total", Fuel.total_amount),
+        ("Odometer", Fuel.odometer),
+        ("Notes", Fuel.notes),
+    ]
+    query = (
+        select(*(column for _, column in columns))
+        .select_from(Fuel)
+        .outerjoin(Driver, Driver.id == Fuel.driver_id)
+        .outerjoin(Truck, Truck.id == Fuel.truck_id)
+        .outerjoin(Load, Load.id == Fuel.load_id)
+        .where(Fuel.company_id == company_id, *_in_range(Fuel.date, start_date, end_date))
+        .order_by(Fuel.date, Fuel.id)
+    )
+    return columns, query
+
+
+def _expenses(company_id: int, start_date: Optional[date], end_date: Optional[date]):
+    columns = [
+        ("Date", Expense.date),
+        ("Category", Expense.category),
+        ("Description", Expense.description),
+        ("Amount", Expense.amount),
+        ("Vendor", Expense.vendor),
+        ("Payment method", Expense.payment_method),
+        ("Receipt #", Expense.receipt_number),
+        ("Driver", _driver_name()),
+        ("Truck", Truck.truck_number),
+        ("Load #", Load.load_number),
+    ]
+    query = (
+        select(*(column for _, column in columns))
+        .select_from(Expense)
+        .outerjoin(Driver, Driver.id == Expense.driver_id)
+        .outerjoin(Truck, Truck.id == Expense.truck_id)
+        .outerjoin(Load, Load.id == Expense.load_id)
+        .where(Expense.company_id == company_id, *_in_range(Expense.date, start_date, end_date))
+        .order_by(Expense.date, Expense.id)
+    )
+    return columns, query
+
+
+def _payroll(company_id: int, start_date: Optional[date], end_date: Optional[date]):
+    deductions = (
+        Payroll.dispatch_fee + Payroll.insurance + Payroll.fuel + Payroll.parking
+        + Payroll.trailer + Payroll.misc + Payroll.escrow
+    )
+    columns = [
+        ("Week start", Payroll.week_start),
+        ("Week end", Payroll.week_end),
+        ("Driver", _driver_name()),
+        ("Type", Payroll.type),
+        ("Gross", Payroll.gross),
+        ("Extra", Payroll.extra),
+        ("Dispatch fee", Payroll.dispatch_fee),
+        ("Insurance", Payroll.insurance),
+        ("Fuel", Payroll.fuel),
+        ("Parking", Payroll.parking),
+        ("Trailer", Payroll.trailer),
+        ("Misc", Payroll.misc),
+        ("Escrow", Payroll.escrow),
+        ("Check amount", Payroll.gross + Payroll.extra - deductions),
+        ("Miles", Payroll.miles),
+    ]
+    query = (
+        select(*(column for _, column in columns))
+        .select_from(Payroll)
+        .outerjoin(Driver, Driver.id == Payroll.driver_id)
+        .where(Payroll.company_id == company_id, *_in_range(Payroll.week_start, start_date, end_date))
+        .order_by(Payroll.week_start, Payroll.id)
+    )
+    return columns, query
+
+
+_QUERIES: Dict[ExportResource, Callable[..., Tuple[list, Select]]] = {
+    ExportResource.loads: _loads,
+    ExportResource.invoices: _invoices,
+    ExportResource.fuel: _fuel,
+    ExportResource.expenses: _expenses,
+    ExportResource.payroll: _payroll,
+}
+
+
+async def _stream_rows(query: Select) -> Batches:
+    """
+    Batches of rows from a server-side cursor
+
+    Uses a session of its own: the body is sent after the endpoint returns,
+    so it cannot rely on the request's session still being open.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+
+# CSV
+
+# Leading characters that make a spreadsheet treat a cell as a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, str):
+        # Free text such as customer names comes from users; keep it inert
+        return "'" + value if value.startswith(_FORMULA_PREFIXES) else value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+async def csv_chunks(headers: List[str], batches: Batches) -> AsyncIterator[bytes]:
+    """A CSV file, one chunk per batch of rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    # The byte order mark makes Excel open the file as UTF-8
+    yield ("\ufeff" + buffer.getvalue()).encode()
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode()
+
+
+# XLSX
+
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+
+_CONTENT_TYPES = (
+    _XML + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    f'<Override PartName="/xl/workbook.xml" ContentType="{_CONTENT_TYPE}.sheet.main+xml"/>'
+    f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="{_CONTENT_TYPE}.worksheet+xml"/>'
+    f'<Override PartName="/xl/styles.xml" ContentType="{_CONTENT_TYPE}.styles+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = (
+    _XML + f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK = (
+    _XML + f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+_WORKBOOK_RELS = (
+    _XML + f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+# Cell styles: 0 plain, 1 bold (header), 2 date, 3 date and time
+_STYLES = (
+    _XML + f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<numFmts count="2"><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/>'
+    '<numFmt numFmtId="165" formatCode="yyyy-mm-dd hh:mm"/></numFmts>'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '</cellXfs></styleSheet>'
+)
+# The header row stays in view while scrolling
+_SHEET_START = (
+    _XML + f'<worksheet xmlns="{_MAIN_NS}"><sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '</sheetView></sheetViews><sheetData>'
+)
+_SHEET_END = '</sheetData></worksheet>'
+
+# Characters XML 1.0 cannot carry at all
+_ILLEGAL_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+class _Pipe:
+    """Write-only, unseekable file that hands over what was written so far"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _xlsx_cell(ref: str, value: Any, style: int = 0) -> str:
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, datetime):
+        serial = (value.replace(tzinfo=None) - _EXCEL_EPOCH) / timedelta(days=1)
+        return f'<c r="{ref}" s="3"><v>{serial!r}</v></c>'
+    if isinstance(value, date):
+        return f'<c r="{ref}" s="2"><v>{(value - _EXCEL_EPOCH.date()).days}</v></c>'
+    if isinstance(value, (int, Decimal)) or (isinstance(value, float) and math.isfinite(value)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    text = escape(_ILLEGAL_XML.sub("", str(value)))
+    styled = f' s="{style}"' if style else ""
+    return f'<c r="{ref}" t="inlineStr"{styled}><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(number: int, letters: List[str], values: Sequence[Any], style: int = 0) -> str:
+    cells = "".join(
+        _xlsx_cell(f"{letter}{number}", value, style)
+        for letter, value in zip(letters, values)
+        if value is not None
+    )
+    return f'<row r="{number}">{cells}</row>'
+
+
+async def xlsx_chunks(headers: List[str], batches: Batches, sheet_name: str = "Export") -> AsyncIterator[bytes]:
+    """
+    An XLSX workbook with one sheet, one chunk per batch of rows
+
+    Excel opens at most 1,048,576 rows per sheet; larger exports should
+    use CSV.
+    """
+    pipe = _Pipe()
+    letters = [_column_letter(i) for i in range(len(headers))]
+    with zipfile.ZipFile(pipe, "w", compression=zipfile.ZIP_DEFLATED) as workbook:
+        workbook.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        workbook.writestr("_rels/.rels", _ROOT_RELS)
+        workbook.writestr("xl/workbook.xml", _WORKBOOK.format(name=escape(sheet_name[:31])))
+        workbook.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        workbook.writestr("xl/styles.xml", _STYLES)
+        # The sheet's size is unknown until the cursor runs dry
+        with workbook.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write((_SHEET_START + _xlsx_row(1, letters, headers, style=1)).encode())
+            yield pipe.take()
+
+            number = 1
+            async for rows in batches:
+                parts = []
+                for row in rows:
+                    number += 1
+                    parts.append(_xlsx_row(number, letters, row))
+                sheet.write("".join(parts).encode())
+                chunk = pipe.take()
+                if chunk:
+                    yield chunk
+            sheet.write(_SHEET_END.encode())
+    yield pipe.take()
+
+
+def export_stream(
+    resource: ExportResource,
+    export_format: ExportFormat,
+    company_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> AsyncIterator[bytes]:
+    """The body of an export of `resource` for one company, as a byte stream"""
+    columns, query = _QUERIES[resource](company_id, start_date, end_date)
+    headers = [header for header, _ in columns]
+    batches = _stream_rows(query)
+    if export_format == ExportFormat.xlsx:
+        return xlsx_chunks(headers, batches, sheet_name=resource.value.capitalize())
+    return csv_chunks(headers, batches)
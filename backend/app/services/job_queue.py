@@ -0,0 +1,400 @@
+"""
+Background job queue for work that should not hold up an HTTP request
+
+Jobs are JSON records. With JOB_QUEUE_USE_REDIS they are pushed onto a Redis
+list and run by the separate worker process (`python -m app.worker`), so they
+survive API restarts and deploys. Without Redis, or when Redis cannot be
+reached at enqueue time, they fall back to an in-memory queue drained by a
+few tasks inside the API process. That record lives only in the process
+that queued it, so the fallback is limited to a single API worker; with
+more than one, queuing without Redis fails with a 503 instead of creating
+a job the other workers would report as missing, unless the caller asks
+for the in-process fallback (see `JobQueue.enqueue`).
+"""
+import asyncio
+import enum
+import json
+import logging
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from fastapi import HTTPException, status
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "jobs:pending"
+PROCESSING_KEY = "jobs:processing"
+
+# Progress is written back at most this often while a job runs
+PROGRESS_FLUSH_SECONDS = 1.0
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+class JobProgress:
+    """Handed to a running job so it can report how far it has got"""
+
+    def __init__(self, queue: "JobQueue", job: Dict[str, Any]):
+        self._queue = queue
+        self._job = job
+        self._flushed_at = time.monotonic()
+
+    async def set_total(self, total: int) -> None:
+        self._job["total"] = total
+        await self.flush()
+
+    async def advance(self, succeeded: bool = True) -> None:
+        """Count one finished unit of work"""
+        self._job["completed"] += 1
+        if succeeded:
+            self._job["succeeded"] += 1
+        else:
+            self._job["failed"] += 1
+        if time.monotonic() - self._flushed_at >= PROGRESS_FLUSH_SECONDS:
+            await self.flush()
+
+    async def flush(self) -> None:
+        self._flushed_at = time.monotonic()
+        await self._queue._save(self._job)
+
+    async def done_before(self) -> Set[str]:
+        """Keys marked done by earlier attempts at this job"""
+        return await self._queue._done_keys(self._job)
+
+    async def mark_done(self, key: str) -> None:
+        """
+        Record that the unit of work `key` must not be repeated
+
+        Written straight away rather than with the next flush, so a retry
+        after a crash repeats at most the work that was in flight.
+        """
+        await self._queue._mark_done(self._job, key)
+
+
+Handler = Callable[[Dict[str, Any], JobProgress], Awaitable[Any]]
+
+
+class JobQueue:
+    """
+    Redis-backed job queue with an in-process fallback
+
+    Handlers are registered per job type with `@job_queue.handler("type")`
+    and receive the job payload plus a `JobProgress`. Whatever they return
+    becomes the job's result; an exception marks the job failed.
+    """
+
+    def __init__(
+        self,
+        use_redis: bool,
+        result_ttl: int,
+        max_attempts: int,
+        local_concurrency: int,
+        worker_name: Optional[str] = None,
+        single_process: bool = True,
+    ):
+        self.use_redis = use_redis
+        self.single_process = single_process
+        self.result_ttl = result_ttl
+        self.max_attempts = max(1, max_attempts)
+        self.local_concurrency = max(1, local_concurrency)
+        self.worker_name = worker_name or socket.gethostname()
+        self._handlers: Dict[str, Handler] = {}
+        self._local_jobs: Dict[str, Dict[str, Any]] = {}
+        self._local_expiry: Dict[str, float] = {}
+        self._local_queue: Optional[asyncio.Queue] = None
+        self._local_tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    @staticmethod
+    def _redis():
+        from app.services.redis import redis_service
+        return redis_service.redis_client
+
+    @staticmethod
+    def _record_key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    @staticmethod
+    def _done_key(job_id: str) -> str:
+        return f"job:{job_id}:done"
+
+    def handler(self, job_type: str) -> Callable[[Handler], Handler]:
+        """Register the coroutine that runs jobs of `job_type`"""
+        def register(func: Handler) -> Handler:
+            self._handlers[job_type] = func
+            return func
+        return register
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        company_id: Optional[int] = None,
+        total: Optional[int] = None,
+        local_fallback: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Queue a job and return its record without waiting for it to run
+
+        With several server workers, a job that can't reach Redis is refused
+        with a 503, since its status would not be found on the others. Pass
+        `local_fallback` when the work matters more than its status, e.g.
+        an email queued after the request's data is already committed: the
+        job then runs in this process anyway.
+        """
+        job = {
+            "id": uuid.uuid4().hex,
+            "type": job_type,
+            "company_id": company_id,
+            "status": JobStatus.QUEUED.value,
+            "payload": payload,
+            "total": total,
+            "completed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "attempts": 0,
+            "result": None,
+            "error": None,
+            "backend": "redis",
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+        }
+
+        if self.use_redis:
+            try:
+                client = self._redis()
+                await client.set(
+                    self._record_key(job["id"]),
+                    json.dumps(job, default=str),
+                    ex=self.result_ttl,
+                )
+                await client.lpush(PENDING_KEY, job["id"])
+                return job
+            except Exception as e:
+                if not (self.single_process or local_fallback):
+                    logger.error("Job queue: Redis unavailable, cannot queue %s: %s", job_type, e)
+                    raise HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail="Background jobs are unavailable, please try again",
+                        headers={"Retry-After": "5"}
+                    )
+                logger.warning("Job queue: Redis unavailable, running %s in-process: %s", job_type, e)
+        elif not (self.single_process or local_fallback):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Background jobs need JOB_QUEUE_USE_REDIS with more than one server worker"
+            )
+
+        job["backend"] = "memory"
+        self._prune_local()
+        self._local_jobs[job["id"]] = job
+        self._get_local_queue().put_nowait(job["id"])
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current record for `job_id`, or None if unknown or expired"""
+        job = self._local_jobs.get(job_id)
+        if job is not None or not self.use_redis:
+            return job
+        try:
+            raw = await self._redis().get(self._record_key(job_id))
+        except Exception as e:
+            logger.warning("Job queue: failed to read job %s: %s", job_id, e)
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _save(self, job: Dict[str, Any]) -> None:
+        if job["backend"] != "redis":
+            return  # In-memory records are updated in place
+        try:
+            await self._redis().set(
+                self._record_key(job["id"]),
+                json.dumps(job, default=str),
+                ex=self.result_ttl,
+            )
+        except Exception as e:
+            logger.warning("Job queue: failed to save job %s: %s", job["id"], e)
+
+    async def _done_keys(self, job: Dict[str, Any]) -> Set[str]:
+        if job["backend"] != "redis":
+            return set()  # In-memory jobs die with their process and never rerun
+        try:
+            return set(await self._redis().smembers(self._done_key(job["id"])))
+        except Exception as e:
+            logger.warning("Job queue: failed to read progress of job %s: %s", job["id"], e)
+            return set()
+
+    async def _mark_done(self, job: Dict[str, Any], key: str) -> None:
+        if job["backend"] != "redis":
+            return
+        try:
+            done_key = self._done_key(job["id"])
+            async with self._redis().pipeline(transaction=False) as pipe:
+                pipe.sadd(done_key, key)
+                pipe.expire(done_key, self.result_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Job queue: failed to record progress of job %s: %s", job["id"], e)
+
+    async def _run(self, job: Dict[str, Any]) -> None:
+        job["status"] = JobStatus.RUNNING.value
+        job["started_at"] = _now()
+        job["attempts"] += 1
+        job["completed"] = job["succeeded"] = job["failed"] = 0
+        await self._save(job)
+
+        try:
+            handler = self._handlers.get(job["type"])
+            if handler is None:
+                raise LookupError(f"No handler registered for job type '{job['type']}'")
+            job["result"] = await handler(job["payload"], JobProgress(self, job))
+            job["status"] = JobStatus.COMPLETED.value
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job["id"], job["type"])
+            job["status"] = JobStatus.FAILED.value
+            job["error"] = str(e)
+
+        job["finished_at"] = _now()
+        # Payloads can hold credentials (invitation emails); keep only the outcome
+        job["payload"] = None
+        await self._save(job)
+
+    # In-process fallback
+
+    def _get_local_queue(self) -> asyncio.Queue:
+        if self._local_queue is None:
+            self._local_queue = asyncio.Queue()
+        return self._local_queue
+
+    def _prune_local(self) -> None:
+        now = time.monotonic()
+        for job_id, job in list(self._local_jobs.items()):
+            if job["finished_at"] is None:
+                continue
+            expires_at = self._local_expiry.setdefault(job_id, now + self.result_ttl)
+            if expires_at <= now:
+                del self._local_jobs[job_id]
+                del self._local_expiry[job_id]
+
+    async def _local_worker(self) -> None:
+        queue = self._get_local_queue()
+        while True:
+            job_id = await queue.get()
+            try:
+                job = self._local_jobs.get(job_id)
+                if job is not None:
+                    await self._run(job)
+            finally:
+                queue.task_done()
+
+    def start_local_workers(self) -> None:
+        """Start draining the in-memory queue; call from the app's startup hook"""
+        if self._local_tasks:
+            return
+        self._local_tasks = [
+            asyncio.create_task(self._local_worker())
+            for _ in range(self.local_concurrency)
+        ]
+
+    async def stop_local_workers(self) -> None:
+        for task in self._local_tasks:
+            task.cancel()
+        await asyncio.gather(*self._local_tasks, return_exceptions=True)
+        self._local_tasks = []
+
+    # Redis worker process
+
+    def stop(self) -> None:
+        """Ask `run_worker` to stop taking new jobs"""
+        self._stopping.set()
+
+    async def run_worker(self, concurrency: int) -> None:
+        """
+        Take jobs off the Redis queue until `stop` is called
+
+        Each job is moved atomically onto this worker's own processing list
+        while it runs, so a job in flight when the worker dies is put back
+        on the queue the next time a worker with the same name starts.
+        After JOB_MAX_ATTEMPTS such restarts it is marked failed instead.
+        """
+        client = self._redis()
+        processing = f"{PROCESSING_KEY}:{self.worker_name}"
+        recovered = False
+
+        slots = asyncio.Semaphore(max(1, concurrency))
+        running: set = set()
+
+        while not self._stopping.is_set():
+            await slots.acquire()
+            try:
+                if not recovered:
+                    # Requeue whatever a previous run of this worker left behind
+                    while await client.rpoplpush(processing, PENDING_KEY) is not None:
+                        pass
+                    recovered = True
+                job_id = await client.blmove(PENDING_KEY, processing, 5, "RIGHT", "LEFT")
+            except Exception as e:
+                slots.release()
+                logger.warning("Job queue: Redis error, retrying: %s", e)
+                await asyncio.sleep(5)
+                continue
+
+            if job_id is None:
+                slots.release()
+                continue
+
+            task = asyncio.create_task(self._process(job_id, processing, slots))
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        # Let jobs already taken finish before exiting
+        await asyncio.gather(*running, return_exceptions=True)
+
+    async def _process(self, job_id: str, processing: str, slots: asyncio.Semaphore) -> None:
+        client = self._redis()
+        try:
+            raw = await client.get(self._record_key(job_id))
+            if not raw:
+                logger.warning("Job queue: record for job %s has expired, dropping it", job_id)
+                return
+
+            job = json.loads(raw)
+            if job["attempts"] >= self.max_attempts:
+                job["status"] = JobStatus.FAILED.value
+                job["error"] = "Job was interrupted too many times"
+                job["finished_at"] = _now()
+                await self._save(job)
+                return
+
+            await self._run(job)
+        except Exception:
+            logger.exception("Job queue: failed to process job %s", job_id)
+        finally:
+            try:
+                await client.lrem(processing, 1, job_id)
+            except Exception as e:
+                logger.warning("Job queue: failed to acknowledge job %s: %s", job_id, e)
+            slots.release()
+
+
+job_queue = JobQueue(
+    use_redis=settings.JOB_QUEUE_USE_REDIS,
+    result_ttl=settings.JOB_RESULT_TTL_SECONDS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    local_concurrency=settings.JOB_LOCAL_CONCURRENCY,
+    worker_name=settings.JOB_WORKER_NAME,
+    single_process=settings.server_worker_count == 1,
+)
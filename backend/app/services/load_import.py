@@ -0,0 +1,314 @@
+"""
+Bulk load import from CSV or XLSX
+
+The file is read a batch at a time, so memory stays flat however many rows
+it has. For each batch, customer, driver and truck references are resolved
+with one query per table, the rows are validated against LoadCreate, and
+the valid ones are written with a single COPY. All parsing and validation
+runs on the threadpool. Rows that fail are reported with their spreadsheet
+row number and skipped; everything else is committed in one transaction.
+"""
+import csv
+import enum
+import io
+import re
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.models.customer import Customer
+from app.models.driver import Driver
+from app.models.load import Load
+from app.models.truck import Truck
+from app.schemas.load import LoadCreate
+
+# Spreadsheet columns that name a related record instead of giving its id
+REFERENCE_COLUMNS = {
+    "customer": "customer_name",
+    "customer_name": "customer_name",
+    "driver": "driver_name",
+    "driver_name": "driver_name",
+    "truck": "truck_number",
+    "truck_number": "truck_number",
+}
+
+# Written by COPY in this order; id and timestamps come from column defaults
+COPY_COLUMNS = list(LoadCreate.model_fields) + ["company_id"]
+
+# Marks a name that matches more than one record
+AMBIGUOUS = -1
+
+
+def _column_name(header: Any) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", str(header or "").strip().lower()).strip("_")
+
+
+def _cell(value: Any) -> Any:
+    """Normalize a CSV or XLSX cell; blanks become None so defaults apply"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # Excel stores every number as a float
+    text = str(value).strip()
+    return text or None
+
+
+class _Rows:
+    """Iterates (row number, {column: value}) over an uploaded CSV or XLSX file"""
+
+    def __init__(self, file: UploadFile):
+        name = (file.filename or "").lower()
+        self._workbook = None
+        if name.endswith(".xlsx"):
+            from openpyxl import load_workbook
+            try:
+                self._workbook = load_workbook(file.file, read_only=True, data_only=True)
+            except Exception:
+                raise HTTPException(status_code=400, detail="Could not read the XLSX file")
+            raw: Iterator[Iterable[Any]] = self._workbook.active.iter_rows(values_only=True)
+        elif name.endswith(".csv"):
+            text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+            raw = csv.reader(text)
+        else:
+            raise HTTPException(status_code=400, detail="Upload a .csv or .xlsx file")
+
+        try:
+            header = next(raw)
+        except (StopIteration, UnicodeDecodeError, csv.Error):
+            raise HTTPException(status_code=400, detail="The file has no header row")
+
+        self.columns = [_column_name(h) for h in header]
+        known = set(LoadCreate.model_fields) | set(REFERENCE_COLUMNS)
+        self.ignored = sorted({c for c in self.columns if c and c not in known})
+        if "load_number" not in self.columns:
+            raise HTTPException(status_code=400, detail="The file needs a load_number column")
+        if not {"customer_id", "customer", "customer_name"} & set(self.columns):
+            raise HTTPException(
+                status_code=400, detail="The file needs a customer or customer_id column"
+            )
+        self._raw = raw
+        self._row_number = 1
+
+    def take(self, count: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """The next `count` non-blank rows"""
+        batch = []
+        while True:
+            try:
+                values = next(self._raw)
+            except StopIteration:
+                break
+            except (UnicodeDecodeError, csv.Error) as e:
+                # Rows before this one may already be copied; import_loads rolls them back
+                raise HTTPException(
+                    status_code=400, detail=f"Could not read row {self._row_number + 1}: {e}"
+                )
+            self._row_number += 1
+            row = {}
+            for column, value in zip(self.columns, values):
+                value = _cell(value)
+                if value is None:
+                    continue
+                row[REFERENCE_COLUMNS.get(column, column)] = value
+            if row:
+                batch.append((self._row_number, row))
+                if len(batch) >= count:
+                    break
+        return batch
+
+    def close(self) -> None:
+        if self._workbook is not None:
+            self._workbook.close()
+
+
+class _References:
+    """Resolves names and ids of related records, each one queried once per import"""
+
+    def __init__(self, db: AsyncSession, company_id: int):
+        self.db = db
+        self.company_id = company_id
+        self.names: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self.owned_ids: Dict[str, Set[int]] = defaultdict(set)
+        self.checked_ids: Dict[str, Set[int]] = defaultdict(set)
+
+    # Lower-cased expression a spreadsheet value is matched against
+    LOOKUPS = {
+        "customer": (Customer, lambda: func.lower(func.trim(Customer.name))),
+        "driver": (Driver, lambda: func.lower(
+            func.concat(func.trim(Driver.first_name), " ", func.trim(Driver.last_name))
+        )),
+        "truck": (Truck, lambda: func.lower(func.trim(Truck.truck_number))),
+    }
+
+    async def resolve_names(self, kind: str, names: Set[str]) -> None:
+        missing = names - self.names[kind].keys()
+        if not missing:
+            return
+        model, key = self.LOOKUPS[kind]
+        key = key()
+        result = await self.db.execute(
+            select(key, model.id).where(model.company_id == self.company_id, key.in_(missing))
+        )
+        found: Dict[str, List[int]] = defaultdict(list)
+        for name, record_id in result:
+            found[name].append(record_id)
+        for name in missing:
+            ids = found.get(name, [])
+            self.names[kind][name] = ids[0] if len(ids) == 1 else (AMBIGUOUS if ids else 0)
+
+    async def check_ids(self, kind: str, ids: Set[int]) -> None:
+        missing = ids - self.checked_ids[kind]
+        if not missing:
+            return
+        model, _ = self.LOOKUPS[kind]
+        result = await self.db.execute(
+            select(model.id).where(model.company_id == self.company_id, model.id.in_(missing))
+        )
+        self.owned_ids[kind].update(result.scalars())
+        self.checked_ids[kind].update(missing)
+
+    async def apply(self, batch: List[Tuple[int, Dict[str, Any]]], errors: List[dict]) -> list:
+        """Fill in *_id from names and drop rows whose references do not resolve"""
+        name_columns = {"customer": "customer_name", "driver": "driver_name", "truck": "truck_number"}
+        for kind, column in name_columns.items():
+            names = {row[column].lower() for _, row in batch if column in row}
+            await self.resolve_names(kind, names)
+            ids = set()
+            for _, row in batch:
+                value = row.get(f"{kind}_id")
+                if value is not None and column not in row:
+                    try:
+                        ids.add(int(value))
+                    except (TypeError, ValueError):
+                        pass  # Reported by validation
+            await self.check_ids(kind, ids)
+
+        resolved = []
+        for row_number, row in batch:
+            problem = None
+            for kind, column in name_columns.items():
+                name = row.pop(column, None)
+                if name is not None:
+                    record_id = self.names[kind].get(name.lower(), 0)
+                    if record_id == AMBIGUOUS:
+                        problem = (f"{kind}_id", f"{name!r} matches more than one {kind}")
+                    elif not record_id:
+                        problem = (f"{kind}_id", f"No {kind} named {name!r}")
+                    else:
+                        row[f"{kind}_id"] = record_id
+                        continue
+                    break
+                value = row.get(f"{kind}_id")
+                try:
+                    if value is not None and int(value) not in self.owned_ids[kind]:
+                        problem = (f"{kind}_id", f"No {kind} with id {value}")
+                        break
+                except (TypeError, ValueError):
+                    pass
+            if problem:
+                _add_error(errors, row_number, *problem)
+            else:
+                resolved.append((row_number, row))
+        return resolved
+
+
+def _add_error(errors: List[dict], row: int, field: Optional[str], message: str) -> None:
+    errors.append({"row": row, "field": field, "message": message})
+
+
+def _validate(batch: List[Tuple[int, Dict[str, Any]]], company_id: int, errors: List[dict]) -> List[tuple]:
+    """COPY records for the rows LoadCreate accepts; the rest go to `errors`"""
+    records = []
+    for row_number, row in batch:
+        if "status" in row:
+            row["status"] = str(row["status"]).lower()
+        try:
+            load = LoadCreate.model_validate(row)
+        except ValidationError as e:
+            for error in e.errors():
+                field = ".".join(str(part) for part in error["loc"]) or None
+                _add_error(errors, row_number, field, error["msg"])
+            continue
+        values = [getattr(load, column) for column in LoadCreate.model_fields]
+        # Enum columns store member names, as the ORM does
+        values = [v.name if isinstance(v, enum.Enum) else v for v in values]
+        records.append(tuple(values) + (company_id,))
+    return records
+
+
+async def _copy(db: AsyncSession, records: List[tuple]) -> None:
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    if not driver.is_in_transaction():
+        # asyncpg only opens the session's transaction on its first
+        # statement; COPY has to run inside it to roll back with the rest
+        await db.execute(select(1))
+    await driver.copy_records_to_table(
+        Load.__tablename__, records=records, columns=COPY_COLUMNS
+    )
+
+
+async def import_loads(
+    db: AsyncSession,
+    company_id: int,
+    file: UploadFile,
+    dry_run: bool = False,
+) -> dict:
+    """Import every valid row of `file` as a load of `company_id`"""
+    if file.size is not None and file.size > settings.UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the {settings.UPLOAD_MAX_BYTES // (1024 * 1024)}MB upload limit"
+        )
+
+    rows = await run_in_threadpool(_Rows, file)
+    references = _References(db, company_id)
+    errors: List[dict] = []
+    total = imported = 0
+
+    try:
+        while True:
+            batch = await run_in_threadpool(rows.take, settings.LOAD_IMPORT_BATCH_SIZE)
+            if not batch:
+                break
+            total += len(batch)
+            if total > settings.LOAD_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Imports are limited to {settings.LOAD_IMPORT_MAX_ROWS} rows per file"
+                )
+
+            batch = await references.apply(batch, errors)
+            records = await run_in_threadpool(_validate, batch, company_id, errors)
+            if records and not dry_run:
+                await _copy(db, records)
+            imported += len(records)
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        rows.close()
+
+    if not dry_run:
+        await db.commit()
+
+    errors.sort(key=lambda error: error["row"])
+    failed_rows = len({error["row"] for error in errors})
+    return {
+        "dry_run": dry_run,
+        "total_rows": total,
+        "imported": imported,
+        "failed": failed_rows,
+        "ignored_columns": rows.ignored,
+        "errors": errors[:settings.LOAD_IMPORT_MAX_ERRORS],
+        "errors_truncated": len(errors) > settings.LOAD_IMPORT_MAX_ERRORS,
+    }
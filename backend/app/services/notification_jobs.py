@@ -0,0 +1,131 @@
+"""
+Background jobs for SMS and email notifications
+
+Importing this module registers the handlers, so both the API process (for
+the in-memory fallback) and the worker process must import it.
+"""
+from typing import Any, Dict, List, Optional
+from app.services.email import email_service
+from app.services.job_queue import JobProgress, job_queue
+from app.services.twilio_service import get_twilio_service
+
+SEND_BULK_SMS = "sms.bulk"
+SEND_EMAIL = "email.send"
+
+# Email templates a job may ask for, by EmailService render method
+EMAIL_TEMPLATES = {
+    "verification": "render_verification_email",
+    "welcome": "render_welcome_email",
+    "user_invitation": "render_user_invitation_email",
+}
+
+
+@job_queue.handler(SEND_BULK_SMS)
+async def run_bulk_sms(payload: Dict[str, Any], progress: JobProgress) -> Dict[str, Any]:
+    """
+    Text every recipient, skipping those an interrupted attempt already reached
+
+    Recipients are recorded by position as Twilio accepts each message, so
+    a retry after a worker crash resends at most the messages in flight.
+    """
+    recipients = payload["recipients"]
+    await progress.set_total(len(recipients))
+
+    done = await progress.done_before()
+    pending = []
+    for index, recipient in enumerate(recipients):
+        if str(index) in done:
+            await progress.advance(True)
+        else:
+            pending.append(index)
+    # Results hand back the recipient dict they were for
+    positions = {id(recipients[index]): index for index in pending}
+
+    async def on_result(result: Dict[str, Any]) -> None:
+        succeeded = bool(result.get("success"))
+        if succeeded:
+            await progress.mark_done(str(positions[id(result["recipient"])]))
+        await progress.advance(succeeded)
+
+    summary = await get_twilio_service().send_bulk_sms(
+        recipients=[recipients[index] for index in pending],
+        message_template=payload["message"],
+        on_result=on_result
+    )
+    skipped = len(recipients) - len(pending)
+    if skipped:
+        summary["total"] += skipped
+        summary["successful"] += skipped
+        summary["sent_by_earlier_attempts"] = skipped
+    return summary
+
+
+@job_queue.handler(SEND_EMAIL)
+async def run_send_email(payload: Dict[str, Any], progress: JobProgress) -> Dict[str, Any]:
+    """Send one template to every entry in `recipients` as a single batch"""
+    recipients = payload["recipients"]
+    await progress.set_total(len(recipients))
+    render = getattr(email_service, EMAIL_TEMPLATES[payload["template"]])
+
+    sent = await email_service.send_batch([render(**params) for params in recipients])
+    for ok in sent:
+        await progress.advance(ok)
+
+    if not any(sent):
+        raise RuntimeError(f"Failed to send {payload['template']} email")
+    return {
+        "total": len(sent),
+        "successful": sum(sent),
+        "failed": len(sent) - sum(sent),
+        "results": [
+            {"to_email": params["to_email"], "success": ok}
+            for params, ok in zip(recipients, sent)
+        ],
+    }
+
+
+async def enqueue_bulk_sms(
+    recipients: List[Dict[str, Any]],
+    message: str,
+    company_id: int
+) -> Dict[str, Any]:
+    """Queue a bulk SMS send and return the job record"""
+    return await job_queue.enqueue(
+        SEND_BULK_SMS,
+        {"recipients": recipients, "message": message},
+        company_id=company_id,
+        total=len(recipients)
+    )
+
+
+async def enqueue_emails(
+    template: str,
+    recipients: List[Dict[str, Any]],
+    company_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Queue one of the EMAIL_TEMPLATES for many recipients as a single job
+
+    Each recipient is a dict of the template's render arguments. The batch
+    goes out over the pooled SMTP connections, e.g. for bulk invitations.
+    Callers queue emails after committing the records they describe, so
+    these jobs run in-process rather than fail when Redis is unreachable.
+    """
+    if template not in EMAIL_TEMPLATES:
+        raise ValueError(f"Unknown email template: {template}")
+    return await job_queue.enqueue(
+        SEND_EMAIL,
+        {"template": template, "recipients": recipients},
+        company_id=company_id,
+        total=len(recipients),
+        local_fallback=True
+    )
+
+
+async def enqueue_email(
+    template: str,
+    company_id: Optional[int] = None,
+    **params: Any
+) -> Dict[str, Any]:
+    """Queue one of the EMAIL_TEMPLATES for a single recipient"""
+    return await enqueue_emails(template, [params], company_id=company_id)
@@ -1,16 +1,38 @@
+import asyncio
 import json
-import redis.asyncio as redis
+from functools import lru_cache
 from typing import Optional, Any
 from app.config import settings
 
 
+@lru_cache()
+def redis_errors() -> tuple:
+    """
+    Exceptions that mean Redis is unavailable, for `except redis_errors():`
+
+    Resolved on first failure because importing redis.exceptions loads the
+    whole redis package, redis.asyncio included.
+    """
+    from redis.exceptions import RedisError
+    return (RedisError, ConnectionError, OSError, asyncio.TimeoutError)
+
+
 class RedisService:
     def __init__(self):
-        self.redis_client = redis.from_url(
-            settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True
-        )
+        self._client = None
+
+    @property
+    def redis_client(self):
+        """Client created on first use; no connection is opened until a command runs"""
+        if self._client is None:
+            import redis.asyncio as redis
+            self._client = redis.from_url(
+                settings.REDIS_URL,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS
+            )
+        return self._client
 
     async def get(self, key: str) -> Optional[Any]:
         """Get a value from Redis"""
@@ -67,7 +89,9 @@ class RedisService:
 
     async def close(self):
         """Close the Redis connection"""
-        await self.redis_client.close()
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
 
 redis_service = RedisService()
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""
+Rotating refresh tokens with reuse detection
+
+A refresh token is a JWT signed with SECRET_KEY, so checking one costs an
+HMAC instead of an Argon2 password hash. Each token carries its own id
+(jti) and the id of the login it descends from (its family). Whether a
+token is still usable is tracked server-side: in Redis when
+REFRESH_TOKEN_USE_REDIS is set, otherwise (and whenever Redis fails) in the
+refresh_tokens table.
+
+Refreshing marks the presented token used and issues the next one in its
+family. Presenting a token that was already used means a copy is in
+someone else's hands, so the whole family is revoked and every holder has
+to sign in again. Logging out revokes the family as well.
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+from jose import JWTError, jwt
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.core.security import load_principal
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.services.redis import redis_errors
+
+TOKEN_TYPE = "refresh"
+
+# Check and mark in one step, so two requests racing with the same token
+# cannot both rotate it
+_CONSUME = """
+if redis.call('exists', KEYS[2]) == 1 then
+    return 'revoked'
+end
+local state = redis.call('get', KEYS[1])
+if state == 'active' then
+    redis.call('set', KEYS[1], 'used', 'KEEPTTL')
+end
+return state
+"""
+
+
+class RefreshTokenService:
+    """Issues, rotates and revokes refresh tokens"""
+
+    def __init__(self, expire_days: int, use_redis: bool):
+        self.lifetime = timedelta(days=expire_days)
+        self.use_redis = use_redis
+
+    @staticmethod
+    def _redis():
+        from app.services.redis import redis_service
+        return redis_service.redis_client
+
+    @staticmethod
+    def _token_key(jti: str) -> str:
+        return f"refresh:{jti}"
+
+    @staticmethod
+    def _family_key(family_id: str) -> str:
+        return f"refresh:family:{family_id}:revoked"
+
+    @staticmethod
+    def _invalid() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    def _decode(self, token: str) -> dict:
+        try:
+            claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            raise self._invalid()
+        if claims.get("type") != TOKEN_TYPE or not claims.get("jti") or not claims.get("fam"):
+            raise self._invalid()
+        return claims
+
+    async def _store_in_redis(self, jti: str) -> bool:
+        if not self.use_redis:
+            return False
+        try:
+            await self._redis().set(
+                self._token_key(jti), "active", ex=int(self.lifetime.total_seconds())
+            )
+            return True
+        except redis_errors() as e:
+            print(f"Refresh token store error, using the database: {e}")
+            return False
+
+    async def issue(self, db: AsyncSession, user: User, family_id: Optional[str] = None) -> str:
+        """Issue a refresh token for `user`, starting a new family unless one is given"""
+        jti = uuid.uuid4().hex
+        now = datetime.now(timezone.utc)
+        expires_at = now + self.lifetime
+
+        if family_id is None:
+            family_id = uuid.uuid4().hex
+            # A new login is a good moment to drop this user's expired rows
+            await db.execute(
+                delete(RefreshToken).where(
+                    RefreshToken.user_id == user.id, RefreshToken.expires_at < now
+                )
+            )
+        if not await self._store_in_redis(jti):
+            db.add(RefreshToken(
+                jti=jti, family_id=family_id, user_id=user.id, expires_at=expires_at
+            ))
+        await db.commit()
+
+        return jwt.encode(
+            {"sub": user.email, "type": TOKEN_TYPE, "jti": jti, "fam": family_id, "exp": expires_at},
+            settings.SECRET_KEY,
+            algorithm=settings.ALGORITHM,
+        )
+
+    async def _consume(self, db: AsyncSession, jti: str, family_id: str) -> Optional[str]:
+        """
+        Mark a token used and return the state it was in before
+
+        One of "active", "used" or "revoked", or None for a token the
+        server never issued (or has forgotten).
+        """
+        if self.use_redis:
+            try:
+                state = await self._redis().eval(
+                    _CONSUME, 2, self._token_key(jti), self._family_key(family_id)
+                )
+                if state is not None:
+                    return state
+            except redis_errors() as e:
+                print(f"Refresh token store error, using the database: {e}")
+
+        # Tokens issued without Redis, or while it was failing, live here
+        result = await db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.jti == jti,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(used_at=datetime.now(timezone.utc))
+            .returning(RefreshToken.id)
+        )
+        if result.scalar_one_or_none() is not None:
+            return "active"
+
+        result = await db.execute(
+            select(RefreshToken.revoked_at).where(RefreshToken.jti == jti)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return "revoked" if row.revoked_at else "used"
+
+    async def revoke_family(self, db: AsyncSession, family_id: str) -> None:
+        """Revoke every token descended from one login"""
+        if self.use_redis:
+            try:
+                # Outlives every token in the family, the newest included
+                await self._redis().set(
+                    self._family_key(family_id), "1", ex=int(self.lifetime.total_seconds())
+                )
+            except redis_errors() as e:
+                print(f"Refresh token store error, using the database: {e}")
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        await db.commit()
+
+    async def rotate(self, db: AsyncSession, token: str) -> Tuple[User, str]:
+        """Exchange a refresh token for its successor, returning (user, new token)"""
+        claims = self._decode(token)
+        family_id = claims["fam"]
+
+        state = await self._consume(db, claims["jti"], family_id)
+        if state == "used":
+            print(f"Refresh token reused; revoking token family {family_id}")
+            await self.revoke_family(db, family_id)
+        if state != "active":
+            raise self._invalid()
+
+        user = await load_principal(db, claims["sub"])
+        if user is None or not user.is_active:
+            await self.revoke_family(db, family_id)
+            raise self._invalid()
+        return user, await self.issue(db, user, family_id)
+
+    async def revoke(self, db: AsyncSession, token: str) -> None:
+        """Log out: revoke the family of `token`; invalid tokens are ignored"""
+        try:
+            claims = self._decode(token)
+        except HTTPException:
+            return
+        await self.revoke_family(db, claims["fam"])
+
+
+refresh_token_service = RefreshTokenService(
+    expire_days=settings.REFRESH_TOKEN_EXPIRE_DAYS,
+    use_redis=settings.REFRESH_TOKEN_USE_REDIS
+)
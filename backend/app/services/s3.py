@@ -1,25 +1,28 @@
-import boto3
-from botocore.exceptions import ClientError
+import json
+import time
+from collections import OrderedDict
 from datetime import timedelta
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 from app.config import settings
+from app.services.aws import client_error, get_s3_client
+from app.services.redis import redis_errors
 
 
 class S3Service:
     def __init__(self):
-        self.s3_client = boto3.client(
-            's3',
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
         self.bucket_name = settings.S3_BUCKET
 
+    @property
+    def s3_client(self):
+        """The shared S3 client, created on first use"""
+        return get_s3_client()
+
     def generate_presigned_upload_url(
         self,
         key: str,
         content_type: str,
-        expires_in: int = 3600
+        expires_in: int = 3600,
+        max_bytes: int = 50 * 1024 * 1024
     ) -> Optional[dict]:
         """Generate a presigned URL for uploading files to S3"""
         try:
@@ -29,12 +32,12 @@ class S3Service:
                 Fields={'Content-Type': content_type},
                 Conditions=[
                     {'Content-Type': content_type},
-                    ['content-length-range', 1, 50 * 1024 * 1024]  # 50MB max
+                    ['content-length-range', 1, max_bytes]
                 ],
                 ExpiresIn=expires_in
             )
             return response
-        except ClientError as e:
+        except client_error() as e:
             print(f"Error generating presigned URL: {e}")
             return None
 
@@ -51,18 +54,131 @@ class S3Service:
                 ExpiresIn=expires_in
             )
             return response
-        except ClientError as e:
+        except client_error() as e:
             print(f"Error generating presigned URL: {e}")
             return None
 
+    def head_object(self, key: str) -> Optional[dict]:
+        """Get object metadata, or None if the object does not exist"""
+        try:
+            return self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except client_error() as e:
+            print(f"Error reading object metadata: {e}")
+            return None
+
     def delete_file(self, key: str) -> bool:
         """Delete a file from S3"""
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
             return True
-        except ClientError as e:
+        except client_error() as e:
             print(f"Error deleting file: {e}")
             return False
 
 
-s3_service = S3Service()
\ No newline at end of file
+class PresignedUrlCache:
+    """
+    Reuses presigned download URLs until shortly before their signature lapses
+
+    Returning the same URL for repeated opens also lets the browser cache the
+    PDF itself. Entries are kept in an in-process LRU and, when enabled, in
+    Redis so every worker hands out the same URL.
+    """
+
+    def __init__(
+        self,
+        s3: S3Service,
+        expires_in: int,
+        refresh_margin: int,
+        max_entries: int = 4096,
+        use_redis: bool = False
+    ):
+        self.s3 = s3
+        self.expires_in = expires_in
+        self.refresh_margin = refresh_margin
+        self.max_entries = max_entries
+        self.use_redis = use_redis
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    @staticmethod
+    def _redis():
+        from app.services.redis import redis_service
+        return redis_service.redis_client
+
+    def _usable(self, expires_at: float) -> bool:
+        return expires_at - time.time() > self.refresh_margin
+
+    def _store_local(self, key: str, url: str, expires_at: float) -> None:
+        self._entries[key] = (url, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_url(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return (url, expires_at) for one key, or None if signing failed"""
+        return (await self.get_urls([key])).get(key)
+
+    async def get_urls(self, keys: Iterable[str]) -> Dict[str, Tuple[str, float]]:
+        """Return (url, expires_at) per key, signing only the ones not cached"""
+        found: Dict[str, Tuple[str, float]] = {}
+        missing = []
+
+        for key in dict.fromkeys(keys):
+            entry = self._entries.get(key)
+            if entry and self._usable(entry[1]):
+                self._entries.move_to_end(key)
+                found[key] = entry
+            else:
+                missing.append(key)
+
+        if missing and self.use_redis:
+            try:
+                # One round trip for the whole listing
+                cached_values = await self._redis().mget([f"presigned:{key}" for key in missing])
+            except redis_errors() as e:
+                print(f"Redis error reading presigned URLs: {e}")
+                cached_values = [None] * len(missing)
+            still_missing = []
+            for key, raw in zip(missing, cached_values):
+                cached = json.loads(raw) if raw else None
+                if cached and self._usable(cached["expires_at"]):
+                    entry = (cached["url"], cached["expires_at"])
+                    self._store_local(key, *entry)
+                    found[key] = entry
+                else:
+                    still_missing.append(key)
+            missing = still_missing
+
+        signed: Dict[str, Tuple[str, float]] = {}
+        for key in missing:
+            expires_at = time.time() + self.expires_in
+            url = self.s3.generate_presigned_download_url(key, expires_in=self.expires_in)
+            if not url:
+                continue
+            self._store_local(key, url, expires_at)
+            signed[key] = (url, expires_at)
+        found.update(signed)
+
+        if signed and self.use_redis:
+            try:
+                async with self._redis().pipeline(transaction=False) as pipe:
+                    for key, (url, expires_at) in signed.items():
+                        pipe.set(
+                            f"presigned:{key}",
+                            json.dumps({"url": url, "expires_at": expires_at}),
+                            ex=max(self.expires_in - self.refresh_margin, 1)
+                        )
+                    await pipe.execute()
+            except redis_errors() as e:
+                print(f"Redis error caching presigned URLs: {e}")
+
+        return found
+
+
+s3_service = S3Service()
+presigned_url_cache = PresignedUrlCache(
+    s3_service,
+    expires_in=settings.PRESIGNED_URL_EXPIRES_IN,
+    refresh_margin=settings.PRESIGNED_URL_REFRESH_MARGIN,
+    use_redis=settings.PRESIGNED_URL_CACHE_USE_REDIS
+)
@@ -0,0 +1,120 @@
+"""
+Concurrent, rate-limited dispatcher for bulk SMS sends
+"""
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Twilio answers 429 when the account's send rate is exceeded; 5xx are transient
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, bursting up to `capacity`
+
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class BulkSmsDispatcher:
+    """
+    Sends many messages through a bounded pool of workers
+
+    Every attempt takes a token from the shared rate limiter first, so the
+    combined send rate never exceeds the provider limit however many
+    workers run. Attempts answered with a retryable HTTP status are retried
+    with exponential backoff and jitter.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, str], Awaitable[Dict[str, Any]]],
+        rate_limiter: TokenBucket,
+        concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+    ):
+        self.send = send
+        self.rate_limiter = rate_limiter
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    async def _send_with_retry(self, phone: str, body: str) -> Dict[str, Any]:
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            result = await self.send(phone, body)
+            retryable = result.get('status_code') in RETRYABLE_STATUS_CODES
+            if result.get('success') or not retryable or attempt >= self.max_retries:
+                result['attempts'] = attempt + 1
+                return result
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    async def dispatch(
+        self,
+        messages: List[Dict[str, Any]],
+        on_result: Optional[Callable[[int, Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send every message and return one result per message, in input order
+
+        Each message is a dict with 'phone' and 'body'; any other keys are
+        ignored here and left for the caller. `on_result` is awaited after
+        each message completes, e.g. to report progress.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index in range(len(messages)):
+            queue.put_nowait(index)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                message = messages[index]
+                try:
+                    result = await self._send_with_retry(message['phone'], message['body'])
+                except Exception as e:
+                    result = {'success': False, 'error': str(e), 'to': message['phone']}
+                results[index] = result
+                if on_result:
+                    await on_result(index, result)
+
+        workers = min(self.concurrency, len(messages))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
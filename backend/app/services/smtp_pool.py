@@ -0,0 +1,160 @@
+"""
+Pooled SMTP transport that keeps authenticated connections open
+
+smtplib is blocking, so every exchange runs on the threadpool. Connections
+are reused until they sit idle too long or the server drops them, which
+saves the connect + STARTTLS + AUTH round trips on every message.
+"""
+import asyncio
+import smtplib
+import ssl
+import threading
+import time
+from collections import deque
+from email.message import Message
+from typing import List, Optional, Sequence
+from fastapi.concurrency import run_in_threadpool
+from app.core.metrics import observe_external
+
+
+class SmtpConnectionPool:
+    """
+    Up to `size` SMTP connections shared by all senders in the process
+
+    `send_many` spreads a batch over the pool, each connection sending its
+    share back to back, so a burst of invitations costs one handshake per
+    connection rather than one per message.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = True,
+        size: int = 2,
+        idle_timeout: float = 60.0,
+        timeout: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: "deque[tuple[smtplib.SMTP, float]]" = deque()
+        self._lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        return self._slots
+
+    def _connect(self) -> smtplib.SMTP:
+        with observe_external("smtp", "connect"):
+            connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            try:
+                if self.starttls:
+                    connection.starttls(context=ssl.create_default_context())
+                if self.username and self.password:
+                    connection.login(self.username, self.password)
+            except Exception:
+                self._close(connection)
+                raise
+        return connection
+
+    @staticmethod
+    def _close(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def _checkout(self) -> smtplib.SMTP:
+        """Reuse an idle connection if it is still alive, else open a new one"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                connection, idle_since = self._idle.pop()
+            if time.monotonic() - idle_since > self.idle_timeout:
+                self._close(connection)
+                continue
+            return connection
+        return self._connect()
+
+    def _checkin(self, connection: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((connection, time.monotonic()))
+
+    def _send_sync(self, messages: Sequence[Message]) -> List[bool]:
+        results = []
+        connection = None
+        for message in messages:
+            sent = False
+            # One retry on a fresh connection if the server dropped ours
+            for attempt in range(2):
+                try:
+                    if connection is None:
+                        connection = self._checkout()
+                    with observe_external("smtp", "send_message"):
+                        connection.send_message(message)
+                    sent = True
+                    break
+                except smtplib.SMTPServerDisconnected as e:
+                    if connection is not None:
+                        connection.close()
+                        connection = None
+                    if attempt:
+                        print(f"Error sending email: {str(e)}")
+                except smtplib.SMTPException as e:
+                    # Rejected message; smtplib resets the session, so the
+                    # connection is still usable. SMTPException subclasses
+                    # OSError, so this has to come before the clause below.
+                    print(f"Error sending email: {str(e)}")
+                    break
+                except (ConnectionError, OSError) as e:
+                    if connection is not None:
+                        connection.close()
+                        connection = None
+                    if attempt:
+                        print(f"Error sending email: {str(e)}")
+            results.append(sent)
+
+        if connection is not None:
+            self._checkin(connection)
+        return results
+
+    async def send(self, message: Message) -> bool:
+        """Send one message, returning whether the server accepted it"""
+        return (await self.send_many([message]))[0]
+
+    async def send_many(self, messages: Sequence[Message]) -> List[bool]:
+        """Send a batch over up to `size` connections, results in input order"""
+        if not messages:
+            return []
+
+        chunks = min(self.size, len(messages))
+        slots = self._get_slots()
+
+        async def send_chunk(chunk: Sequence[Message]) -> List[bool]:
+            async with slots:
+                return await run_in_threadpool(self._send_sync, chunk)
+
+        # Interleave so each connection gets an even share
+        sent = await asyncio.gather(*(send_chunk(messages[i::chunks]) for i in range(chunks)))
+        results: List[bool] = [False] * len(messages)
+        for offset, chunk_results in enumerate(sent):
+            results[offset::chunks] = chunk_results
+        return results
+
+    def close(self) -> None:
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for connection, _ in idle:
+            self._close(connection)
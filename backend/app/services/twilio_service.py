@@ -1,11 +1,13 @@
 """
 Twilio service for sending SMS and emails to drivers
 """
-from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable
 import os
+from fastapi.concurrency import run_in_threadpool
 from app.config import settings
+from app.core.metrics import observe_external
+from app.services.sms_dispatcher import BulkSmsDispatcher, TokenBucket
 
 
 class TwilioService:
@@ -21,7 +23,16 @@ class TwilioService:
         if not all([self.account_sid, self.auth_token]):
             raise ValueError("Twilio credentials not configured. Please set TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN")
 
+        # Imported here so the twilio package only loads once SMS is used
+        from twilio.rest import Client
         self.client = Client(self.account_sid, self.auth_token)
+        if settings.TWILIO_API_BASE_URL:
+            # Point at a fake Twilio server in tests
+            self.client.api.base_url = settings.TWILIO_API_BASE_URL
+
+        # Shared by every bulk send from this process so the sender's
+        # messages-per-second limit holds across concurrent requests
+        self.rate_limiter = TokenBucket(settings.TWILIO_MESSAGES_PER_SECOND)
 
     async def send_sms(
         self,
@@ -55,7 +66,11 @@ class TwilioService:
             if media_url:
                 message_params['media_url'] = [media_url]
 
-            message_response = self.client.messages.create(**message_params)
+            # The Twilio client is synchronous; keep it off the event loop
+            with observe_external("twilio", "messages.create"):
+                message_response = await run_in_threadpool(
+                    self.client.messages.create, **message_params
+                )
 
             return {
                 'success': True,
@@ -68,6 +83,7 @@ class TwilioService:
                 'success': False,
                 'error': str(e),
                 'error_code': e.code,
+                'status_code': e.status,
                 'to': to_phone
             }
         except Exception as e:
@@ -185,38 +201,59 @@ Check your TMS dashboard for details.
     async def send_bulk_sms(
         self,
         recipients: list[Dict[str, str]],
-        message_template: str
+        message_template: str,
+        on_result: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         Send SMS to multiple recipients
 
+        Messages go out concurrently on a bounded worker pool, throttled to
+        TWILIO_MESSAGES_PER_SECOND and retried on 429/5xx responses.
+
         Args:
             recipients: List of dicts with 'phone' and optional 'name' keys
             message_template: Message template (can include {name} placeholder)
+            on_result: Optional coroutine called with each recipient's result
 
         Returns:
             Dictionary with results for each recipient
         """
-        results = []
+        results = [None] * len(recipients)
+        messages = []
+        positions = []
 
-        for recipient in recipients:
+        for index, recipient in enumerate(recipients):
             phone = recipient.get('phone')
             name = recipient.get('name', '')
 
             if not phone:
-                results.append({
+                results[index] = {
                     'success': False,
                     'error': 'Phone number missing',
                     'recipient': recipient
-                })
+                }
+                if on_result:
+                    await on_result(results[index])
                 continue
 
             # Replace {name} placeholder if present
-            message = message_template.replace('{name}', name)
-
-            result = await self.send_sms(phone, message)
-            result['recipient'] = recipient
-            results.append(result)
+            messages.append({'phone': phone, 'body': message_template.replace('{name}', name)})
+            positions.append(index)
+
+        dispatcher = BulkSmsDispatcher(
+            send=self.send_sms,
+            rate_limiter=self.rate_limiter,
+            concurrency=settings.TWILIO_BULK_CONCURRENCY,
+            max_retries=settings.TWILIO_MAX_RETRIES
+        )
+
+        async def record(position: int, result: Dict[str, Any]) -> None:
+            result['recipient'] = recipients[positions[position]]
+            results[positions[position]] = result
+            if on_result:
+                await on_result(results[positions[position]])
+
+        await dispatcher.dispatch(messages, on_result=record)
 
         return {
             'total': len(recipients),
@@ -0,0 +1,41 @@
+"""
+Background job worker
+
+Runs jobs queued through Redis by the API:
+
+    python -m app.worker
+
+Requires JOB_QUEUE_USE_REDIS=true in both the API and the worker.
+"""
+import asyncio
+import logging
+import signal
+from app.config import settings
+from app.services.job_queue import job_queue
+import app.services.notification_jobs  # noqa: F401  (registers job handlers)
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.DEBUG else logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    if not settings.JOB_QUEUE_USE_REDIS:
+        raise SystemExit("JOB_QUEUE_USE_REDIS is off; jobs run inside the API process")
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, job_queue.stop)
+
+    logger.info(
+        "Job worker %s started (concurrency %s)",
+        job_queue.worker_name, settings.JOB_WORKER_CONCURRENCY
+    )
+    await job_queue.run_worker(settings.JOB_WORKER_CONCURRENCY)
+    logger.info("Job worker %s stopped", job_queue.worker_name)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Export writer benchmark
+
+    python benchmarks/export.py
+    python benchmarks/export.py --rows 1000000 --batch-size 5000
+
+Feeds --rows synthetic load rows through the CSV and XLSX writers the
+export endpoints use, in batches the size a server-side cursor would
+return, and prints for each format the time to the first chunk, rows/sec,
+output size and peak Python memory. Peak memory should stay near one
+batch however large --rows is; that is what keeps exports safe to run
+against years of data.
+"""
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.models.load import LoadStatus  # noqa: E402
+from app.services.exports import csv_chunks, xlsx_chunks  # noqa: E402
+
+HEADERS = [
+    "Load #", "Status", "Customer", "Driver", "Truck", "Pickup location",
+    "Delivery location", "Pickup date", "Delivery date", "Miles", "Rate", "Total amount",
+]
+
+
+def _row(i: int) -> tuple:
+    pickup = datetime(2020, 1, 1) + timedelta(hours=i)
+    return (
+        f"L{i:07d}", LoadStatus.dispatched, "Acme Freight & Logistics", "Jane Doe",
+        f"T{i % 200:03d}", "Chicago, IL", "Dallas, TX", pickup, pickup + timedelta(days=2),
+        925, Decimal("2450.00"), Decimal("2675.50"),
+    )
+
+
+async def _batches(rows: int, batch_size: int):
+    for start in range(0, rows, batch_size):
+        yield [_row(i) for i in range(start, min(start + batch_size, rows))]
+        await asyncio.sleep(0)  # Where the cursor would wait on the database
+
+
+async def _measure(chunks) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    async for chunk in chunks:
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first, elapsed, size, peak
+
+
+async def run(args) -> None:
+    print(f"{args.rows} rows in batches of {args.batch_size}")
+    for name, writer in (
+        ("csv", lambda: csv_chunks(HEADERS, _batches(args.rows, args.batch_size))),
+        ("xlsx", lambda: xlsx_chunks(HEADERS, _batches(args.rows, args.batch_size))),
+    ):
+        first, elapsed, size, peak = await _measure(writer())
+        print(
+            f"  {name:<5} first chunk {first * 1000:6.2f} ms  {args.rows / elapsed:10.0f} rows/s  "
+            f"{size / 1e6:8.1f} MB out  peak memory {peak / 1e6:6.1f} MB"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure export writer throughput and memory")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Import-time benchmark for the API
+
+    python benchmarks/import_time.py                  # report
+    python benchmarks/import_time.py --max-ms 1500    # fail if slower
+
+Imports app.main in a fresh interpreter under `python -X importtime`, then
+prints the total and the slowest top-level packages. Exits 1 when the
+import takes longer than --max-ms or when a package that should only load
+on first use (boto3, botocore, twilio.rest, redis) was imported eagerly, so
+it can gate CI as endpoints are added.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Created lazily by app.services.aws, twilio_service and redis; their
+# exception classes too (aws.client_error, redis.redis_errors), since
+# importing any submodule runs the package __init__
+DEFERRED_MODULES = ("boto3", "botocore", "twilio.rest", "redis")
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) for everything the import loaded"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure how long importing the app takes")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=15, help="Packages to list")
+    parser.add_argument("--max-ms", type=float, help="Fail when the import is slower")
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    total_ms = next(cumulative for name, _, cumulative in rows if name == args.module) / 1000
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"import {args.module}: {total_ms:.0f} ms, {len(rows)} modules")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    failed = False
+    loaded = {name for name, _, _ in rows}
+    eager = [name for name in DEFERRED_MODULES if name in loaded]
+    if eager:
+        print(f"Imported eagerly, should load on first use: {', '.join(eager)}")
+        failed = True
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"Import took {total_ms:.0f} ms, budget is {args.max_ms:.0f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
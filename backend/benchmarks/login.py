@@ -0,0 +1,106 @@
+"""
+Login (Argon2 verify) throughput benchmark
+
+    python benchmarks/login.py
+    python benchmarks/login.py --workers 4 --memory-cost 19456 --time-cost 2
+
+Verifies the same password --logins times, all requested at once the way
+a burst of logins arrives, in two modes:
+
+  inline    verify on the event loop (what authenticate_user used to do)
+  pool      verify through PasswordHashingService's thread pool
+
+For each it prints logins/sec, logins/sec per core used, and the longest
+the event loop went without running other work. Argon2 parameters default
+to the ARGON2_* settings, so the numbers show what a change would cost
+before it is rolled out.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.core.passwords import PasswordHashingService  # noqa: E402
+
+PASSWORD = "correct horse battery staple"
+
+
+async def _watch_loop(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Longest stall of the event loop while `stop` is unset"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+async def _measure(logins: int, login: Callable[[], Awaitable[bool]]):
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(_watch_loop(stop))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    stall = await watcher
+    if not all(results):
+        raise SystemExit("A verification failed")
+    return elapsed, stall
+
+
+async def run(args) -> None:
+    service = PasswordHashingService(
+        time_cost=args.time_cost,
+        memory_cost=args.memory_cost,
+        parallelism=args.parallelism,
+        workers=args.workers,
+        max_pending=args.logins,
+        queue_timeout=3600,
+    )
+    hashed = service.hash_sync(PASSWORD)
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+
+    async def inline() -> bool:
+        return service.verify_sync(PASSWORD, hashed)[0]
+
+    async def pooled() -> bool:
+        return (await service.verify(PASSWORD, hashed))[0]
+
+    print(
+        f"Argon2id t={args.time_cost} m={args.memory_cost}KiB p={args.parallelism}, "
+        f"{args.logins} logins, {cpus} CPUs"
+    )
+    for name, login, cores in (
+        ("inline", inline, 1),
+        ("pool", pooled, min(args.workers, cpus)),
+    ):
+        elapsed, stall = await _measure(args.logins, login)
+        rate = args.logins / elapsed
+        print(
+            f"  {name:<7} {rate:8.1f} logins/s  {rate / cores:8.1f} per core  "
+            f"event loop stalled up to {stall * 1000:.0f} ms"
+        )
+    service.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure login throughput")
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument("--time-cost", type=int, default=settings.ARGON2_TIME_COST)
+    parser.add_argument("--memory-cost", type=int, default=settings.ARGON2_MEMORY_COST_KIB)
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
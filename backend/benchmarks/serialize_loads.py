@@ -0,0 +1,165 @@
+"""
+Serialization benchmark for the loads list
+
+    python benchmarks/serialize_loads.py
+    python benchmarks/serialize_loads.py --loads 5000 --repeat 20
+
+Renders the same page of loads (each with a driver and a truck) three ways
+and prints the cost per 1000 loads:
+
+  before    ORM instances validated through List[LoadResponse], stdlib json
+  orjson    the same validation, rendered by ORJSONResponse
+  rows      row mappings with nested dicts, rendered by ORJSONResponse
+            (what GET /loads does now)
+
+Only encoding is timed; fetching plain columns instead of hydrating ORM
+instances saves more on top. All three bodies are checked to decode to the
+same JSON.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+from app.core.responses import ORJSONResponse, schema_columns  # noqa: E402
+from app.models.driver import Driver, DriverStatus  # noqa: E402
+from app.models.load import Load, LoadStatus  # noqa: E402
+from app.models.truck import Truck, TruckStatus, TruckType  # noqa: E402
+from app.schemas.driver import DriverResponse  # noqa: E402
+from app.schemas.load import LoadResponse  # noqa: E402
+from app.schemas.truck import TruckResponse  # noqa: E402
+
+
+def sample_rows(count: int):
+    """Load, driver and truck column values shaped like the database returns them"""
+    created = datetime(2026, 1, 5, 14, 30, 12, 345678, tzinfo=timezone.utc)
+    drivers = [
+        {
+            "id": i, "first_name": f"Driver{i}", "last_name": "Smith",
+            "license_number": f"CDL{i:06d}", "license_expiry": None,
+            "phone": "555-0100", "email": f"driver{i}@example.com",
+            "status": DriverStatus.AVAILABLE, "created_at": created,
+            "updated_at": None, "company_id": 1,
+        }
+        for i in range(1, 51)
+    ]
+    trucks = [
+        {
+            "id": i, "type": TruckType.TRUCK, "truck_number": f"T-{i:03d}",
+            "vin": f"1FUJGLDR{i:09d}", "make": "Freightliner", "model": "Cascadia",
+            "year": 2022, "license_plate": f"ABC{i:04d}", "status": TruckStatus.IN_TRANSIT,
+            "current_driver_id": i, "created_at": created, "updated_at": None,
+            "company_id": 1,
+        }
+        for i in range(1, 51)
+    ]
+    loads = [
+        {
+            "id": i, "load_number": f"L{i:07d}", "reference_number": f"REF-{i}",
+            "description": "Dry van, 22 pallets", "pickup_location": "Dallas, TX",
+            "delivery_location": "Atlanta, GA", "miles": 781,
+            "rate": Decimal("2450.00"), "carrier_rate": Decimal("2100.00"),
+            "fuel_surcharge": Decimal("185.50"), "accessorial_charges": Decimal("0.00"),
+            "total_amount": Decimal("2635.50"),
+            "pickup_date": datetime(2026, 1, 6, 8) + timedelta(hours=i),
+            "delivery_date": datetime(2026, 1, 7, 16) + timedelta(hours=i),
+            "pickup_deadline": None, "delivery_deadline": None,
+            "status": LoadStatus.dispatched, "customer_id": 1 + i % 20,
+            "truck_id": 1 + i % 50, "driver_id": 1 + i % 50,
+            "pod_url": None, "ratecon_url": f"/api/v1/uploads/s3/{i}.pdf",
+            "pickup_notes": None, "delivery_notes": "Call 1h ahead",
+            "created_at": created, "updated_at": created, "company_id": 1,
+        }
+        for i in range(1, count + 1)
+    ]
+    return loads, drivers, trucks
+
+
+def orm_loads(loads, drivers, trucks) -> List[Load]:
+    """The same rows as transient ORM instances with driver and truck attached"""
+    driver_objects = {row["id"]: Driver(**row) for row in drivers}
+    truck_objects = {row["id"]: Truck(**row) for row in trucks}
+    result = []
+    for row in loads:
+        load = Load(**row)
+        load.driver = driver_objects[row["driver_id"]]
+        load.truck = truck_objects[row["truck_id"]]
+        result.append(load)
+    return result
+
+
+def nested_rows(loads, drivers, trucks) -> List[dict]:
+    """The same rows as GET /loads builds them from row mappings"""
+    by_driver = {row["id"]: row for row in drivers}
+    by_truck = {row["id"]: row for row in trucks}
+    result = []
+    for row in loads:
+        load = dict(row)
+        load["driver"] = by_driver.get(row["driver_id"])
+        load["truck"] = by_truck.get(row["truck_id"])
+        result.append(load)
+    return result
+
+
+def time_it(render: Callable[[], bytes], repeat: int) -> float:
+    """Median seconds per call"""
+    render()  # Warm up validators and caches
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare loads list serialization paths")
+    parser.add_argument("--loads", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Only the columns each response model exposes, as the endpoint selects
+    loads, drivers, trucks = sample_rows(args.loads)
+    assert set(loads[0]) == {c.key for c in schema_columns(Load, LoadResponse)}
+    assert set(drivers[0]) == {c.key for c in schema_columns(Driver, DriverResponse)}
+    assert set(trucks[0]) == {c.key for c in schema_columns(Truck, TruckResponse)}
+
+    instances = orm_loads(loads, drivers, trucks)
+    rows = nested_rows(loads, drivers, trucks)
+    adapter = TypeAdapter(List[LoadResponse])
+
+    def validated() -> list:
+        # What FastAPI does with a response_model before rendering
+        value = adapter.validate_python(instances, from_attributes=True)
+        return adapter.dump_python(value, mode="json")
+
+    paths = {
+        "before": lambda: JSONResponse(validated()).body,
+        "orjson": lambda: ORJSONResponse(validated()).body,
+        "rows": lambda: ORJSONResponse(rows).body,
+    }
+
+    bodies = {name: json.loads(render()) for name, render in paths.items()}
+    if not bodies["before"] == bodies["orjson"] == bodies["rows"]:
+        raise SystemExit("Serialization paths disagree")
+
+    per_thousand = 1000 / args.loads
+    baseline = None
+    print(f"{args.loads} loads, median of {args.repeat} runs (ms per 1000 loads)")
+    for name, render in paths.items():
+        elapsed = time_it(render, args.repeat) * 1000 * per_thousand
+        baseline = baseline or elapsed
+        print(f"  {name:<8} {elapsed:8.2f} ms  {baseline / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
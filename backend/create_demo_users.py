@@ -87,7 +87,7 @@ async def create_demo_data():
                 if not existing_user:
                     user = User(
                         email=user_data["email"],
-                        hashed_password=get_password_hash(user_data["password"]),
+                        hashed_password=await get_password_hash(user_data["password"]),
                         first_name=user_data["first_name"],
                         last_name=user_data["last_name"],
                         role=user_data["role"],
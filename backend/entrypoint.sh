@@ -3,12 +3,14 @@ set -e
 
 echo "🚀 Starting backend application..."
 
-# Run database migrations
-echo "📦 Running database migrations..."
-python3 migrate.py
-python3 remove_unique_constraint.py
-python3 run_carrier_rate_migration.py
+# Migrations normally run as a one-off job before deploys
+# (python3 -m app.migrate). Set RUN_MIGRATIONS_ON_STARTUP=true to run them
+# here instead, once before any worker starts; concurrent starts are safe.
+if [ "${RUN_MIGRATIONS_ON_STARTUP:-false}" = "true" ]; then
+    echo "📦 Running database migrations..."
+    python3 -m app.migrate
+fi
 
-# Start the application
-echo "✅ Migrations complete. Starting uvicorn..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 1
+# Start the application (worker count, keep-alive etc. come from SERVER_* settings)
+echo "✅ Starting server..."
+exec python3 -m app.server
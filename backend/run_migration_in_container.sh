@@ -5,11 +5,11 @@ TASK_ID=$(echo $TASK_ARN | rev | cut -d'/' -f1 | rev)
 
 echo "Running migration in task: $TASK_ID"
 
-# Run the migration script
+# Run pending Alembic migrations (no-op when already at head)
 aws ecs execute-command \
   --cluster trucking-tms-cluster \
   --task $TASK_ID \
   --container backend \
   --interactive \
-  --command "python3 /app/remove_unique_constraint.py" \
+  --command "python3 -m app.migrate" \
   --region us-east-1
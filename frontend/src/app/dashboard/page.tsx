@@ -14,93 +14,25 @@ export default function DashboardPage() {
   const { user } = useAuth()
   const router = useRouter()
 
-  // Fetch real data from API
-  const { data: loads, isLoading: loadsLoading } = useQuery({
-    queryKey: ['loads'],
+  // Totals are aggregated server-side so the page never downloads full tables
+  const { data: summary, isLoading } = useQuery({
+    queryKey: ['dashboard-summary'],
     queryFn: async () => {
-      const response = await api.get('/v1/loads?limit=10000')
+      const now = new Date()
+      const today = `${now.getFullYear()}-${String(now.getMonth() + 1).padStart(2, '0')}-${String(now.getDate()).padStart(2, '0')}`
+      const response = await api.get(`/v1/dashboard/summary?today=${today}`)
       return response.data
     }
   })
 
-  const { data: drivers, isLoading: driversLoading } = useQuery({
-    queryKey: ['drivers'],
-    queryFn: async () => {
-      const response = await api.get('/v1/drivers?limit=10000')
-      return response.data
-    }
-  })
-
-  const { data: trucks, isLoading: trucksLoading } = useQuery({
-    queryKey: ['trucks'],
-    queryFn: async () => {
-      const response = await api.get('/v1/trucks?limit=10000')
-      return response.data
-    }
-  })
-
-  const { data: customers, isLoading: customersLoading } = useQuery({
-    queryKey: ['customers'],
-    queryFn: async () => {
-      const response = await api.get('/v1/customers?limit=10000')
-      return response.data
-    }
-  })
-
-  const isLoading = loadsLoading || driversLoading || trucksLoading || customersLoading
-
-  // Calculate financial summaries
-  const financialSummary = React.useMemo(() => {
-    if (!loads) return { today: 0, month: 0, year: 0, todayLoads: 0, monthLoads: 0, yearLoads: 0 }
-
-    const now = new Date()
-    const todayStart = new Date(now.getFullYear(), now.getMonth(), now.getDate())
-    const todayEnd = new Date(todayStart)
-    todayEnd.setDate(todayEnd.getDate() + 1)
-
-    const monthStart = new Date(now.getFullYear(), now.getMonth(), 1)
-    const yearStart = new Date(now.getFullYear(), 0, 1)
-
-    let todayRevenue = 0
-    let monthRevenue = 0
-    let yearRevenue = 0
-    let todayLoads = 0
-    let monthLoads = 0
-    let yearLoads = 0
-
-    loads.forEach((load: any) => {
-      const rate = Number(load.rate) || 0
-      // Use pickup_date or created_at as the date for revenue calculation
-      const loadDate = load.pickup_date ? new Date(load.pickup_date) : (load.created_at ? new Date(load.created_at) : null)
-
-      if (loadDate) {
-        // Today: loads picked up today
-        if (loadDate >= todayStart && loadDate < todayEnd) {
-          todayRevenue += rate
-          todayLoads++
-        }
-        // This month: loads picked up this month
-        if (loadDate >= monthStart) {
-          monthRevenue += rate
-          monthLoads++
-        }
-        // This year: loads picked up this year
-        if (loadDate >= yearStart) {
-          yearRevenue += rate
-          yearLoads++
-        }
-      }
-    })
-
-    return {
-      today: todayRevenue,
-      month: monthRevenue,
-      year: yearRevenue,
-      todayLoads,
-      monthLoads,
-      yearLoads
-    }
-  }, [loads])
+  const financialSummary = {
+    today: Number(summary?.today?.revenue) || 0,
+    month: Number(summary?.month?.revenue) || 0,
+    year: Number(summary?.year?.revenue) || 0,
+    todayLoads: summary?.today?.loads || 0,
+    monthLoads: summary?.month?.loads || 0,
+    yearLoads: summary?.year?.loads || 0
+  }
 
   return (
     <Layout>
@@ -123,7 +55,7 @@ export default function DashboardPage() {
             </CardHeader>
             <CardContent>
               <div className="text-2xl font-bold">
-                {isLoading ? '...' : loads?.length || 0}
+                {isLoading ? '...' : summary?.total_loads || 0}
               </div>
               <p className="text-xs text-muted-foreground">
                 Active shipments
@@ -137,7 +69,7 @@ export default function DashboardPage() {
             </CardHeader>
             <CardContent>
               <div className="text-2xl font-bold">
-                {isLoading ? '...' : drivers?.length || 0}
+                {isLoading ? '...' : summary?.total_drivers || 0}
               </div>
               <p className="text-xs text-muted-foreground">
                 Company & owner operators
@@ -151,7 +83,7 @@ export default function DashboardPage() {
             </CardHeader>
             <CardContent>
               <div className="text-2xl font-bold">
-                {isLoading ? '...' : trucks?.length || 0}
+                {isLoading ? '...' : summary?.total_trucks || 0}
               </div>
               <p className="text-xs text-muted-foreground">
                 Fleet vehicles
@@ -165,7 +97,7 @@ export default function DashboardPage() {
             </CardHeader>
             <CardContent>
               <div className="text-2xl font-bold">
-                {isLoading ? '...' : customers?.length || 0}
+                {isLoading ? '...' : summary?.total_customers || 0}
               </div>
               <p className="text-xs text-muted-foreground">
                 Business partners
@@ -207,7 +139,7 @@ export default function DashboardPage() {
         </Card>
 
         {/* Getting Started Section */}
-        {!isLoading && loads?.length === 0 && drivers?.length === 0 && (
+        {!isLoading && summary?.total_loads === 0 && summary?.total_drivers === 0 && (
           <Card className="bg-blue-50 border-blue-200">
             <CardHeader>
               <CardTitle>🚀 Getting Started</CardTitle>
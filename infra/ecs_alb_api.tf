@@ -252,6 +252,43 @@ resource "aws_lb_listener" "https" {
   tags = local.common_tags
 }
 
+# Environment and secrets shared by the API and migration tasks
+locals {
+  api_environment = [
+    {
+      name  = "ENV"
+      value = var.env
+    },
+    {
+      name  = "PORT"
+      value = tostring(var.api_container_port)
+    },
+    {
+      name  = "AWS_REGION"
+      value = var.aws_region
+    },
+    {
+      name  = "S3_BUCKET"
+      value = aws_s3_bucket.documents.id
+    },
+    {
+      name  = "SERVER_WORKERS"
+      value = tostring(var.api_server_workers)
+    }
+  ]
+
+  api_secrets = [
+    {
+      name      = "DATABASE_SECRET_JSON"
+      valueFrom = aws_secretsmanager_secret.rds_credentials.arn
+    },
+    {
+      name      = "REDIS_SECRET_JSON"
+      valueFrom = aws_secretsmanager_secret.redis_url.arn
+    }
+  ]
+}
+
 # ECS Task Definition
 resource "aws_ecs_task_definition" "api" {
   family                   = local.ecs_task_family
@@ -275,35 +312,8 @@ resource "aws_ecs_task_definition" "api" {
         }
       ]
 
-      environment = [
-        {
-          name  = "ENV"
-          value = var.env
-        },
-        {
-          name  = "PORT"
-          value = tostring(var.api_container_port)
-        },
-        {
-          name  = "AWS_REGION"
-          value = var.aws_region
-        },
-        {
-          name  = "S3_BUCKET"
-          value = aws_s3_bucket.documents.id
-        }
-      ]
-
-      secrets = [
-        {
-          name      = "DATABASE_SECRET_JSON"
-          valueFrom = aws_secretsmanager_secret.rds_credentials.arn
-        },
-        {
-          name      = "REDIS_SECRET_JSON"
-          valueFrom = aws_secretsmanager_secret.redis_url.arn
-        }
-      ]
+      environment = local.api_environment
+      secrets     = local.api_secrets
 
       logConfiguration = {
         logDriver = "awslogs"
@@ -332,6 +342,46 @@ resource "aws_ecs_task_definition" "api" {
   )
 }
 
+# One-off migration task, run by the deploy workflow before the service
+# rolls (python -m app.migrate; API containers no longer migrate on start)
+resource "aws_ecs_task_definition" "migrate" {
+  family                   = local.ecs_migrate_task_family
+  network_mode             = "awsvpc"
+  requires_compatibilities = ["FARGATE"]
+  cpu                      = var.ecs_task_cpu
+  memory                   = var.ecs_task_memory
+  execution_role_arn       = aws_iam_role.ecs_task_execution.arn
+  task_role_arn            = aws_iam_role.ecs_task.arn
+
+  container_definitions = jsonencode([
+    {
+      name      = "migrate"
+      image     = "${aws_ecr_repository.api.repository_url}:latest"
+      essential = true
+      command   = ["python3", "-m", "app.migrate"]
+
+      environment = local.api_environment
+      secrets     = local.api_secrets
+
+      logConfiguration = {
+        logDriver = "awslogs"
+        options = {
+          "awslogs-group"         = aws_cloudwatch_log_group.api.name
+          "awslogs-region"        = var.aws_region
+          "awslogs-stream-prefix" = "migrate"
+        }
+      }
+    }
+  ])
+
+  tags = merge(
+    local.common_tags,
+    {
+      Name = local.ecs_migrate_task_family
+    }
+  )
+}
+
 # ECS Service
 resource "aws_ecs_service" "api" {
   name            = local.ecs_service_name
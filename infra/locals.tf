@@ -15,6 +15,7 @@ locals {
   ecs_cluster_name     = "${local.name_prefix}-cluster"
   ecs_service_name     = "${local.name_prefix}-api-service"
   ecs_task_family      = "${local.name_prefix}-api"
+  ecs_migrate_task_family = "${local.name_prefix}-migrate"
   alb_name             = "${local.name_prefix}-alb"
   alb_target_group_name = "${local.name_prefix}-api-tg"
   rds_identifier       = "${local.name_prefix}-db"
@@ -93,6 +93,16 @@ output "ecs_task_definition_arn" {
   value       = aws_ecs_task_definition.api.arn
 }
 
+output "ecs_migrate_task_definition_arn" {
+  description = "ECS task definition ARN of the one-off migration task"
+  value       = aws_ecs_task_definition.migrate.arn
+}
+
+output "ecs_tasks_security_group_id" {
+  description = "Security group for ECS tasks, including the migration task"
+  value       = aws_security_group.ecs_tasks.id
+}
+
 output "ecs_task_execution_role_arn" {
   description = "ECS task execution role ARN"
   value       = aws_iam_role.ecs_task_execution.arn
@@ -58,6 +58,12 @@ variable "ecs_task_memory" {
   default     = 512
 }
 
+variable "api_server_workers" {
+  description = "Uvicorn workers per API task; more than 1 needs the Redis job queue and a job worker"
+  type        = number
+  default     = 1
+}
+
 variable "ecs_desired_count" {
   description = "Desired number of ECS tasks"
   type        = number